@@ -1,15 +1,13 @@
 import logging
 import secrets
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from google.oauth2 import id_token
-from google.auth.transport import requests
-
 from ..db.session import get_session
 from ..schemas.auth import ManagerCreate, ManagerLogin, Token, GoogleAuthRequest
 from ..services.auth import AuthService
+from ..services.rate_limit import check_auth_rate_limit
 from ..repositories.managers import ManagerRepository
 from ..core.config import settings
 
@@ -17,8 +15,22 @@ router = APIRouter(prefix="/auth", tags=["auth"])
 logger = logging.getLogger(__name__)
 
 
+def _verify_google_token(token: str) -> dict:
+    # google-auth pulls in requests and crypto backends; load it on the first Google sign-in
+    from google.oauth2 import id_token
+    from google.auth.transport import requests
+
+    return id_token.verify_oauth2_token(
+        token,
+        requests.Request(),
+        settings.google_client_id,
+        clock_skew_in_seconds=60,
+    )
+
+
 @router.post("/signup", response_model=Token)
-async def signup(payload: ManagerCreate, session: AsyncSession = Depends(get_session)):
+async def signup(payload: ManagerCreate, request: Request, session: AsyncSession = Depends(get_session)):
+    await check_auth_rate_limit(request, "signup", payload.email)
     existing = await ManagerRepository.get_by_email(session, payload.email)
     if existing:
         raise HTTPException(status_code=400, detail="Email already registered")
@@ -30,23 +42,21 @@ async def signup(payload: ManagerCreate, session: AsyncSession = Depends(get_ses
 
 
 @router.post("/login", response_model=Token)
-async def login(payload: ManagerLogin, session: AsyncSession = Depends(get_session)):
+async def login(payload: ManagerLogin, request: Request, session: AsyncSession = Depends(get_session)):
+    await check_auth_rate_limit(request, "login", payload.email)
     manager = await AuthService.authenticate_manager(session, payload.email, payload.password)
     token = AuthService.create_access_token({"sub": str(manager.id), "email": manager.email, "picture": None})
     return {"access_token": token, "token_type": "bearer"}
 
 
 @router.post("/google", response_model=Token)
-async def google_auth(payload: GoogleAuthRequest, session: AsyncSession = Depends(get_session)):
+async def google_auth(payload: GoogleAuthRequest, request: Request, session: AsyncSession = Depends(get_session)):
+    # the email is only known after verifying the token, so only the IP is limited here
+    await check_auth_rate_limit(request, "google")
     if not settings.google_client_id:
         raise HTTPException(status_code=500, detail="Google login not configured")
     try:
-        id_info = id_token.verify_oauth2_token(
-            payload.id_token,
-            requests.Request(),
-            settings.google_client_id,
-            clock_skew_in_seconds=60,
-        )
+        id_info = _verify_google_token(payload.id_token)
     except ValueError as exc:
         logger.warning("Google token validation failed: %s", exc)
         raise HTTPException(status_code=401, detail="Invalid Google token") from exc
@@ -0,0 +1,20 @@
+from fastapi import APIRouter, Query, Request
+
+from ..db.session import read_sessionmaker
+from ..schemas.bootstrap import BootstrapRead
+from ..services.bootstrap import BootstrapService
+
+router = APIRouter(tags=["bootstrap"])
+
+
+@router.get("/bootstrap", response_model=BootstrapRead)
+async def bootstrap(
+    request: Request,
+    days_back: int = Query(7, ge=0, le=90),
+    days_ahead: int = Query(14, ge=0, le=90),
+    latest: int = Query(20, ge=1, le=100),
+):
+    """Dashboard first paint in one request: games, draws around today, pending and latest approved results."""
+    return await BootstrapService.load(
+        read_sessionmaker(request), days_back=days_back, days_ahead=days_ahead, latest=latest
+    )
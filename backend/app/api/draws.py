@@ -1,17 +1,66 @@
-from fastapi import APIRouter, Depends
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, Query, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from ..db.session import get_session
+from ..core.fieldsets import parse_fieldset
+from ..db.session import get_session, get_read_session, mark_recent_write
 from ..schemas.draw import DrawCreate, DrawRead
-from ..services.draws import DrawService
+from ..services.draws import DRAW_FIELDS, DRAW_INCLUDES, DrawService
 
 router = APIRouter(prefix="/draws", tags=["draws"])
 
 
 @router.get("/", response_model=list[DrawRead])
-async def list_draws(session: AsyncSession = Depends(get_session)):
-    return await DrawService.list_draws(session)
+async def list_draws(
+    response: Response,
+    game_id: int | None = None,
+    date_from: datetime | None = Query(None, alias="from"),
+    date_to: datetime | None = Query(None, alias="to"),
+    notified: bool | None = None,
+    cursor: str | None = None,
+    limit: int | None = Query(None, ge=1, le=500),
+    fields: str | None = Query(None, description="Comma-separated subset of: " + ", ".join(DRAW_FIELDS)),
+    include: str | None = Query(None, description="Comma-separated relations to embed: " + ", ".join(DRAW_INCLUDES)),
+    session: AsyncSession = Depends(get_read_session),
+):
+    """Draws ordered by draw time. With `limit`, the next page's cursor is in `X-Next-Cursor`.
+
+    `fields` and `include` select a sparse shape; without them the full `DrawRead` list is returned.
+    """
+    field_names = parse_fieldset(fields, DRAW_FIELDS, "fields")
+    includes = parse_fieldset(include, DRAW_INCLUDES, "include")
+    draws, next_cursor = await DrawService.list_draws(
+        session,
+        game_id=game_id,
+        date_from=date_from,
+        date_to=date_to,
+        notified=notified,
+        cursor=cursor,
+        limit=limit,
+        with_game=bool(includes),
+    )
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else {}
+    if field_names is not None or includes is not None:
+        # bypasses response_model, which would re-add the omitted fields
+        return JSONResponse(jsonable_encoder(DrawService.sparse(draws, field_names, includes)), headers=headers)
+    response.headers.update(headers)
+    return draws
+
+
+@router.get("/upcoming", response_model=list[DrawRead])
+async def upcoming_draws(limit: int = Query(10, ge=1, le=500)):
+    """Next draws across all games, served from the in-memory schedule."""
+    return DrawService.upcoming_draws(limit)
 
 
 @router.post("/", response_model=DrawRead, status_code=201)
-async def create_draw(payload: DrawCreate, session: AsyncSession = Depends(get_session)):
-    return await DrawService.create_draw(session, payload)
+async def create_draw(
+    payload: DrawCreate,
+    response: Response,
+    session: AsyncSession = Depends(get_session),
+):
+    draw = await DrawService.create_draw(session, payload)
+    mark_recent_write(response)
+    return draw
@@ -1,17 +1,31 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from ..db.session import get_session
+from ..db.session import get_session, get_read_session, mark_recent_write
+from ..schemas.draw import DrawRead
 from ..schemas.game import GameCreate, GameRead
+from ..services.draws import DrawService
 from ..services.games import GameService
 
 router = APIRouter(prefix="/games", tags=["games"])
 
 
 @router.get("/", response_model=list[GameRead])
-async def list_games(session: AsyncSession = Depends(get_session)):
+async def list_games(session: AsyncSession = Depends(get_read_session)):
     return await GameService.list_games(session)
 
 
 @router.post("/", response_model=GameRead, status_code=201)
-async def create_game(payload: GameCreate, session: AsyncSession = Depends(get_session)):
-    return await GameService.create_game(session, payload)
+async def create_game(
+    payload: GameCreate,
+    response: Response,
+    session: AsyncSession = Depends(get_session),
+):
+    game = await GameService.create_game(session, payload)
+    mark_recent_write(response)
+    return game
+
+
+@router.get("/{game_id}/next-draw", response_model=DrawRead)
+async def next_draw(game_id: int):
+    """Served from the in-memory schedule; no database access."""
+    return DrawService.next_draw_for_game(game_id)
@@ -1,32 +1,87 @@
-from fastapi import APIRouter, Depends
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from ..db.session import get_session
-from ..schemas.result import ResultCreate, ResultVerify, ResultRead
-from ..services.results import ResultService
+from ..core.fieldsets import parse_fieldset
+from ..db.session import ReadSessionLocal, get_session, get_read_session, mark_recent_write, read_sessionmaker
+from ..schemas.result import (
+    ResultBulkVerifyItem,
+    ResultBulkVerifyOutcome,
+    ResultCreate,
+    ResultRead,
+    ResultVerify,
+)
+from ..schemas.social import SocialPostRead
+from ..services.results import RESULT_FIELDS, RESULT_INCLUDES, ResultService
+from ..services.social_posts import SocialPostService
 from ..services.auth import get_current_manager, get_current_manager_optional
 
 router = APIRouter(prefix="/results", tags=["results"])
 
 
 @router.get("/", response_model=list[ResultRead])
-async def list_results(session: AsyncSession = Depends(get_session)):
-    return await ResultService.list_results(session)
+async def list_results(
+    request: Request,
+    since: datetime | None = None,
+    fields: str | None = Query(None, description="Comma-separated subset of: " + ", ".join(RESULT_FIELDS)),
+    include: str | None = Query(None, description="Comma-separated relations to embed: " + ", ".join(RESULT_INCLUDES)),
+):
+    """Results, newest first. `fields`/`include` select a sparse shape; without them the full `ResultRead` list.
+
+    Served through a short per-worker micro-cache shared by identical concurrent requests.
+    """
+    factory = read_sessionmaker(request)
+    body = await ResultService.list_results_json(
+        factory,
+        fields=parse_fieldset(fields, RESULT_FIELDS, "fields"),
+        include=parse_fieldset(include, RESULT_INCLUDES, "include"),
+        since=since,
+        # a caller pinned to the primary after its own write skips the shared cache
+        cached=factory is ReadSessionLocal,
+    )
+    # already serialised (sparse bodies must not pass through response_model)
+    return Response(content=body, media_type="application/json")
 
 
 @router.post("/", response_model=ResultRead, status_code=201)
 async def create_result(
     payload: ResultCreate,
+    response: Response,
     session: AsyncSession = Depends(get_session),
     current_manager=Depends(get_current_manager_optional),
 ):
-    return await ResultService.create_result(session, payload, current_manager)
+    result = await ResultService.create_result(session, payload, current_manager)
+    mark_recent_write(response)
+    return result
 
 
 @router.patch("/{result_id}/verify", response_model=ResultRead)
 async def verify_result(
     result_id: int,
     payload: ResultVerify,
+    response: Response,
+    session: AsyncSession = Depends(get_session),
+    current_manager=Depends(get_current_manager),
+):
+    result = await ResultService.verify_result(session, result_id, payload, current_manager)
+    mark_recent_write(response)
+    return result
+
+
+@router.post("/verify-bulk", response_model=list[ResultBulkVerifyOutcome])
+async def verify_results_bulk(
+    payload: list[ResultBulkVerifyItem],
+    response: Response,
     session: AsyncSession = Depends(get_session),
     current_manager=Depends(get_current_manager),
 ):
-    return await ResultService.verify_result(session, result_id, payload, current_manager)
+    """Approve or reject many results in one transaction; failures are reported per item."""
+    outcomes = await ResultService.verify_results_bulk(session, payload, current_manager)
+    mark_recent_write(response)
+    return outcomes
+
+
+@router.get("/{result_id}/posts", response_model=list[SocialPostRead])
+async def list_result_posts(result_id: int, session: AsyncSession = Depends(get_read_session)):
+    """Social posting history of a result, without contacting any platform."""
+    return await SocialPostService.list_posts(session, result_id)
@@ -0,0 +1,38 @@
+from datetime import date
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import FileResponse
+
+from ..core.config import settings
+from ..services.snapshots import snapshot_publisher
+
+router = APIRouter(prefix="/snapshots", tags=["snapshots"])
+
+# past months only change if an old result is re-verified
+ARCHIVE_MAX_AGE_SECONDS = 24 * 60 * 60
+
+
+@router.get("/{name:path}")
+async def get_snapshot(name: str, request: Request):
+    """Serves a precompressed snapshot file; no database access."""
+    if not snapshot_publisher.enabled or not name.endswith(".json"):
+        raise HTTPException(status_code=404, detail="Snapshot not found")
+    root = snapshot_publisher.directory.resolve()
+    path = (root / name).resolve()
+    if not path.is_relative_to(root) or not path.is_file():
+        raise HTTPException(status_code=404, detail="Snapshot not found")
+
+    max_age = settings.snapshot_max_age_seconds
+    if name.startswith("months/") and name[len("months/") : -len(".json")] < f"{date.today():%Y-%m}":
+        max_age = ARCHIVE_MAX_AGE_SECONDS
+    headers = {
+        "Cache-Control": f"public, max-age={max_age}, stale-while-revalidate={max_age}",
+        "Vary": "Accept-Encoding",
+    }
+    accepted = request.headers.get("accept-encoding", "")
+    for encoding, suffix in (("br", ".br"), ("gzip", ".gz")):
+        variant = path.with_name(path.name + suffix)
+        if encoding in accepted and variant.is_file():
+            headers["Content-Encoding"] = encoding
+            return FileResponse(variant, media_type="application/json", headers=headers)
+    return FileResponse(path, media_type="application/json", headers=headers)
@@ -9,6 +9,44 @@ class Settings(BaseSettings):
     app_debug: bool = True
 
     database_url: str
+    # Optional read replica for GET routes; empty means reads use the primary
+    database_read_url: str = ""
+    # How long a writer's own reads stay on the primary to hide replica lag (pin carried in X-Primary-Until)
+    read_your_writes_seconds: float = 5.0
+    # Connection pool (per engine, per worker process)
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 1800
+    # Ping on every checkout; turn off and rely on db_pool_recycle to save a round trip
+    db_pool_pre_ping: bool = True
+    # Disable asyncpg statement caching for PgBouncer transaction pooling
+    db_pgbouncer_mode: bool = False
+    # Requests running more SQL statements than this are logged as likely N+1 (0 disables)
+    query_budget_per_request: int = 10
+    # /ready thresholds: exceeding any marks the worker not ready (503) so traffic drains away
+    ready_db_timeout_seconds: float = 2.0
+    ready_max_db_latency_ms: float = 500.0
+    ready_max_pool_utilization: float = 0.95
+    ready_max_loop_lag_ms: float = 250.0
+    # reported in /health/details only (leader); the notifier ticks every 60 s
+    ready_max_notifier_tick_age_seconds: float = 180.0
+    ready_max_notifier_backlog: int = 100
+    # Tracing: "" (off), "console" (span trees on stderr) or "file" (JSON lines in tracing_file)
+    tracing_exporter: str = ""
+    tracing_file: str = "traces.jsonl"
+    tracing_sample_ratio: float = 1.0
+    # Load shedding: concurrent requests per route class and worker (0 = unlimited);
+    # reads shrink their limit while slower than the target latency.
+    # Unset read/write limits are sized to fit db_pool_size + db_max_overflow.
+    load_shed_read_concurrency: int | None = None
+    load_shed_write_concurrency: int | None = None
+    load_shed_social_concurrency: int = 4
+    load_shed_auth_concurrency: int = 8
+    load_shed_read_target_seconds: float = 0.5
+    # Longest a request queues for a slot before 503 + Retry-After
+    load_shed_read_queue_seconds: float = 0.5
+    load_shed_queue_seconds: float = 5.0
     cors_origins: str = (
         "http://localhost:5173,http://localhost:8080,http://localhost:4173,"
         "https://randproject.vercel.app,https://*.vercel.app"
@@ -33,6 +71,63 @@ class Settings(BaseSettings):
     help_portal_url: str = ""
     google_client_id: str = ""
 
+    # Draws due within this many seconds of the first due draw share one reminder email
+    notifier_digest_window_seconds: int = 300
+    # Without an Idempotency-Key, identical social posts within this window collapse into one
+    social_auto_idempotency_window_seconds: int = 600
+
+    # Auth endpoints: attempts per client IP and per email within the window (0 disables)
+    auth_rate_limit_per_ip: int = 20
+    auth_rate_limit_per_email: int = 5
+    auth_rate_limit_window_seconds: float = 60.0
+    # "memory" (per worker) or "postgres" (shared across workers and replicas)
+    auth_rate_limit_store: str = "memory"
+
+    # Randomness audit of approved numbers (leader job; needs NumPy, 0 hours disables)
+    audit_interval_hours: float = 24.0
+    audit_simulations: int = 500
+    audit_alpha: float = 0.01
+    audit_number_max: int = 90
+
+    # Singleton background jobs (draw notifier) run only in the elected leader
+    leader_lock_key: int = 72_616_401
+    # Direct Postgres DSN for the leader lock connection (empty: database_url); required with db_pgbouncer_mode
+    leader_database_url: str = ""
+    leader_renew_interval_seconds: float = 15.0
+    leader_retry_interval_seconds: float = 30.0
+
+    # Monthly partitions of draws/results/approvals (Postgres, after `python -m app.db.partitioning convert`)
+    partition_months_ahead: int = 3
+    # Detach partitions older than this many months into the archive schema (0 disables)
+    partition_archive_after_months: int = 0
+
+    # Production serving (python -m app.serve); 0 workers means one per available CPU
+    host: str = "0.0.0.0"
+    port: int = 8000
+    web_concurrency: int = 0
+    # Peers whose X-Forwarded-For/-Proto are trusted (comma-separated IPs or CIDRs of the reverse proxy).
+    # Never "*": any client could then pick its own address for logs and per-IP rate limits.
+    forwarded_allow_ips: str = "127.0.0.1"
+    # Time allowed on SIGTERM for in-flight requests and background work to finish
+    shutdown_grace_seconds: float = 20.0
+
+    # Directory for static JSON snapshots of approved results (empty disables publishing and serving);
+    # with several instances it must be a volume they all share
+    snapshot_dir: str = ""
+    # Cache-Control max-age for snapshots that still change (latest, per-game, current month)
+    snapshot_max_age_seconds: int = 60
+
+    # Skip create_all at startup (tables managed by migrations) so /health answers sooner
+    startup_skip_ddl: bool = False
+
+    # Each worker reloads its in-memory upcoming-draw index this often
+    draw_schedule_refresh_seconds: float = 300.0
+
+    # GET /api/results micro-cache: fresh for ttl, then served stale while one refresh runs;
+    # other workers may serve a body up to ttl + stale old after a write elsewhere
+    results_cache_ttl_seconds: float = 2.0
+    results_cache_stale_seconds: float = 30.0
+
     def get_cors_origins(self) -> list[str]:
         """Returns parsed CORS origins as a list"""
         origins = self.cors_origins.strip()
@@ -0,0 +1,17 @@
+"""Parsing of sparse fieldset query parameters (``?fields=a,b&include=x``)."""
+
+from fastapi import HTTPException
+
+
+def parse_fieldset(value: str | None, allowed, parameter: str) -> list[str] | None:
+    """Requested names in `allowed` order, or None when the parameter was not given."""
+    if value is None:
+        return None
+    requested = {item.strip() for item in value.split(",") if item.strip()}
+    unknown = requested - set(allowed)
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown {parameter}: {', '.join(sorted(unknown))}; allowed: {', '.join(allowed)}",
+        )
+    return [name for name in allowed if name in requested]
@@ -0,0 +1,47 @@
+"""Shared outbound HTTP client.
+
+Created on first use (so httpx stays off the cold-start path) and closed by
+the application lifespan; reusing it keeps TLS connections to the Graph and
+Telegram APIs warm between posts.
+"""
+
+import re
+
+from .tracing import tracer
+
+_client = None
+# Telegram puts the bot token in the path
+_SECRET_PATH = re.compile(r"/bot[^/]+")
+
+
+def _traced_transport(httpx):
+    class TracedTransport(httpx.AsyncHTTPTransport):
+        async def handle_async_request(self, request):
+            url = _SECRET_PATH.sub("/bot***", str(request.url.copy_with(query=None)))
+            with tracer.span(
+                f"HTTP {request.method} {request.url.host}",
+                kind="client",
+                attributes={"http.method": request.method, "http.url": url},
+            ) as span:
+                request.headers["traceparent"] = span.traceparent
+                response = await super().handle_async_request(request)
+                span.set_attribute("http.status_code", response.status_code)
+                return response
+
+    return TracedTransport()
+
+
+def get_http_client():
+    global _client
+    if _client is None:
+        import httpx
+
+        _client = httpx.AsyncClient(transport=_traced_transport(httpx) if tracer.enabled else None)
+    return _client
+
+
+async def close_http_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
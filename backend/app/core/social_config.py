@@ -4,6 +4,10 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 class SocialMediaSettings(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env", case_sensitive=False, extra="ignore")
 
+    # API endpoints; point at local fakes (python -m benchmarks.fake_services) to test offline
+    graph_api_base_url: str = "https://graph.facebook.com/v18.0"
+    telegram_api_base_url: str = "https://api.telegram.org"
+
     # Facebook
     facebook_page_id: str = ""
     facebook_access_token: str = ""
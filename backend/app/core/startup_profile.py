@@ -0,0 +1,103 @@
+"""Cold-start profiling.
+
+``app.main`` imports this module first, so ``IMPORT_STARTED`` is close to
+the moment the app package starts loading. Startup phases are timed with
+``phase()`` and the summary is logged once startup completes and served at
+``GET /health/startup``.
+
+For a per-module import breakdown run::
+
+    python -m app.core.startup_profile --top 25
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+IMPORT_STARTED = time.perf_counter()
+phases: dict[str, float] = {}
+
+
+def mark(name: str, started: float = IMPORT_STARTED) -> None:
+    phases[name] = time.perf_counter() - started
+
+
+@contextmanager
+def phase(name: str):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        mark(name, started)
+
+
+def report() -> dict:
+    return {
+        "phases_ms": {name: round(seconds * 1000, 1) for name, seconds in phases.items()},
+        "since_import_ms": round((time.perf_counter() - IMPORT_STARTED) * 1000, 1),
+    }
+
+
+def log_report() -> None:
+    logger.info(
+        "Startup profile: %s",
+        ", ".join(f"{name} {seconds * 1000:.0f} ms" for name, seconds in phases.items()),
+    )
+
+
+def import_times(module: str = "app.main") -> list[tuple[str, int, int]]:
+    """(module, self µs, cumulative µs) from ``python -X importtime`` in a fresh interpreter."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=os.environ.copy(),
+        check=True,
+    )
+    rows = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+async def _profile_startup() -> dict:
+    # run as __main__, this file is a separate module object from the one app.main records into
+    from . import startup_profile
+    from ..main import app
+
+    async with app.router.lifespan_context(app):
+        return startup_profile.report()
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Report import and startup timings of the API")
+    parser.add_argument("--top", type=int, default=20, help="number of slowest imports to show")
+    parser.add_argument("--skip-startup", action="store_true", help="only profile imports (no database needed)")
+    args = parser.parse_args(argv)
+
+    rows = import_times()
+    total = next((cumulative for name, _, cumulative in rows if name == "app.main"), 0)
+    print(f"import app.main: {total / 1000:.1f} ms")
+    print(f"{'module':<56}{'self ms':>10}{'cumul ms':>10}")
+    for name, self_us, cumulative_us in sorted(rows, key=lambda row: row[2], reverse=True)[: args.top]:
+        print(f"{name:<56}{self_us / 1000:>10.1f}{cumulative_us / 1000:>10.1f}")
+
+    if not args.skip_startup:
+        profile = asyncio.run(_profile_startup())
+        print()
+        for name, milliseconds in profile["phases_ms"].items():
+            print(f"{name:<56}{milliseconds:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,332 @@
+"""Minimal in-process tracing with OpenTelemetry-style spans.
+
+A span covers each request, each public ``*Service``/``*Repository`` method,
+SQL statement, outbound HTTP call and SMTP send. Spans nest through a context
+variable, so tasks created while a span is open (cache refreshes, gathered
+queries) become its children. Incoming and outgoing ``traceparent`` headers
+follow the W3C Trace Context format, so traces can be joined with a collector
+later.
+
+Enable with ``TRACING_EXPORTER``:
+
+- ``console`` prints each trace as an indented tree once its root span ends.
+- ``file`` appends one JSON object per span to ``TRACING_FILE``. Render the
+  file with ``python -m app.core.tracing traces.jsonl --slowest 10``.
+
+With tracing disabled nothing is wrapped or registered, so it costs nothing.
+"""
+
+import argparse
+import functools
+import inspect
+import json
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+# spans ending after their trace was printed (e.g. background work) are printed on their own
+MAX_OPEN_TRACES = 1000
+
+
+@dataclass
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    kind: str = "internal"
+    sampled: bool = True
+    # the parent came from a traceparent header, so this span is the local root
+    remote_parent: bool = False
+    attributes: dict = field(default_factory=dict)
+    status: str = "ok"
+    start_ns: int = field(default_factory=time.time_ns)
+    end_ns: int | None = None
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+
+    @property
+    def duration_ms(self) -> float:
+        return ((self.end_ns or time.time_ns()) - self.start_ns) / 1e6
+
+    def set_attribute(self, key: str, value) -> None:
+        self.attributes[key] = value
+
+    def record_exception(self, exc: BaseException) -> None:
+        self.status = "error"
+        self.attributes["exception.type"] = type(exc).__name__
+        self.attributes["exception.message"] = str(exc)[:500]
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "kind": self.kind,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_ms": round(self.duration_ms, 3),
+            "status": self.status,
+            "attributes": self.attributes,
+        }
+
+
+class _NoopSpan:
+    traceparent = None
+
+    def set_attribute(self, key, value) -> None:
+        pass
+
+    def record_exception(self, exc) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+def parse_traceparent(header: str | None) -> tuple[str, str, bool] | None:
+    """(trace_id, parent span_id, sampled) from a W3C traceparent header."""
+    if not header:
+        return None
+    parts = header.strip().split("-")
+    if len(parts) < 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    try:
+        int(parts[1], 16), int(parts[2], 16), int(parts[3], 16)
+    except ValueError:
+        return None
+    if parts[1] == "0" * 32 or parts[2] == "0" * 16:
+        return None
+    return parts[1], parts[2], bool(int(parts[3], 16) & 1)
+
+
+class FileExporter:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._handle = None
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), default=str) + "\n"
+        # SMTP spans end in worker threads
+        with self._lock:
+            if self._handle is None:
+                self._handle = open(self.path, "a", buffering=1)
+            self._handle.write(line)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+
+
+class ConsoleExporter:
+    def __init__(self, stream=None) -> None:
+        self.stream = stream or sys.stderr
+        self._lock = threading.Lock()
+        self._traces: dict[str, list[Span]] = {}
+        self._printed: dict[str, None] = {}
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            if span.parent_id is not None and not span.remote_parent and span.trace_id not in self._printed:
+                spans = self._traces.setdefault(span.trace_id, [])
+                spans.append(span)
+                if len(self._traces) > MAX_OPEN_TRACES:
+                    self._traces.pop(next(iter(self._traces)))
+                return
+            spans = self._traces.pop(span.trace_id, [])
+            spans.append(span)
+            self._printed[span.trace_id] = None
+            if len(self._printed) > MAX_OPEN_TRACES:
+                self._printed.pop(next(iter(self._printed)))
+        self.stream.write(render_tree([item.to_dict() for item in spans]))
+        self.stream.flush()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            leftovers = [span.to_dict() for spans in self._traces.values() for span in spans]
+            self._traces.clear()
+        if leftovers:
+            self.stream.write(render_tree(leftovers))
+
+
+class Tracer:
+    def __init__(self, exporter=None, sample_ratio: float = 1.0) -> None:
+        self.exporter = exporter
+        self.sample_ratio = sample_ratio
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None
+
+    def span(self, name: str, *, kind: str = "internal", attributes: dict | None = None, traceparent: str | None = None):
+        """Context manager yielding the new span (a no-op span while tracing is off)."""
+        if not self.enabled:
+            return nullcontext(NOOP_SPAN)
+        return self._span(name, kind, attributes, traceparent)
+
+    @contextmanager
+    def _span(self, name, kind, attributes, traceparent):
+        parent = current_span.get()
+        remote = parse_traceparent(traceparent) if parent is None else None
+        if parent is not None:
+            trace_id, parent_id, sampled = parent.trace_id, parent.span_id, parent.sampled
+        elif remote is not None:
+            trace_id, parent_id, sampled = remote
+        else:
+            trace_id, parent_id = os.urandom(16).hex(), None
+            sampled = random.random() < self.sample_ratio
+        span = Span(
+            name=name,
+            trace_id=trace_id,
+            span_id=os.urandom(8).hex(),
+            parent_id=parent_id,
+            kind=kind,
+            sampled=sampled,
+            remote_parent=remote is not None,
+            attributes=dict(attributes or {}),
+        )
+        token = current_span.set(span)
+        try:
+            yield span
+        except BaseException as exc:
+            span.record_exception(exc)
+            raise
+        finally:
+            current_span.reset(token)
+            self.end(span)
+
+    def start_span(self, name: str, *, kind: str = "internal", attributes: dict | None = None) -> Span | None:
+        """A child of the current span that the caller ends with `end()`; for event hooks."""
+        parent = current_span.get()
+        if not self.enabled or parent is None:
+            return None
+        return Span(
+            name=name,
+            trace_id=parent.trace_id,
+            span_id=os.urandom(8).hex(),
+            parent_id=parent.span_id,
+            kind=kind,
+            sampled=parent.sampled,
+            attributes=dict(attributes or {}),
+        )
+
+    def end(self, span: Span) -> None:
+        span.end_ns = time.time_ns()
+        if span.sampled:
+            try:
+                self.exporter.export(span)
+            except Exception as exc:
+                logger.warning("Exporting span %s failed: %s", span.name, exc)
+
+    def shutdown(self) -> None:
+        if self.exporter is not None:
+            self.exporter.shutdown()
+
+
+def _build_tracer() -> Tracer:
+    if settings.tracing_exporter == "console":
+        return Tracer(ConsoleExporter(), settings.tracing_sample_ratio)
+    if settings.tracing_exporter == "file":
+        return Tracer(FileExporter(settings.tracing_file), settings.tracing_sample_ratio)
+    return Tracer()
+
+
+tracer = _build_tracer()
+
+
+def _wrap(name: str, func):
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            with tracer.span(name):
+                return await func(*args, **kwargs)
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with tracer.span(name):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def traced(cls):
+    """Class decorator: a span per call of each public static method (a no-op while tracing is off)."""
+    if not tracer.enabled:
+        return cls
+    for name, attribute in list(vars(cls).items()):
+        if name.startswith("_") or not isinstance(attribute, staticmethod):
+            continue
+        setattr(cls, name, staticmethod(_wrap(f"{cls.__name__}.{name}", attribute.__func__)))
+    return cls
+
+
+def render_tree(spans: list[dict]) -> str:
+    """Spans of one or more traces as indented trees with durations."""
+    by_parent: dict[str | None, list[dict]] = {}
+    ids = {span["span_id"] for span in spans}
+    for span in spans:
+        parent = span["parent_id"] if span["parent_id"] in ids else None
+        by_parent.setdefault(parent, []).append(span)
+    lines = []
+
+    def walk(span: dict, depth: int) -> None:
+        flag = " !" if span["status"] == "error" else ""
+        detail = span["attributes"].get("db.statement") or span["attributes"].get("http.url") or ""
+        detail = f"  {' '.join(detail.split())[:100]}" if detail else ""
+        lines.append(f"{span['duration_ms']:>10.1f} ms  {'  ' * depth}{span['name']}{flag}{detail}")
+        for child in sorted(by_parent.get(span["span_id"], []), key=lambda item: item["start_ns"]):
+            walk(child, depth + 1)
+
+    for root in sorted(by_parent.get(None, []), key=lambda item: item["start_ns"]):
+        lines.append(f"trace {root['trace_id']}")
+        walk(root, 1)
+    return "\n".join(lines) + "\n"
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Render traces written by TRACING_EXPORTER=file")
+    parser.add_argument("path", nargs="?", default=settings.tracing_file)
+    parser.add_argument("--slowest", type=int, default=10, help="number of traces to show, slowest root first")
+    parser.add_argument("--trace-id", default="", help="show only this trace")
+    args = parser.parse_args(argv)
+
+    traces: dict[str, list[dict]] = {}
+    with open(args.path) as handle:
+        for line in handle:
+            if line.strip():
+                span = json.loads(line)
+                traces.setdefault(span["trace_id"], []).append(span)
+    if args.trace_id:
+        selected = [traces.get(args.trace_id, [])]
+    else:
+        roots = [
+            (max(span["duration_ms"] for span in spans if span["parent_id"] not in {s["span_id"] for s in spans}), spans)
+            for spans in traces.values()
+        ]
+        selected = [spans for _, spans in sorted(roots, key=lambda item: item[0], reverse=True)[: args.slowest]]
+    for spans in selected:
+        print(render_tree(spans))
+
+
+if __name__ == "__main__":
+    main()
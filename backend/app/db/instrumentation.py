@@ -0,0 +1,71 @@
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from ..core.metrics import db_query_duration_seconds
+from ..core.tracing import tracer
+
+# longest SQL text kept on a span
+MAX_STATEMENT_LENGTH = 1000
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    seconds: float = 0.0
+
+
+# Set by the metrics middleware for the lifetime of one HTTP request
+current_query_stats: ContextVar[QueryStats | None] = ContextVar("current_query_stats", default=None)
+
+
+def _operation(statement: str) -> str:
+    head = statement.lstrip().split(None, 1)
+    return head[0].upper() if head else "UNKNOWN"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+    span = tracer.start_span(
+        f"SQL {_operation(statement)}",
+        kind="client",
+        attributes={"db.system": conn.dialect.name, "db.statement": statement[:MAX_STATEMENT_LENGTH]},
+    )
+    conn.info.setdefault("query_spans", []).append(span)
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_started"].pop()
+    elapsed = time.perf_counter() - started
+    span = conn.info["query_spans"].pop()
+    if span is not None:
+        span.set_attribute("db.rows", cursor.rowcount)
+        tracer.end(span)
+    db_query_duration_seconds.observe(elapsed, operation=_operation(statement))
+    stats = current_query_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.seconds += elapsed
+
+
+def _handle_error(exception_context):
+    # after_cursor_execute does not fire for failed statements
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_started"):
+        conn.info["query_started"].pop()
+        span = conn.info["query_spans"].pop()
+        if span is not None:
+            span.record_exception(exception_context.original_exception)
+            tracer.end(span)
+
+
+def instrument_engine(db_engine: AsyncEngine) -> None:
+    sync_engine = db_engine.sync_engine
+    if event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
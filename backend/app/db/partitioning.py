@@ -0,0 +1,382 @@
+"""Monthly range partitioning and archival of draws, results and approvals.
+
+All three tables are partitioned on the draw month: ``draws`` on
+``draw_datetime`` and ``results`` / ``result_approvals`` on a copy of it that
+they carry next to their parent's id. Postgres requires the partition key in
+every unique constraint, so primary keys become ``(id, draw_datetime)`` and
+the foreign keys ``results (draw_id, draw_datetime)`` and
+``result_approvals (result_id, draw_datetime)`` point at those keys; both
+stay enforced, with ``ON DELETE CASCADE``.
+
+Queries prune partitions only when they bound ``draw_datetime``, so the
+repositories join on it and look rows up by id in recent months first (see
+``recent_first``). Inserts need the partition of their month to exist:
+maintenance keeps ``PARTITION_MONTHS_AHEAD`` months ready and creating a
+draw further out adds its month on the spot. There is no default partition.
+
+Run with:
+    docker compose exec api python -m app.db.partitioning add-keys   # before deploying onto an existing database
+    docker compose exec api python -m app.db.partitioning convert    # one-off, takes ACCESS EXCLUSIVE locks
+    docker compose exec api python -m app.db.partitioning maintain   # create future partitions
+    docker compose exec api python -m app.db.partitioning archive --older-than-months 24
+"""
+
+import argparse
+import asyncio
+import logging
+import re
+from datetime import date, datetime
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+from sqlalchemy.schema import AddConstraint
+
+from ..core.config import settings
+from ..models import Base
+from .session import engine
+
+logger = logging.getLogger(__name__)
+
+# parents before children; every table is partitioned on its draw_datetime column
+PARTITIONED_TABLES = ("draws", "results", "result_approvals")
+PARTITION_KEY = "draw_datetime"
+ARCHIVE_SCHEMA = "archive"
+MAINTENANCE_INTERVAL_SECONDS = 6 * 60 * 60
+# lookups by id alone search partitions from this many months back first
+RECENT_MONTHS = 2
+# transaction-level advisory lock serialising partition DDL (maintenance vs. draw creation)
+PARTITION_DDL_LOCK = 72_616_402
+
+_PARTITION_SUFFIX = re.compile(r"_p(\d{4})(\d{2})$")
+
+
+def _month_start(value: date) -> date:
+    return date(value.year, value.month, 1)
+
+
+def _add_months(value: date, months: int) -> date:
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_p{month:%Y%m}"
+
+
+def _bound(month: date) -> str:
+    return f"'{month:%Y-%m-%d} 00:00:00'"
+
+
+def recent_cutoff(today: date | None = None) -> datetime:
+    """Lower bound of the partition key for the recent months most lookups hit."""
+    return datetime.combine(_add_months(_month_start(today or date.today()), -RECENT_MONTHS), datetime.min.time())
+
+
+async def recent_first(session, stmt, *keys):
+    """First row of ``stmt``, searching recent partitions before older ones.
+
+    ``keys`` are the partition-key columns of every partitioned table in the
+    statement; bounding each lets Postgres prune, so the common case of a
+    recent id touches only the last few months.
+    """
+    cutoff = recent_cutoff()
+    for window in ([key >= cutoff for key in keys], [key < cutoff for key in keys]):
+        row = (await session.execute(stmt.where(*window))).scalars().first()
+        if row is not None:
+            return row
+    return None
+
+
+async def is_partitioned(conn: AsyncConnection, table: str) -> bool:
+    # compared in SQL: asyncpg returns the "char" relkind as bytes
+    partitioned = await conn.scalar(
+        text(
+            "SELECT c.relkind = 'p' FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace "
+            "WHERE n.nspname = current_schema() AND c.relname = :table"
+        ),
+        {"table": table},
+    )
+    return bool(partitioned)
+
+
+async def list_partitions(conn: AsyncConnection, table: str) -> list[tuple[str, date]]:
+    rows = await conn.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "JOIN pg_namespace n ON n.oid = p.relnamespace "
+            "WHERE p.relname = :table AND n.nspname = current_schema()"
+        ),
+        {"table": table},
+    )
+    partitions = []
+    for (name,) in rows:
+        match = _PARTITION_SUFFIX.search(name)
+        if match:
+            partitions.append((name, date(int(match.group(1)), int(match.group(2)), 1)))
+    return sorted(partitions, key=lambda item: item[1])
+
+
+async def _partition_exists(conn: AsyncConnection, name: str) -> bool:
+    return await conn.scalar(text("SELECT to_regclass(:name) IS NOT NULL"), {"name": name})
+
+
+async def create_partition(conn: AsyncConnection, table: str, month: date) -> bool:
+    name = partition_name(table, month)
+    if await _partition_exists(conn, name):
+        return False
+    # concurrent creators would lock the parent tables in different orders and deadlock
+    await conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": PARTITION_DDL_LOCK})
+    if await _partition_exists(conn, name):
+        return False
+    await conn.execute(
+        text(
+            f"CREATE TABLE {name} PARTITION OF {table} "
+            f"FOR VALUES FROM ({_bound(month)}) TO ({_bound(_add_months(month, 1))})"
+        )
+    )
+    return True
+
+
+async def create_partitions(conn: AsyncConnection, table: str, first: date, last: date) -> list[str]:
+    """Missing month partitions of ``table`` from ``first`` through ``last``."""
+    created = []
+    month = _month_start(first)
+    while month <= last:
+        if await create_partition(conn, table, month):
+            created.append(partition_name(table, month))
+        month = _add_months(month, 1)
+    return created
+
+
+async def ensure_partitions(conn: AsyncConnection, first: date, last: date | None = None) -> list[str]:
+    """Make sure every partitioned table can take rows from ``first`` through ``last``.
+
+    A no-op outside Postgres and before conversion.
+    """
+    if conn.dialect.name != "postgresql":
+        return []
+    tables = await conn.scalars(
+        text(
+            "SELECT c.relname FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace "
+            "WHERE n.nspname = current_schema() AND c.relkind = 'p' AND c.relname = ANY(:tables)"
+        ),
+        {"tables": list(PARTITIONED_TABLES)},
+    )
+    months = []
+    month = _month_start(first)
+    while month <= (last or first):
+        months.append(month)
+        month = _add_months(month, 1)
+    wanted = {partition_name(table, month): (table, month) for table in tables for month in months}
+    if not wanted:
+        return []
+    # one round trip when everything exists, which is nearly always
+    missing = await conn.scalars(
+        text("SELECT name FROM unnest(CAST(:names AS text[])) AS name WHERE to_regclass(name) IS NULL"),
+        {"names": list(wanted)},
+    )
+    created = []
+    for name in missing:
+        if await create_partition(conn, *wanted[name]):
+            created.append(name)
+    return created
+
+
+async def ensure_future_partitions(db_engine: AsyncEngine, months_ahead: int, today: date | None = None) -> list[str]:
+    current = _month_start(today or date.today())
+    created = []
+    for table in PARTITIONED_TABLES:
+        # one transaction per table, so a failure leaves the other tables' new months in place
+        try:
+            async with db_engine.begin() as conn:
+                if not await is_partitioned(conn, table):
+                    continue
+                names = await create_partitions(conn, table, current, _add_months(current, months_ahead))
+        except Exception:
+            logger.exception("Creating partitions of %s failed", table)
+            continue
+        created += names
+    return created
+
+
+async def _foreign_keys(conn: AsyncConnection, table: str, target: str | None = None) -> list[str]:
+    """Names of the foreign keys on ``table`` (only those pointing at ``target`` when given)."""
+    query = "SELECT conname FROM pg_constraint WHERE contype = 'f' AND conrelid = CAST(:table AS regclass)"
+    if target is not None:
+        query += " AND confrelid = CAST(:target AS regclass)"
+    rows = await conn.execute(text(query), {"table": table, "target": target})
+    return list(rows.scalars())
+
+
+async def _add_foreign_keys(conn: AsyncConnection, constraints) -> None:
+    for constraint in constraints:
+        await conn.run_sync(lambda sync_conn, constraint=constraint: sync_conn.execute(AddConstraint(constraint)))
+
+
+async def add_partition_keys(conn: AsyncConnection) -> bool:
+    """Copy ``draw_datetime`` into results and approvals of a database created before it existed."""
+    present = await conn.scalar(
+        text(
+            "SELECT EXISTS (SELECT 1 FROM information_schema.columns "
+            "WHERE table_schema = current_schema() AND table_name = 'result_approvals' AND column_name = :key)"
+        ),
+        {"key": PARTITION_KEY},
+    )
+    if present:
+        return False
+    await conn.execute(text("ALTER TABLE draws ADD CONSTRAINT uq_draws_id_draw_datetime UNIQUE (id, draw_datetime)"))
+    for table, parent, parent_id in (("results", "draws", "draw_id"), ("result_approvals", "results", "result_id")):
+        await conn.execute(text(f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS {PARTITION_KEY} timestamp without time zone"))
+        await conn.execute(
+            text(f"UPDATE {table} t SET {PARTITION_KEY} = p.{PARTITION_KEY} FROM {parent} p WHERE p.id = t.{parent_id}")
+        )
+        await conn.execute(text(f"ALTER TABLE {table} ALTER COLUMN {PARTITION_KEY} SET NOT NULL"))
+        for name in await _foreign_keys(conn, table, parent):
+            await conn.execute(text(f"ALTER TABLE {table} DROP CONSTRAINT {name}"))
+        if table == "results":
+            await conn.execute(
+                text("ALTER TABLE results ADD CONSTRAINT uq_results_id_draw_datetime UNIQUE (id, draw_datetime)")
+            )
+            await conn.execute(text("CREATE INDEX IF NOT EXISTS ix_results_draw_datetime ON results (draw_datetime)"))
+        await _add_foreign_keys(
+            conn,
+            [fk for fk in Base.metadata.tables[table].foreign_key_constraints if fk.referred_table.name == parent],
+        )
+    return True
+
+
+async def _convert_table(conn: AsyncConnection, table: str, first: date, last: date) -> None:
+    legacy = f"{table}_unpartitioned"
+    await conn.execute(text(f"ALTER TABLE {table} RENAME TO {legacy}"))
+    sequence = await conn.scalar(text(f"SELECT pg_get_serial_sequence('{legacy}', 'id')"))
+    if sequence:
+        # the sequence would otherwise be dropped together with the legacy table
+        await conn.execute(text(f"ALTER SEQUENCE {sequence} OWNED BY NONE"))
+    await conn.execute(
+        text(f"CREATE TABLE {table} (LIKE {legacy} INCLUDING DEFAULTS) PARTITION BY RANGE ({PARTITION_KEY})")
+    )
+    await create_partitions(conn, table, first, last)
+
+    await conn.execute(text(f"INSERT INTO {table} SELECT * FROM {legacy}"))
+    # CASCADE drops the foreign keys of child tables; they are re-added below
+    await conn.execute(text(f"DROP TABLE {legacy} CASCADE"))
+    if sequence:
+        await conn.execute(text(f"ALTER SEQUENCE {sequence} OWNED BY {table}.id"))
+    await conn.execute(text(f"ALTER TABLE {table} ADD PRIMARY KEY (id, {PARTITION_KEY})"))
+
+    outgoing = list(Base.metadata.tables[table].foreign_key_constraints)
+    incoming = [
+        fk
+        for other in Base.metadata.sorted_tables
+        if other.name != table
+        for fk in other.foreign_key_constraints
+        if fk.referred_table.name == table
+    ]
+    await _add_foreign_keys(conn, outgoing + incoming)
+    await conn.run_sync(lambda sync_conn: [index.create(sync_conn) for index in Base.metadata.tables[table].indexes])
+
+
+async def convert_to_partitioned(db_engine: AsyncEngine, months_ahead: int) -> list[str]:
+    async with db_engine.begin() as conn:
+        await add_partition_keys(conn)
+        oldest, newest = (await conn.execute(text(f"SELECT min({PARTITION_KEY}), max({PARTITION_KEY}) FROM draws"))).one()
+    # every table gets the same months, so a child row always has a partition next to its parent's
+    today = date.today()
+    first = _month_start(oldest.date() if oldest else today)
+    last = max(_add_months(_month_start(today), months_ahead), _month_start(newest.date() if newest else today))
+    converted = []
+    for table in PARTITIONED_TABLES:
+        async with db_engine.begin() as conn:
+            if await is_partitioned(conn, table):
+                continue
+            await _convert_table(conn, table, first, last)
+            converted.append(table)
+    return converted
+
+
+async def archive_partitions(db_engine: AsyncEngine, older_than_months: int, today: date | None = None) -> list[str]:
+    """Detach partitions older than the cutoff and move them to the archive schema."""
+    cutoff = _add_months(_month_start(today or date.today()), -older_than_months)
+    archived = []
+    async with db_engine.begin() as conn:
+        await conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {ARCHIVE_SCHEMA}"))
+        # children first: a month of draws can only leave once no live result points at it
+        for table in reversed(PARTITIONED_TABLES):
+            if not await is_partitioned(conn, table):
+                continue
+            for name, month in await list_partitions(conn, table):
+                if month >= cutoff:
+                    continue
+                await conn.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+                # archived rows keep their ids but no longer reference the live tables or their sequences
+                for constraint in await _foreign_keys(conn, name):
+                    await conn.execute(text(f"ALTER TABLE {name} DROP CONSTRAINT {constraint}"))
+                await conn.execute(text(f"ALTER TABLE {name} ALTER COLUMN id DROP DEFAULT"))
+                await conn.execute(text(f"ALTER TABLE {name} SET SCHEMA {ARCHIVE_SCHEMA}"))
+                archived.append(name)
+    if archived:
+        # archived months are read-only: rewrite them densely (VACUUM cannot run in a transaction)
+        async with db_engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            for name in archived:
+                await conn.execute(text(f"ALTER TABLE {ARCHIVE_SCHEMA}.{name} SET (fillfactor = 100)"))
+                await conn.execute(text(f"VACUUM (FULL, ANALYZE) {ARCHIVE_SCHEMA}.{name}"))
+    return archived
+
+
+async def run_maintenance(db_engine: AsyncEngine) -> None:
+    if db_engine.dialect.name != "postgresql":
+        return
+    created = await ensure_future_partitions(db_engine, settings.partition_months_ahead)
+    if created:
+        logger.info("Created partitions %s", ", ".join(created))
+    if settings.partition_archive_after_months > 0:
+        archived = await archive_partitions(db_engine, settings.partition_archive_after_months)
+        if archived:
+            logger.info("Archived partitions %s", ", ".join(archived))
+
+
+async def _partition_maintenance_loop():
+    while True:
+        try:
+            await run_maintenance(engine)
+        except Exception:
+            logger.exception("Partition maintenance failed")
+        await asyncio.sleep(MAINTENANCE_INTERVAL_SECONDS)
+
+
+def start_partition_maintenance_task(loop):
+    return loop.create_task(_partition_maintenance_loop())
+
+
+async def main(argv=None):
+    parser = argparse.ArgumentParser(description="Manage monthly partitions of draws, results and approvals")
+    parser.add_argument("command", choices=["add-keys", "convert", "maintain", "archive"])
+    parser.add_argument("--months-ahead", type=int, default=settings.partition_months_ahead)
+    parser.add_argument("--older-than-months", type=int, default=settings.partition_archive_after_months)
+    args = parser.parse_args(argv)
+    if engine.dialect.name != "postgresql":
+        raise SystemExit("Partitioning requires PostgreSQL")
+
+    if args.command == "add-keys":
+        async with engine.begin() as conn:
+            added = await add_partition_keys(conn)
+        print("Added draw_datetime to results and result_approvals" if added else "Partition keys already present")
+    elif args.command == "convert":
+        converted = await convert_to_partitioned(engine, args.months_ahead)
+        print(f"Converted: {', '.join(converted) or 'nothing (already partitioned)'}")
+    elif args.command == "maintain":
+        created = await ensure_future_partitions(engine, args.months_ahead)
+        print(f"Created: {', '.join(created) or 'nothing'}")
+    else:
+        if args.older_than_months <= 0:
+            raise SystemExit("--older-than-months must be positive")
+        archived = await archive_partitions(engine, args.older_than_months)
+        print(f"Archived: {', '.join(archived) or 'nothing'}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
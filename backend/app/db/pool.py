@@ -0,0 +1,74 @@
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+@dataclass
+class PoolStats:
+    checkouts: int = 0
+    timeouts: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+    # recent checkout waits, for percentiles
+    recent_waits: deque = field(default_factory=lambda: deque(maxlen=2048))
+
+    def record(self, waited: float) -> None:
+        self.checkouts += 1
+        self.wait_seconds_total += waited
+        self.wait_seconds_max = max(self.wait_seconds_max, waited)
+        self.recent_waits.append(waited)
+
+    def percentile(self, pct: float) -> float:
+        if not self.recent_waits:
+            return 0.0
+        ordered = sorted(self.recent_waits)
+        index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+
+# keyed by pool logging name ("primary", "replica") so stats survive pool.recreate()
+pool_stats: dict[str, PoolStats] = {}
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that records how long each checkout waited."""
+
+    def _do_get(self):
+        stats = pool_stats.setdefault(self._orig_logging_name or "default", PoolStats())
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            stats.timeouts += 1
+            raise
+        finally:
+            stats.record(time.perf_counter() - started)
+
+
+def pool_status(db_engine: AsyncEngine) -> dict:
+    pool = db_engine.pool
+    status = {"pool_class": type(pool).__name__}
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        status.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            in_use=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+            max_overflow=pool._max_overflow,
+        )
+    stats = pool_stats.get(getattr(pool, "_orig_logging_name", None) or "default")
+    if stats and isinstance(pool, InstrumentedQueuePool):
+        status.update(
+            checkouts=stats.checkouts,
+            timeouts=stats.timeouts,
+            wait_seconds_total=round(stats.wait_seconds_total, 6),
+            wait_seconds_max=round(stats.wait_seconds_max, 6),
+            wait_seconds_p50=round(stats.percentile(50), 6),
+            wait_seconds_p95=round(stats.percentile(95), 6),
+            wait_seconds_p99=round(stats.percentile(99), 6),
+        )
+    return status
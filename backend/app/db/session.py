@@ -1,5 +1,10 @@
+import time
+import uuid
+
+from fastapi import Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from ..core.config import settings
+from .pool import InstrumentedQueuePool
 
 
 def _normalize_async_dsn(url: str) -> str:
@@ -12,10 +17,77 @@ def _normalize_async_dsn(url: str) -> str:
     return url
 
 
+def _engine_options(url: str, name: str) -> dict:
+    if url.startswith("sqlite"):
+        # SQLite picks its own pool; sizing knobs do not apply
+        return {}
+    options = {
+        "poolclass": InstrumentedQueuePool,
+        "pool_logging_name": name,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+    if settings.db_pgbouncer_mode and url.startswith("postgresql+asyncpg://"):
+        # PgBouncer in transaction mode may hand each statement a different
+        # server connection, so cached or reused prepared statements break.
+        options["connect_args"] = {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+        }
+    return options
+
+
 database_url = _normalize_async_dsn(settings.database_url)
-engine = create_async_engine(database_url, pool_pre_ping=True)
+engine = create_async_engine(database_url, **_engine_options(database_url, "primary"))
 SessionLocal = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
 
+if settings.database_read_url:
+    database_read_url = _normalize_async_dsn(settings.database_read_url)
+    read_engine = create_async_engine(database_read_url, **_engine_options(database_read_url, "replica"))
+else:
+    read_engine = engine
+ReadSessionLocal = async_sessionmaker(read_engine, expire_on_commit=False, class_=AsyncSession)
+
+# The pin travels with the client, so it holds whichever worker or replica serves the next read.
+# Value: unix time until which the client's reads go to the primary.
+PRIMARY_PIN_HEADER = "X-Primary-Until"
+
+
+def mark_recent_write(response: Response) -> None:
+    """Pin the caller's reads to the primary until the replica has caught up.
+
+    The client echoes the header on its next requests (the dashboard's API
+    client does); nothing is stored server-side.
+    """
+    if read_engine is engine:
+        return
+    response.headers[PRIMARY_PIN_HEADER] = f"{time.time() + settings.read_your_writes_seconds:.3f}"
+
+
+def _wrote_recently(request: Request) -> bool:
+    try:
+        pinned_until = float(request.headers.get(PRIMARY_PIN_HEADER, ""))
+    except ValueError:
+        return False
+    now = time.time()
+    # a value further out than one window was not issued by us
+    return now < pinned_until <= now + settings.read_your_writes_seconds
+
+
 async def get_session() -> AsyncSession:
     async with SessionLocal() as session:
         yield session
+
+
+def read_sessionmaker(request: Request) -> async_sessionmaker:
+    """Replica sessions, or primary ones while the caller's own writes may not have replicated."""
+    return SessionLocal if _wrote_recently(request) else ReadSessionLocal
+
+
+async def get_read_session(request: Request) -> AsyncSession:
+    async with read_sessionmaker(request)() as session:
+        yield session
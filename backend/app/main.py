@@ -1,18 +1,75 @@
+from .core import startup_profile
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 from .core.config import settings
-from .api import games, draws, results, social, auth
+# social and Google sign-in import their SDKs (httpx, google-auth) on first use
+from .api import games, draws, results, social, auth, snapshots, bootstrap
 from .models import Base
-from .db.session import engine
+from .db.session import PRIMARY_PIN_HEADER, engine, read_engine
+from .db.pool import pool_status
+from .db.instrumentation import instrument_engine
+from .core import metrics
+from .core.http import close_http_client
+from .middleware.load_shedding import LoadSheddingMiddleware
+from .middleware.metrics import MetricsMiddleware
+from .middleware.tracing import TracingMiddleware
+from .core.tracing import tracer
+from .db.partitioning import start_partition_maintenance_task
 from .services.draw_notifier import start_notifier_task
+from .services.draw_schedule import start_schedule_refresh_task
+from .services.health import readiness_report, start_loop_lag_monitor
+from .services.leader_election import leader_elector, start_leader_election
+from .services.snapshots import snapshot_publisher
+from .services.randomness_audit import numpy_available, start_audit_task
 import asyncio
 
-app = FastAPI(title=settings.app_name)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if not settings.startup_skip_ddl:
+        # For quick start in dev only: create tables if not exist
+        with startup_profile.phase("create_all"):
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+    loop = asyncio.get_running_loop()
+    with startup_profile.phase("background_tasks"):
+        # every worker keeps its own upcoming-draw index, loaded without blocking startup
+        schedule_task = start_schedule_refresh_task(loop)
+        lag_task = start_loop_lag_monitor(loop)
+        # background jobs run only in the elected leader; every process serves HTTP
+        leader_elector.register("draw_notifier", start_notifier_task)
+        leader_elector.register("partition_maintenance", start_partition_maintenance_task)
+        if settings.audit_interval_hours > 0 and numpy_available():
+            leader_elector.register("randomness_audit", start_audit_task)
+        start_leader_election(loop)
+    startup_profile.mark("ready")
+    startup_profile.log_report()
+
+    yield
+
+    # the server has stopped accepting connections and drained in-flight requests
+    schedule_task.cancel()
+    lag_task.cancel()
+    await leader_elector.stop(settings.shutdown_grace_seconds)
+    await asyncio.gather(schedule_task, lag_task, return_exceptions=True)
+    await snapshot_publisher.wait(settings.shutdown_grace_seconds)
+    await close_http_client()
+    tracer.shutdown()
+    await engine.dispose()
+    if read_engine is not engine:
+        await read_engine.dispose()
+
+
+app = FastAPI(title=settings.app_name, lifespan=lifespan)
 # Force HTTPS redirect to avoid mixed content and 307 issues
 
 # Parse CORS origins
 cors_origins = settings.get_cors_origins()
 vercel_origin_regex = "https://randproject(?:-[^.]+)?\.vercel\.app"
+# innermost, so 503s still carry CORS headers and are counted by the metrics middleware
+app.add_middleware(LoadSheddingMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=cors_origins,
@@ -20,17 +77,19 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "Retry-After", "X-Trace-Id", PRIMARY_PIN_HEADER],
 )
+app.add_middleware(MetricsMiddleware)
+if tracer.enabled:
+    # outermost, so the request span also covers metrics, CORS and load shedding
+    app.add_middleware(TracingMiddleware)
+
+instrument_engine(engine)
+if read_engine is not engine:
+    instrument_engine(read_engine)
 
 
-@app.on_event("startup")
-async def on_startup():
-    # For quick start in dev only: create tables if not exist
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    # start background notifier
-    loop = asyncio.get_event_loop()
-    start_notifier_task(loop)
+startup_profile.mark("import")
 
 
 @app.get("/health")
@@ -38,8 +97,58 @@ async def health():
     return {"status": "ok"}
 
 
+@app.get("/ready")
+async def ready():
+    """503 while any readiness check fails, so the load balancer stops routing here."""
+    report = await readiness_report()
+    return JSONResponse(
+        {"status": report["status"], "failing": report["failing"]},
+        status_code=503 if report["failing"] else 200,
+    )
+
+
+@app.get("/health/details")
+async def health_details():
+    return await readiness_report()
+
+
+@app.get("/health/startup")
+async def health_startup():
+    return startup_profile.report()
+
+
+@app.get("/health/pool")
+async def health_pool():
+    status = {"primary": pool_status(engine)}
+    if read_engine is not engine:
+        status["replica"] = pool_status(read_engine)
+    return status
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    engines = {"primary": engine}
+    if read_engine is not engine:
+        engines["replica"] = read_engine
+    for name, db_engine in engines.items():
+        status = pool_status(db_engine)
+        for state in ("size", "in_use", "checked_in", "overflow"):
+            if state in status:
+                metrics.db_pool_connections.set(status[state], pool=name, state=state)
+        for quantile in ("p50", "p95", "p99", "max"):
+            key = f"wait_seconds_{quantile}"
+            if key in status:
+                metrics.db_pool_checkout_wait_seconds.set(status[key], pool=name, quantile=quantile)
+        for outcome in ("checkouts", "timeouts"):
+            if outcome in status:
+                metrics.db_pool_checkouts.set(status[outcome], pool=name, outcome=outcome)
+    return PlainTextResponse(metrics.registry.render(), media_type="text/plain; version=0.0.4")
+
+
 app.include_router(games.router, prefix="/api")
 app.include_router(draws.router, prefix="/api")
 app.include_router(results.router, prefix="/api")
 app.include_router(social.router, prefix="/api")
 app.include_router(auth.router, prefix="/api")
+app.include_router(snapshots.router, prefix="/api")
+app.include_router(bootstrap.router, prefix="/api")
@@ -0,0 +1,218 @@
+"""Per-route-class concurrency limits with bounded queueing.
+
+Without a limit, a saturated connection pool makes every request wait inside
+SQLAlchemy, so result submission slows down along with the public pages. Each
+class of route gets its own limit. Requests beyond the limit wait at most a
+bounded time and then get ``503`` with ``Retry-After``.
+
+Public reads adapt their limit to observed latency. While reads run slower
+than ``LOAD_SHED_READ_TARGET_SECONDS``, their limit shrinks multiplicatively.
+Once latency recovers, it grows back by one slot per interval. This gives
+pool connections back to manager writes, which keep a fixed limit. Health
+and metrics endpoints are never limited. Limits are per worker process.
+
+Unless configured, the read and write limits are derived from the pool
+(``DB_POOL_SIZE + DB_MAX_OVERFLOW``), so admitted requests never queue for a
+connection. Without a read replica, reads and writes share the primary's
+pool. A third of it is kept for writes. A slot stands for one connection, so
+``GET /api/bootstrap`` (four concurrent queries) takes four. Snapshot files
+need no connection and are not limited.
+"""
+
+import asyncio
+import math
+import time
+from collections import deque
+
+from fastapi.responses import JSONResponse
+
+from ..core.config import settings
+from ..core.metrics import http_requests_shed_total, load_shed_concurrency_limit
+from ..core.tracing import tracer
+
+EWMA_ALPHA = 0.2
+ADJUST_INTERVAL_SECONDS = 1.0
+DECREASE_FACTOR = 0.8
+# waiters allowed per slot; beyond this a request is shed without queueing
+MAX_WAITERS_PER_SLOT = 4
+MAX_RETRY_AFTER_SECONDS = 30
+# slots taken by requests holding several pooled connections at once (BootstrapService.load)
+ROUTE_WEIGHTS = {"/api/bootstrap": 4}
+
+
+class ConcurrencyLimiter:
+    def __init__(self, name: str, limit: int, max_wait: float, target_latency: float | None = None) -> None:
+        self.name = name
+        self.max_limit = limit
+        self.min_limit = max(1, limit // 10)
+        self.limit = float(limit)
+        self.max_wait = max_wait
+        self.target_latency = target_latency
+        self.active = 0
+        self.latency: float | None = None
+        # (future, weight) in arrival order
+        self._waiters: deque[tuple[asyncio.Future, int]] = deque()
+        self._adjusted_at = time.monotonic()
+        load_shed_concurrency_limit.set(limit, route_class=name)
+
+    @property
+    def slots(self) -> int:
+        return max(1, int(self.limit))
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    def _fits(self, weight: int) -> bool:
+        # a request heavier than the whole limit still runs, alone
+        return self.active + weight <= self.slots or self.active == 0
+
+    async def acquire(self, weight: int = 1) -> bool:
+        """True once `weight` slots are held; False when the request should be shed."""
+        if not self._waiters and self._fits(weight):
+            self.active += weight
+            return True
+        if self.max_wait <= 0 or len(self._waiters) >= self.slots * MAX_WAITERS_PER_SLOT:
+            return False
+        waiter = asyncio.get_running_loop().create_future()
+        entry = (waiter, weight)
+        self._waiters.append(entry)
+        try:
+            await asyncio.wait([waiter], timeout=self.max_wait)
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release(weight=weight)
+            else:
+                self._abandon(entry)
+            raise
+        if waiter.done():
+            # _wake already counted this request as active
+            return True
+        self._abandon(entry)
+        return False
+
+    def release(self, elapsed: float | None = None, weight: int = 1) -> None:
+        self.active -= weight
+        if elapsed is not None:
+            self._record(elapsed)
+        self._wake()
+
+    def retry_after(self) -> int:
+        # time for the queue ahead to drain at the current limit and latency
+        drain = (len(self._waiters) / self.slots + 1) * (self.latency or 1.0)
+        return min(MAX_RETRY_AFTER_SECONDS, max(1, math.ceil(drain)))
+
+    def _abandon(self, entry: tuple[asyncio.Future, int]) -> None:
+        entry[0].cancel()
+        try:
+            self._waiters.remove(entry)
+        except ValueError:
+            pass
+        # a heavy waiter leaving the head may unblock lighter ones behind it
+        self._wake()
+
+    def _wake(self) -> None:
+        # first come, first served: a heavy waiter at the head is not overtaken
+        while self._waiters and self._fits(self._waiters[0][1]):
+            waiter, weight = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                self.active += weight
+
+    def _record(self, elapsed: float) -> None:
+        self.latency = elapsed if self.latency is None else self.latency + EWMA_ALPHA * (elapsed - self.latency)
+        if self.target_latency is None:
+            return
+        now = time.monotonic()
+        if now - self._adjusted_at < ADJUST_INTERVAL_SECONDS:
+            return
+        self._adjusted_at = now
+        if self.latency > self.target_latency:
+            self.limit = max(self.min_limit, self.limit * DECREASE_FACTOR)
+        else:
+            self.limit = min(self.max_limit, self.limit + 1)
+        load_shed_concurrency_limit.set(self.slots, route_class=self.name)
+
+
+def route_class(method: str, path: str) -> str | None:
+    if not path.startswith("/api/") or path.startswith("/api/snapshots/"):
+        # health checks, metrics and docs must answer even under overload;
+        # snapshot files are served from disk without a database connection
+        return None
+    if path.startswith("/api/auth/"):
+        return "auth"
+    if path.startswith("/api/social/"):
+        return "social"
+    if method in ("GET", "HEAD", "OPTIONS"):
+        return "read"
+    return "write"
+
+
+def pool_limits() -> tuple[int, int]:
+    """Default (read, write) limits that fit the connection pools of one worker."""
+    capacity = settings.db_pool_size + settings.db_max_overflow
+    write = max(1, capacity // 3)
+    # the replica has a pool of its own; otherwise reads get what writes leave
+    read = capacity if settings.database_read_url else max(1, capacity - write)
+    return read, write
+
+
+def build_limiters() -> dict[str, ConcurrencyLimiter]:
+    wait = settings.load_shed_queue_seconds
+    read, write = pool_limits()
+    if settings.load_shed_read_concurrency is not None:
+        read = settings.load_shed_read_concurrency
+    if settings.load_shed_write_concurrency is not None:
+        write = settings.load_shed_write_concurrency
+    limiters = {
+        "read": ConcurrencyLimiter(
+            "read",
+            read,
+            settings.load_shed_read_queue_seconds,
+            target_latency=settings.load_shed_read_target_seconds,
+        ),
+        "write": ConcurrencyLimiter("write", write, wait),
+        "social": ConcurrencyLimiter("social", settings.load_shed_social_concurrency, wait),
+        "auth": ConcurrencyLimiter("auth", settings.load_shed_auth_concurrency, wait),
+    }
+    # a limit of 0 leaves that class unlimited
+    return {name: limiter for name, limiter in limiters.items() if limiter.max_limit > 0}
+
+
+# shared with the readiness report
+route_limiters = build_limiters()
+
+
+class LoadSheddingMiddleware:
+    """Admits requests per route class; sheds with 503 once the bounded queue wait runs out."""
+
+    def __init__(self, app, limiters: dict[str, ConcurrencyLimiter] | None = None):
+        self.app = app
+        self.limiters = route_limiters if limiters is None else limiters
+
+    async def __call__(self, scope, receive, send):
+        limiter = None
+        if scope["type"] == "http":
+            limiter = self.limiters.get(route_class(scope["method"], scope["path"]))
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+
+        weight = ROUTE_WEIGHTS.get(scope["path"].rstrip("/"), 1)
+        with tracer.span("load_shed.wait", attributes={"route_class": limiter.name}) as span:
+            admitted = await limiter.acquire(weight)
+            span.set_attribute("admitted", admitted)
+        if not admitted:
+            http_requests_shed_total.inc(route_class=limiter.name)
+            response = JSONResponse(
+                {"detail": "Server is busy, try again shortly"},
+                status_code=503,
+                headers={"Retry-After": str(limiter.retry_after())},
+            )
+            await response(scope, receive, send)
+            return
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release(time.perf_counter() - started, weight)
@@ -0,0 +1,66 @@
+import logging
+import time
+
+from ..core.config import settings
+from ..core.metrics import (
+    http_request_db_queries,
+    http_request_duration_seconds,
+    http_requests_over_query_budget_total,
+    http_requests_total,
+)
+from ..db.instrumentation import QueryStats, current_query_stats
+
+logger = logging.getLogger(__name__)
+
+
+def route_label(scope) -> str:
+    # Use the route template so /api/results/1 and /api/results/2 share a series.
+    # Newer FastAPI resolves included routers lazily and keeps the prefixed
+    # template on the effective route context instead of the route itself.
+    context = (scope.get("fastapi") or {}).get("effective_route_context")
+    path = getattr(context, "path_format", None) or getattr(scope.get("route"), "path_format", None)
+    return path or "unmatched"
+
+
+class MetricsMiddleware:
+    """Records latency, status and SQL statement counts per route."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        stats = QueryStats()
+        token = current_query_stats.set(stats)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            current_query_stats.reset(token)
+            method = scope["method"]
+            route = route_label(scope)
+            http_requests_total.inc(method=method, route=route, status=str(status_code))
+            http_request_duration_seconds.observe(elapsed, method=method, route=route)
+            http_request_db_queries.observe(stats.count, method=method, route=route)
+            if settings.query_budget_per_request and stats.count > settings.query_budget_per_request:
+                http_requests_over_query_budget_total.inc(method=method, route=route)
+                logger.warning(
+                    "%s %s ran %d SQL statements (budget %d, %.1f ms in SQL) - possible N+1",
+                    method,
+                    route,
+                    stats.count,
+                    settings.query_budget_per_request,
+                    stats.seconds * 1000,
+                )
@@ -0,0 +1,40 @@
+from ..core.tracing import tracer
+from .metrics import route_label
+
+
+class TracingMiddleware:
+    """Opens the server span of each request; continues an incoming `traceparent`."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get("headers") or [])
+        traceparent = headers.get(b"traceparent", b"").decode("latin-1") or None
+        method = scope["method"]
+        with tracer.span(
+            f"{method} {scope['path']}",
+            kind="server",
+            attributes={"http.method": method, "http.target": scope["path"]},
+            traceparent=traceparent,
+        ) as span:
+
+            async def send_wrapper(message):
+                if message["type"] == "http.response.start":
+                    span.set_attribute("http.status_code", message["status"])
+                    if message["status"] >= 500:
+                        span.status = "error"
+                    message.setdefault("headers", [])
+                    message["headers"] = [*message["headers"], (b"x-trace-id", span.trace_id.encode())]
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route = route_label(scope)
+                span.name = f"{method} {route}"
+                span.set_attribute("http.route", route)
@@ -4,5 +4,7 @@ from .draw import Draw
 from .result import Result
 from .manager import Manager
 from .result_approval import ResultApproval
+from .social_post import SocialPost
+from .randomness_audit import RandomnessAudit
 
-__all__ = ["Base", "Game", "Draw", "Result", "Manager", "ResultApproval"]
+__all__ = ["Base", "Game", "Draw", "Result", "Manager", "ResultApproval", "SocialPost", "RandomnessAudit"]
@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import Integer, String, DateTime, ForeignKey, Boolean
+from sqlalchemy import Integer, String, DateTime, ForeignKey, Boolean, UniqueConstraint
 from datetime import datetime
 from .base import Base, TimestampMixin
 from typing import List
@@ -7,13 +7,14 @@ from typing import List
 
 class Draw(Base, TimestampMixin):
     __tablename__ = "draws"
+    # target of the (draw_id, draw_datetime) foreign key from results; the primary key once partitioned
+    __table_args__ = (UniqueConstraint("id", "draw_datetime", name="uq_draws_id_draw_datetime"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     game_id: Mapped[int] = mapped_column(ForeignKey("games.id", ondelete="CASCADE"), index=True)
-    draw_datetime: Mapped[datetime] = mapped_column(DateTime(timezone=False))
+    draw_datetime: Mapped[datetime] = mapped_column(DateTime(timezone=False), index=True)
     notified: Mapped[bool] = mapped_column(Boolean, default=False)
 
     game: Mapped["Game"] = relationship(back_populates="draws")
-    results: Mapped[List["Result"]] = relationship(
-        back_populates="draw", cascade="all, delete-orphan", lazy="selectin"
-    )
+    # not eager: callers that need results must selectinload(Draw.results) explicitly
+    results: Mapped[List["Result"]] = relationship(back_populates="draw", cascade="all, delete-orphan")
@@ -0,0 +1,21 @@
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Boolean, Float, Integer, String
+
+from .base import Base, TimestampMixin
+
+
+class RandomnessAudit(Base, TimestampMixin):
+    """One statistical test of one game's approved numbers in one audit run."""
+
+    __tablename__ = "randomness_audits"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    run_id: Mapped[str] = mapped_column(String(32), index=True)
+    game_id: Mapped[int] = mapped_column(Integer, index=True)
+    numbers: Mapped[str] = mapped_column(String(20))  # winning | machine
+    test: Mapped[str] = mapped_column(String(40))
+    draws: Mapped[int] = mapped_column(Integer)
+    statistic: Mapped[float] = mapped_column(Float)
+    p_value: Mapped[float] = mapped_column(Float)
+    simulations: Mapped[int] = mapped_column(Integer)
+    flagged: Mapped[bool] = mapped_column(Boolean, default=False)
@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import Integer, String, ForeignKey, DateTime, Text
+from sqlalchemy import Integer, String, ForeignKey, ForeignKeyConstraint, DateTime, Text, UniqueConstraint
 
 from .base import Base, TimestampMixin
 
@@ -16,9 +16,21 @@ if TYPE_CHECKING:
 
 class Result(Base, TimestampMixin):
     __tablename__ = "results"
+    # the foreign key carries the draw's partition key (see app.db.partitioning)
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["draw_id", "draw_datetime"],
+            ["draws.id", "draws.draw_datetime"],
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        UniqueConstraint("id", "draw_datetime", name="uq_results_id_draw_datetime"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
-    draw_id: Mapped[int] = mapped_column(ForeignKey("draws.id", ondelete="CASCADE"), index=True)
+    draw_id: Mapped[int] = mapped_column(Integer, index=True)
+    # copy of the draw's draw_datetime; results are partitioned on it
+    draw_datetime: Mapped[datetime] = mapped_column(DateTime(timezone=False), index=True)
 
     # Store as comma-separated or JSON string for simplicity; can normalize later
     winning_numbers: Mapped[str] = mapped_column(String(255))
@@ -1,9 +1,8 @@
-from typing import TYPE_CHECKING
-
+from datetime import datetime
 from typing import TYPE_CHECKING
 
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import Integer, ForeignKey, String, Text
+from sqlalchemy import DateTime, Integer, ForeignKey, ForeignKeyConstraint, String, Text
 
 from .base import Base, TimestampMixin
 
@@ -11,16 +10,23 @@ if TYPE_CHECKING:
     from .result import Result
     from .manager import Manager
 
-if TYPE_CHECKING:
-    from .result import Result
-    from .manager import Manager
-
 
 class ResultApproval(Base, TimestampMixin):
     __tablename__ = "result_approvals"
+    # the foreign key carries the result's partition key (see app.db.partitioning)
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["result_id", "draw_datetime"],
+            ["results.id", "results.draw_datetime"],
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
-    result_id: Mapped[int] = mapped_column(ForeignKey("results.id", ondelete="CASCADE"), index=True)
+    result_id: Mapped[int] = mapped_column(Integer, index=True)
+    # copy of the draw's draw_datetime; approvals are partitioned on it
+    draw_datetime: Mapped[datetime] = mapped_column(DateTime(timezone=False))
     manager_id: Mapped[int] = mapped_column(ForeignKey("managers.id", ondelete="CASCADE"), index=True)
     decision: Mapped[str] = mapped_column(String(20))
     note: Mapped[str | None] = mapped_column(Text, nullable=True)
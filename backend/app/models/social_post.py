@@ -0,0 +1,23 @@
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Integer, String, Text, UniqueConstraint
+
+from .base import Base, TimestampMixin
+
+
+class SocialPost(Base, TimestampMixin):
+    """One attempt to publish a result to one platform, keyed for idempotent retries."""
+
+    __tablename__ = "social_posts"
+    __table_args__ = (UniqueConstraint("idempotency_key", "platform", name="uq_social_posts_key_platform"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    # no database FK: results may be a partitioned table (see app.db.partitioning)
+    result_id: Mapped[int] = mapped_column(Integer, index=True)
+    platform: Mapped[str] = mapped_column(String(20))
+    idempotency_key: Mapped[str] = mapped_column(String(255))
+    # fingerprint of the request content; a reused key must come with the same content
+    request_digest: Mapped[str] = mapped_column(String(64), index=True)
+    status: Mapped[str] = mapped_column(String(20), default="pending")  # pending | succeeded | failed
+    post_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    message: Mapped[str | None] = mapped_column(Text, nullable=True)
+    latency_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
@@ -1,18 +1,75 @@
+from __future__ import annotations
+
+from datetime import datetime
+
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import func, insert, select, tuple_
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import joinedload, lazyload, noload
+from ..core.tracing import traced
+from ..db.partitioning import recent_first
 from ..models.draw import Draw
+from ..models.game import Game
 
 
+@traced
 class DrawRepository:
     @staticmethod
-    async def list(session: AsyncSession) -> list[Draw]:
-        res = await session.execute(select(Draw))
-        return res.scalars().all()
+    async def list(
+        session: AsyncSession,
+        *,
+        game_id: int | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        notified: bool | None = None,
+        after: tuple[datetime, int] | None = None,
+        limit: int | None = None,
+        with_game: bool = False,
+    ) -> list[Row]:
+        """Column-projected draw rows ordered by (draw_datetime, id); never touches results."""
+        stmt = select(Draw.id, Draw.game_id, Draw.draw_datetime, Draw.notified).order_by(
+            Draw.draw_datetime, Draw.id
+        )
+        if with_game:
+            stmt = stmt.add_columns(Game.name.label("game_name")).join(Game, Game.id == Draw.game_id)
+        if game_id is not None:
+            stmt = stmt.where(Draw.game_id == game_id)
+        if date_from is not None:
+            stmt = stmt.where(Draw.draw_datetime >= date_from)
+        if date_to is not None:
+            stmt = stmt.where(Draw.draw_datetime < date_to)
+        if notified is not None:
+            stmt = stmt.where(Draw.notified.is_(notified))
+        if after is not None:
+            # keyset pagination: continue strictly after the last row of the previous page
+            stmt = stmt.where(tuple_(Draw.draw_datetime, Draw.id) > tuple_(*after))
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        res = await session.execute(stmt)
+        return list(res.all())
+
+    @staticmethod
+    async def count_unnotified_before(session: AsyncSession, before: datetime) -> int:
+        return await session.scalar(
+            select(func.count()).select_from(Draw).where(Draw.draw_datetime <= before, Draw.notified.is_not(True))
+        )
+
+    @staticmethod
+    async def get_with_game(session: AsyncSession, draw_id: int, draw_datetime: datetime | None = None) -> Draw | None:
+        """Pass ``draw_datetime`` when known: it is the partition key, so the lookup touches one month."""
+        stmt = select(Draw).options(joinedload(Draw.game), lazyload(Draw.results)).where(Draw.id == draw_id)
+        if draw_datetime is None:
+            return await recent_first(session, stmt, Draw.draw_datetime)
+        res = await session.execute(stmt.where(Draw.draw_datetime == draw_datetime))
+        return res.scalars().first()
 
     @staticmethod
     async def create(session: AsyncSession, game_id: int, draw_datetime) -> Draw:
-        draw = Draw(game_id=game_id, draw_datetime=draw_datetime)
-        session.add(draw)
-        await session.flush()
-        await session.refresh(draw)
-        return draw
+        # a new draw has no results, so skip loading the collection after RETURNING
+        res = await session.execute(
+            insert(Draw)
+            .values(game_id=game_id, draw_datetime=draw_datetime)
+            .returning(Draw)
+            .options(noload(Draw.results))
+        )
+        return res.scalar_one()
@@ -1,8 +1,10 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import insert, select
+from ..core.tracing import traced
 from ..models.game import Game
 
 
+@traced
 class GameRepository:
     @staticmethod
     async def list(session: AsyncSession) -> list[Game]:
@@ -16,8 +18,5 @@ class GameRepository:
 
     @staticmethod
     async def create(session: AsyncSession, name: str, description: str | None) -> Game:
-        game = Game(name=name, description=description)
-        session.add(game)
-        await session.flush()
-        await session.refresh(game)
-        return game
+        res = await session.execute(insert(Game).values(name=name, description=description).returning(Game))
+        return res.scalar_one()
@@ -1,8 +1,10 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import insert, select
+from ..core.tracing import traced
 from ..models.manager import Manager
 
 
+@traced
 class ManagerRepository:
     @staticmethod
     async def get_by_email(session: AsyncSession, email: str) -> Manager | None:
@@ -11,11 +13,10 @@ class ManagerRepository:
 
     @staticmethod
     async def create(session: AsyncSession, email: str, hashed_password: str, phone: str | None = None) -> Manager:
-        manager = Manager(email=email, hashed_password=hashed_password, phone=phone)
-        session.add(manager)
-        await session.flush()
-        await session.refresh(manager)
-        return manager
+        res = await session.execute(
+            insert(Manager).values(email=email, hashed_password=hashed_password, phone=phone).returning(Manager)
+        )
+        return res.scalar_one()
 
     @staticmethod
     async def get(session: AsyncSession, manager_id: int) -> Manager | None:
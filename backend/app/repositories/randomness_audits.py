@@ -0,0 +1,19 @@
+from datetime import datetime
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.tracing import traced
+from ..models.randomness_audit import RandomnessAudit
+
+
+@traced
+class RandomnessAuditRepository:
+    @staticmethod
+    async def bulk_create(session: AsyncSession, rows: list[dict]) -> None:
+        if rows:
+            await session.execute(insert(RandomnessAudit).values(rows))
+
+    @staticmethod
+    async def latest_created_at(session: AsyncSession) -> datetime | None:
+        return (await session.execute(select(func.max(RandomnessAudit.created_at)))).scalar_one()
@@ -1,25 +1,55 @@
+from datetime import datetime
+
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..core.tracing import traced
 from ..models.result_approval import ResultApproval
 
 
+@traced
 class ResultApprovalRepository:
     @staticmethod
     async def create(
         *,
         session: AsyncSession,
         result_id: int,
+        draw_datetime: datetime,
         manager_id: int,
         decision: str,
         note: str | None,
     ) -> ResultApproval:
-        approval = ResultApproval(
-            result_id=result_id,
-            manager_id=manager_id,
-            decision=decision,
-            note=note,
+        res = await session.execute(
+            insert(ResultApproval)
+            .values(result_id=result_id, draw_datetime=draw_datetime, manager_id=manager_id, decision=decision, note=note)
+            .returning(ResultApproval)
+        )
+        return res.scalar_one()
+
+    @staticmethod
+    async def bulk_create(session: AsyncSession, rows: list[dict]) -> None:
+        """Insert all approvals in one multi-row INSERT."""
+        if rows:
+            await session.execute(insert(ResultApproval).values(rows))
+
+    @staticmethod
+    async def list_for_result(session: AsyncSession, result_id: int, draw_datetime: datetime) -> list[ResultApproval]:
+        res = await session.execute(
+            select(ResultApproval)
+            .where(ResultApproval.result_id == result_id, ResultApproval.draw_datetime == draw_datetime)
+            .order_by(ResultApproval.id)
         )
-        session.add(approval)
-        await session.flush()
-        await session.refresh(approval)
-        return approval
+        return list(res.scalars().all())
+
+    @staticmethod
+    async def list_for_results(
+        session: AsyncSession, result_ids: list[int], since: datetime | None = None
+    ) -> list[ResultApproval]:
+        """``since`` bounds the partition key like the listing the ids came from."""
+        if not result_ids:
+            return []
+        stmt = select(ResultApproval).where(ResultApproval.result_id.in_(result_ids)).order_by(ResultApproval.id)
+        if since is not None:
+            stmt = stmt.where(ResultApproval.draw_datetime >= since)
+        res = await session.execute(stmt)
+        return list(res.scalars().all())
@@ -1,21 +1,74 @@
+from __future__ import annotations
+
+from datetime import datetime
+
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import case, insert, select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import contains_eager, noload, selectinload
 
+from ..core.tracing import traced
+from ..db.partitioning import recent_cutoff, recent_first
 from ..models.result import Result
 from ..models.draw import Draw
+from ..models.game import Game
 
 
+@traced
 class ResultRepository:
     @staticmethod
-    async def list(session: AsyncSession) -> list[Result]:
-        res = await session.execute(
+    def _with_draw():
+        # the join matches (draw_id, draw_datetime), so each result reaches only its draw's partition
+        return (
             select(Result)
+            .join(Result.draw)
             .options(
                 selectinload(Result.approvals),
-                selectinload(Result.draw).selectinload(Draw.game),
+                contains_eager(Result.draw).joinedload(Draw.game),
             )
+        )
+
+    @staticmethod
+    async def list(session: AsyncSession, since: datetime | None = None) -> list[Result]:
+        stmt = ResultRepository._with_draw().order_by(Result.created_at.desc())
+        if since is not None:
+            # draw_datetime is the partition key of both tables, so this prunes old months
+            stmt = stmt.where(Result.draw_datetime >= since, Draw.draw_datetime >= since)
+        res = await session.execute(stmt)
+        return res.scalars().all()
+
+    @staticmethod
+    async def list_columns(
+        session: AsyncSession,
+        columns: list[str],
+        *,
+        with_draw: bool = False,
+        since: datetime | None = None,
+    ) -> list[Row]:
+        """Only the named Result columns; with_draw adds draw/game columns from one join."""
+        selected = [getattr(Result, name) for name in columns]
+        stmt = select(*selected).order_by(Result.created_at.desc())
+        if with_draw:
+            stmt = stmt.add_columns(
+                Draw.id.label("draw__id"),
+                Draw.draw_datetime.label("draw__draw_datetime"),
+                Draw.game_id.label("draw__game_id"),
+                Game.name.label("draw__game_name"),
+            ).join(Result.draw).join(Game, Game.id == Draw.game_id)
+            if since is not None:
+                stmt = stmt.where(Draw.draw_datetime >= since)
+        if since is not None:
+            stmt = stmt.where(Result.draw_datetime >= since)
+        res = await session.execute(stmt)
+        return list(res.all())
+
+    @staticmethod
+    async def list_by_status(session: AsyncSession, status: str, limit: int) -> list[Result]:
+        res = await session.execute(
+            ResultRepository._with_draw()
+            .where(Result.status == status)
             .order_by(Result.created_at.desc())
+            .limit(limit)
         )
         return res.scalars().all()
 
@@ -24,6 +77,7 @@ class ResultRepository:
         *,
         session: AsyncSession,
         draw_id: int,
+        draw_datetime: datetime,
         winning_numbers: str,
         machine_numbers: str | None,
         share_copy: str,
@@ -31,27 +85,153 @@ class ResultRepository:
         share_targets: str | None,
         submitted_by_id: int | None,
     ) -> Result:
-        result = Result(
-            draw_id=draw_id,
-            winning_numbers=winning_numbers,
-            machine_numbers=machine_numbers,
-            share_copy=share_copy,
-            share_hashtags=share_hashtags,
-            share_targets=share_targets,
-            submitted_by_id=submitted_by_id,
+        # one INSERT ... RETURNING; a new result has no approvals to load
+        res = await session.execute(
+            insert(Result)
+            .values(
+                draw_id=draw_id,
+                draw_datetime=draw_datetime,
+                winning_numbers=winning_numbers,
+                machine_numbers=machine_numbers,
+                share_copy=share_copy,
+                share_hashtags=share_hashtags,
+                share_targets=share_targets,
+                submitted_by_id=submitted_by_id,
+            )
+            .returning(Result)
+            .options(noload(Result.approvals))
+        )
+        return res.scalar_one()
+
+    @staticmethod
+    async def update_status(
+        *,
+        session: AsyncSession,
+        result_id: int,
+        status: str,
+        verified: bool,
+        verified_at: datetime | None,
+    ) -> Result | None:
+        """UPDATE ... RETURNING; relationships are left for the caller to attach."""
+        return await recent_first(
+            session,
+            update(Result)
+            .where(Result.id == result_id)
+            .values(status=status, verified=verified, verified_at=verified_at)
+            .returning(Result)
+            .options(noload(Result.approvals)),
+            Result.draw_datetime,
         )
-        session.add(result)
-        await session.flush()
-        return await ResultRepository.get(session, result.id)
 
     @staticmethod
     async def get(session: AsyncSession, result_id: int) -> Result | None:
+        stmt = ResultRepository._with_draw().where(Result.id == result_id)
+        return await recent_first(session, stmt, Result.draw_datetime, Draw.draw_datetime)
+
+    @staticmethod
+    async def partition_keys(session: AsyncSession, result_ids: list[int]) -> dict[int, datetime]:
+        """draw_datetime of each existing result, searching recent partitions first."""
+        keys: dict[int, datetime] = {}
+        cutoff = recent_cutoff()
+        for window in (Result.draw_datetime >= cutoff, Result.draw_datetime < cutoff):
+            missing = [result_id for result_id in result_ids if result_id not in keys]
+            if not missing:
+                break
+            res = await session.execute(
+                select(Result.id, Result.draw_datetime).where(Result.id.in_(missing), window)
+            )
+            keys.update(res.all())
+        return keys
+
+    @staticmethod
+    async def bulk_update_status(
+        session: AsyncSession,
+        *,
+        approved_ids: list[int],
+        rejected_ids: list[int],
+        draw_datetimes: list[datetime],
+        verified_at: datetime,
+    ) -> None:
+        """Apply approve/reject decisions to many results with one UPDATE.
+
+        ``draw_datetimes`` are the results' partition keys, so only their months are touched.
+        """
+        if not approved_ids and not rejected_ids:
+            return
+        is_approved = Result.id.in_(approved_ids)
+        await session.execute(
+            update(Result)
+            .where(Result.id.in_(approved_ids + rejected_ids), Result.draw_datetime.in_(set(draw_datetimes)))
+            .values(
+                status=case((is_approved, "approved"), else_="changes_requested"),
+                verified=case((is_approved, True), else_=False),
+                verified_at=case((is_approved, verified_at), else_=None),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    async def list_approved(
+        session: AsyncSession,
+        *,
+        game_id: int | None = None,
+        draw_from: datetime | None = None,
+        draw_to: datetime | None = None,
+        limit: int | None = None,
+    ) -> list[Row]:
+        """Flat rows of approved results with their draw and game, newest draw first."""
+        stmt = (
+            select(
+                Result.id,
+                Result.draw_id,
+                Result.winning_numbers,
+                Result.machine_numbers,
+                Result.verified_at,
+                Draw.game_id,
+                Draw.draw_datetime,
+                Game.name.label("game_name"),
+            )
+            .join(Result.draw)
+            .join(Game, Game.id == Draw.game_id)
+            .where(Result.status == "approved")
+            .order_by(Draw.draw_datetime.desc(), Result.id.desc())
+        )
+        if game_id is not None:
+            stmt = stmt.where(Draw.game_id == game_id)
+        # bounded on both tables so each prunes its own partitions
+        if draw_from is not None:
+            stmt = stmt.where(Result.draw_datetime >= draw_from, Draw.draw_datetime >= draw_from)
+        if draw_to is not None:
+            stmt = stmt.where(Result.draw_datetime < draw_to, Draw.draw_datetime < draw_to)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        res = await session.execute(stmt)
+        return list(res.all())
+
+    @staticmethod
+    async def draw_keys(session: AsyncSession, keys: dict[int, datetime]) -> list[Row]:
+        """(game_id, draw_datetime) of each result, whatever its status; ``keys`` as from partition_keys."""
+        if not keys:
+            return []
         res = await session.execute(
-            select(Result)
-            .options(
-                selectinload(Result.approvals),
-                selectinload(Result.draw).selectinload(Draw.game),
+            select(Draw.game_id, Draw.draw_datetime)
+            .select_from(Result)
+            .join(Result.draw)
+            .where(
+                Result.id.in_(list(keys)),
+                Result.draw_datetime.in_(set(keys.values())),
+                Draw.draw_datetime.in_(set(keys.values())),
             )
-            .where(Result.id == result_id)
         )
-        return res.scalars().first()
+        return list(res.all())
+
+    @staticmethod
+    async def approved_draw_keys(session: AsyncSession) -> list[Row]:
+        """(game_id, draw_datetime) of every approved result; used for full rebuilds."""
+        res = await session.execute(
+            select(Draw.game_id, Draw.draw_datetime)
+            .select_from(Result)
+            .join(Result.draw)
+            .where(Result.status == "approved")
+        )
+        return list(res.all())
@@ -0,0 +1,99 @@
+from datetime import datetime
+
+from sqlalchemy import and_, insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.tracing import traced
+from ..models.social_post import SocialPost
+
+
+@traced
+class SocialPostRepository:
+    @staticmethod
+    async def get(session: AsyncSession, idempotency_key: str, platform: str) -> SocialPost | None:
+        res = await session.execute(
+            select(SocialPost).where(
+                SocialPost.idempotency_key == idempotency_key, SocialPost.platform == platform
+            )
+        )
+        return res.scalars().first()
+
+    @staticmethod
+    async def digests_for_key(session: AsyncSession, idempotency_key: str) -> set[str]:
+        res = await session.execute(
+            select(SocialPost.request_digest).where(SocialPost.idempotency_key == idempotency_key).distinct()
+        )
+        return set(res.scalars().all())
+
+    @staticmethod
+    async def latest_auto(session: AsyncSession, request_digest: str, platform: str) -> SocialPost | None:
+        """The newest post keyed automatically (no Idempotency-Key) for this content and platform."""
+        res = await session.execute(
+            select(SocialPost)
+            .where(
+                SocialPost.request_digest == request_digest,
+                SocialPost.platform == platform,
+                SocialPost.idempotency_key.startswith("auto:"),
+            )
+            .order_by(SocialPost.id.desc())
+            .limit(1)
+        )
+        return res.scalars().first()
+
+    @staticmethod
+    async def create_pending(
+        session: AsyncSession, *, idempotency_key: str, request_digest: str, result_id: int, platform: str
+    ) -> SocialPost:
+        """Raises IntegrityError when another request already holds this key."""
+        res = await session.execute(
+            insert(SocialPost)
+            .values(
+                idempotency_key=idempotency_key,
+                request_digest=request_digest,
+                result_id=result_id,
+                platform=platform,
+                status="pending",
+            )
+            .returning(SocialPost)
+        )
+        return res.scalar_one()
+
+    @staticmethod
+    async def claim_retry(session: AsyncSession, post_id: int, stale_before: datetime) -> bool:
+        """Moves a failed (or abandoned pending) post back to pending; False if someone else did."""
+        res = await session.execute(
+            update(SocialPost)
+            .where(
+                SocialPost.id == post_id,
+                or_(
+                    SocialPost.status == "failed",
+                    and_(SocialPost.status == "pending", SocialPost.updated_at < stale_before),
+                ),
+            )
+            .values(status="pending", post_id=None, message=None, latency_ms=None)
+            .execution_options(synchronize_session=False)
+        )
+        return res.rowcount == 1
+
+    @staticmethod
+    async def record_outcome(
+        session: AsyncSession,
+        post_id: int,
+        *,
+        status: str,
+        external_id: str | None,
+        message: str,
+        latency_ms: int,
+    ) -> None:
+        await session.execute(
+            update(SocialPost)
+            .where(SocialPost.id == post_id)
+            .values(status=status, post_id=external_id, message=message, latency_ms=latency_ms)
+        )
+
+    @staticmethod
+    async def list_for_result(session: AsyncSession, result_id: int) -> list[SocialPost]:
+        res = await session.execute(
+            select(SocialPost).where(SocialPost.result_id == result_id).order_by(SocialPost.id)
+        )
+        return list(res.scalars().all())
@@ -0,0 +1,17 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from .draw import DrawRead
+from .game import GameRead
+from .result import ResultRead
+
+
+class BootstrapRead(BaseModel):
+    server_time: datetime
+    draws_from: datetime
+    draws_to: datetime
+    games: list[GameRead]
+    draws: list[DrawRead]
+    pending_results: list[ResultRead]
+    latest_results: list[ResultRead]
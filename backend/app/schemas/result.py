@@ -71,6 +71,17 @@ class ResultVerify(BaseModel):
     note: Optional[str] = None
 
 
+class ResultBulkVerifyItem(ResultVerify):
+    result_id: int
+
+
+class ResultBulkVerifyOutcome(BaseModel):
+    result_id: int
+    success: bool
+    message: str
+    status: Optional[str] = None
+
+
 class ResultRead(BaseModel):
     id: int
     draw_id: int
@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from pydantic import BaseModel
 from typing import Optional
 
@@ -15,3 +17,20 @@ class SocialPostResponse(BaseModel):
     success: bool
     message: str
     post_id: Optional[str] = None
+    # True when the stored outcome of an earlier request with the same key was returned
+    replayed: bool = False
+
+
+class SocialPostRead(BaseModel):
+    id: int
+    result_id: int
+    platform: str
+    status: str
+    post_id: Optional[str] = None
+    message: Optional[str] = None
+    latency_ms: Optional[int] = None
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
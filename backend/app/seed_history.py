@@ -0,0 +1,345 @@
+"""Generate years of synthetic draw history for load testing.
+
+Draws follow each game's real weekly schedule and shutoff time, results use
+the 5 winning + 5 machine numbers (1-90) format, and approvals are attached
+to every result older than the pending window. The same ``--seed`` and
+``--end`` on the same starting database always produce the same rows. Draws
+that already exist for a game at the same time are skipped, so running it
+again (or with a later ``--end``) only adds what is missing.
+
+Run with:
+    docker compose exec api python -m app.seed_history --years 3 --seed 42
+    docker compose exec api python -m app.seed_history --years 5 --game-copies 20 --workers 8
+"""
+
+import argparse
+import asyncio
+import random
+import re
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from .db.partitioning import ensure_partitions
+from .db.session import engine
+from .models import Base, Draw, Game, Manager, Result, ResultApproval
+from .seed_games import GAMES
+from .services.auth import AuthService
+
+WEEKDAYS = ["MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY", "SATURDAY", "SUNDAY"]
+
+# Games whose draw day is not spelled out in the name
+GAME_WEEKDAYS = {
+    "MID-WEEK": [2],
+    "NATIONAL": [5],
+    "ASEDA": [6],
+    "GOLDEN SOUVENIR": [1],
+    "ENDOWMENT LOTTO": [3],
+    "SAMEDI SOIR": [5],
+    "STAR LOTTO": [6],
+}
+
+WINNING_COUNT = 5
+MACHINE_COUNT = 5
+MAX_NUMBER = 90
+ROWS_PER_STATEMENT = 500
+
+
+@dataclass
+class GameSchedule:
+    game_id: int
+    name: str
+    weekdays: list[int]
+    draw_time: tuple[int, int]
+
+
+@dataclass
+class Chunk:
+    schedule: GameSchedule
+    draw_datetimes: list[datetime]
+    first_draw_id: int
+    first_result_id: int
+
+
+def parse_schedule(game_id: int, name: str, description: str | None) -> GameSchedule:
+    weekdays = GAME_WEEKDAYS.get(name)
+    if weekdays is None:
+        weekdays = [index for index, day in enumerate(WEEKDAYS) if day in name.split()] or list(range(7))
+    draw_time = (19, 15)
+    match = re.search(r"(\d{1,2}):(\d{2})\s*(am|pm)", description or "", re.IGNORECASE)
+    if match:
+        hour, minute, meridiem = int(match.group(1)), int(match.group(2)), match.group(3).lower()
+        hour = hour % 12 + (12 if meridiem == "pm" else 0)
+        draw_time = (hour, minute)
+    return GameSchedule(game_id=game_id, name=name, weekdays=weekdays, draw_time=draw_time)
+
+
+def draw_datetimes(schedule: GameSchedule, start: date, end: date) -> list[datetime]:
+    hour, minute = schedule.draw_time
+    days = (end - start).days
+    return [
+        datetime.combine(start + timedelta(days=offset), datetime.min.time()).replace(hour=hour, minute=minute)
+        for offset in range(days)
+        if (start + timedelta(days=offset)).weekday() in schedule.weekdays
+    ]
+
+
+def build_rows(chunk: Chunk, seed: int, results_per_draw: int, manager_ids: list[int], pending_after: datetime):
+    # Seed per chunk so output does not depend on how chunks are scheduled
+    rng = random.Random(f"{seed}:{chunk.schedule.name}:{chunk.first_draw_id}")
+    draws, results, approvals = [], [], []
+    result_id = chunk.first_result_id
+    for offset, draw_at in enumerate(chunk.draw_datetimes):
+        draw_id = chunk.first_draw_id + offset
+        # timestamptz columns get aware values; draw_datetime is naive like the API stores it
+        draw_utc = draw_at.replace(tzinfo=timezone.utc)
+        created = draw_utc - timedelta(days=rng.randint(1, 14))
+        draws.append(
+            {
+                "id": draw_id,
+                "game_id": chunk.schedule.game_id,
+                "draw_datetime": draw_at,
+                "notified": True,
+                "created_at": created,
+                "updated_at": draw_utc,
+            }
+        )
+        for _ in range(results_per_draw):
+            numbers = rng.sample(range(1, MAX_NUMBER + 1), WINNING_COUNT + MACHINE_COUNT)
+            winning = ",".join(map(str, numbers[:WINNING_COUNT]))
+            machine = ",".join(map(str, numbers[WINNING_COUNT:]))
+            submitted_at = draw_utc + timedelta(minutes=rng.randint(5, 45))
+            approved = draw_at < pending_after
+            verified_at = submitted_at + timedelta(minutes=rng.randint(2, 30)) if approved else None
+            submitter = rng.choice(manager_ids)
+            results.append(
+                {
+                    "id": result_id,
+                    "draw_id": draw_id,
+                    "draw_datetime": draw_at,
+                    "winning_numbers": winning,
+                    "machine_numbers": machine,
+                    "share_copy": (
+                        f"Rand Lottery {chunk.schedule.name} Results\n"
+                        f"Draw: {draw_at:%Y-%m-%d %H:%M}\n"
+                        f"Winning Numbers: {winning.replace(',', ', ')}\n"
+                        f"Machine Numbers: {machine.replace(',', ', ')}"
+                    ),
+                    "share_hashtags": "RandLottery",
+                    "share_targets": "facebook,instagram,twitter,whatsapp,telegram",
+                    "status": "approved" if approved else "pending_review",
+                    "verified": approved,
+                    "verified_at": verified_at,
+                    "submitted_by_id": submitter,
+                    "created_at": submitted_at,
+                    "updated_at": verified_at or submitted_at,
+                }
+            )
+            if approved:
+                approvals.append(
+                    {
+                        "result_id": result_id,
+                        "draw_datetime": draw_at,
+                        "manager_id": rng.choice([m for m in manager_ids if m != submitter] or manager_ids),
+                        "decision": "approved",
+                        "note": None,
+                        "created_at": verified_at,
+                        "updated_at": verified_at,
+                    }
+                )
+            result_id += 1
+    return draws, results, approvals
+
+
+async def _insert_rows(conn, table, rows: list[dict]) -> None:
+    for offset in range(0, len(rows), ROWS_PER_STATEMENT):
+        await conn.execute(insert(table).values(rows[offset : offset + ROWS_PER_STATEMENT]))
+
+
+async def _write_chunk(db_engine: AsyncEngine, rows, use_copy: bool) -> int:
+    # parents before children inside one transaction keeps FKs satisfied
+    tables = [(table, table_rows) for table, table_rows in zip((Draw, Result, ResultApproval), rows) if table_rows]
+    if use_copy:
+        async with db_engine.connect() as conn:
+            driver = (await conn.get_raw_connection()).driver_connection
+            async with driver.transaction():
+                for table, table_rows in tables:
+                    columns = list(table_rows[0])
+                    await driver.copy_records_to_table(
+                        table.__tablename__,
+                        records=[tuple(row[column] for column in columns) for row in table_rows],
+                        columns=columns,
+                    )
+    else:
+        async with db_engine.begin() as conn:
+            for table, table_rows in tables:
+                await _insert_rows(conn, table, table_rows)
+    return sum(len(table_rows) for _, table_rows in tables)
+
+
+async def _ensure_catalog(db_engine: AsyncEngine, game_copies: int, managers: int) -> tuple[list[GameSchedule], list[int]]:
+    async with db_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        existing = {row.name: row for row in (await conn.execute(select(Game.id, Game.name))).all()}
+        wanted = []
+        for copy in range(game_copies + 1):
+            for name, description in GAMES:
+                wanted.append((name if copy == 0 else f"{name} #{copy}", name, description))
+        missing = [
+            {"name": full_name, "description": description}
+            for full_name, _, description in wanted
+            if full_name not in existing
+        ]
+        if missing:
+            await conn.execute(Game.__table__.insert(), missing)
+        games = {row.name: row.id for row in (await conn.execute(select(Game.id, Game.name))).all()}
+
+        emails = [f"loadtest{index}@rand.test" for index in range(1, managers + 1)]
+        known = set((await conn.execute(select(Manager.email).where(Manager.email.in_(emails)))).scalars())
+        hashed = AuthService.get_password_hash("loadtest")
+        new_managers = [{"email": email, "hashed_password": hashed, "is_active": False} for email in emails if email not in known]
+        if new_managers:
+            await conn.execute(Manager.__table__.insert(), new_managers)
+        manager_ids = list((await conn.execute(select(Manager.id).where(Manager.email.in_(emails)))).scalars())
+
+    schedules = [parse_schedule(games[full_name], base_name, description) for full_name, base_name, description in wanted]
+    # keep the copy suffix out of schedule lookup but in the share copy
+    for schedule, (full_name, _, _) in zip(schedules, wanted):
+        schedule.name = full_name
+    return schedules, sorted(manager_ids)
+
+
+async def _existing_draws(db_engine: AsyncEngine, game_ids: list[int], start: date, end: date) -> set[tuple[int, datetime]]:
+    async with db_engine.connect() as conn:
+        rows = await conn.execute(
+            select(Draw.game_id, Draw.draw_datetime).where(
+                Draw.game_id.in_(game_ids),
+                Draw.draw_datetime >= datetime.combine(start, datetime.min.time()),
+                Draw.draw_datetime < datetime.combine(end, datetime.min.time()),
+            )
+        )
+        return {(row.game_id, row.draw_datetime) for row in rows}
+
+
+async def _next_ids(db_engine: AsyncEngine) -> tuple[int, int]:
+    async with db_engine.connect() as conn:
+        draw_max = await conn.scalar(select(func.coalesce(func.max(Draw.id), 0)))
+        result_max = await conn.scalar(select(func.coalesce(func.max(Result.id), 0)))
+    return draw_max + 1, result_max + 1
+
+
+async def _sync_sequences(db_engine: AsyncEngine) -> None:
+    if db_engine.dialect.name != "postgresql":
+        return
+    async with db_engine.begin() as conn:
+        for table in ("draws", "results"):
+            await conn.execute(
+                text(
+                    f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                    f"(SELECT COALESCE(MAX(id), 1) FROM {table}))"
+                )
+            )
+
+
+async def generate(
+    *,
+    db_engine: AsyncEngine,
+    years: float,
+    seed: int,
+    end: date,
+    game_copies: int = 0,
+    results_per_draw: int = 1,
+    managers: int = 8,
+    pending_days: int = 1,
+    workers: int = 4,
+    chunk_draws: int = 2000,
+) -> dict:
+    schedules, manager_ids = await _ensure_catalog(db_engine, game_copies, managers)
+    start = end - timedelta(days=int(years * 365))
+    async with db_engine.begin() as conn:
+        # history may reach back before the months created when the tables were partitioned
+        await ensure_partitions(conn, start, end)
+    pending_after = datetime.combine(end, datetime.min.time()) - timedelta(days=pending_days)
+    next_draw_id, next_result_id = await _next_ids(db_engine)
+    existing = await _existing_draws(db_engine, [schedule.game_id for schedule in schedules], start, end)
+
+    chunks: list[Chunk] = []
+    for schedule in schedules:
+        moments = [
+            moment for moment in draw_datetimes(schedule, start, end) if (schedule.game_id, moment) not in existing
+        ]
+        for offset in range(0, len(moments), chunk_draws):
+            part = moments[offset : offset + chunk_draws]
+            chunks.append(Chunk(schedule, part, next_draw_id, next_result_id))
+            next_draw_id += len(part)
+            next_result_id += len(part) * results_per_draw
+
+    use_copy = db_engine.dialect.name == "postgresql" and db_engine.dialect.driver == "asyncpg"
+    if db_engine.dialect.name == "sqlite":
+        workers = 1  # SQLite allows a single writer
+    semaphore = asyncio.Semaphore(workers)
+    totals = {"rows": 0}
+    started = time.perf_counter()
+
+    async def run_chunk(chunk: Chunk) -> None:
+        async with semaphore:
+            rows = build_rows(chunk, seed, results_per_draw, manager_ids, pending_after)
+            # awaited first: `+=` around an await would lose counts of chunks finishing meanwhile
+            written = await _write_chunk(db_engine, rows, use_copy)
+            totals["rows"] += written
+
+    await asyncio.gather(*(run_chunk(chunk) for chunk in chunks))
+    await _sync_sequences(db_engine)
+    elapsed = time.perf_counter() - started
+    draws = sum(len(chunk.draw_datetimes) for chunk in chunks)
+    return {
+        "games": len(schedules),
+        "draws": draws,
+        "results": draws * results_per_draw,
+        "rows": totals["rows"],
+        "seconds": round(elapsed, 2),
+        "rows_per_second": round(totals["rows"] / elapsed) if elapsed else 0,
+        "method": "copy" if use_copy else "multi-row insert",
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate synthetic draw history for load testing")
+    parser.add_argument("--years", type=float, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--end", type=date.fromisoformat, default=date.today(), help="last day (exclusive), YYYY-MM-DD")
+    parser.add_argument("--game-copies", type=int, default=0, help="extra copies of the catalog to scale volume")
+    parser.add_argument("--results-per-draw", type=int, default=1)
+    parser.add_argument("--managers", type=int, default=8)
+    parser.add_argument("--pending-days", type=int, default=1, help="recent draws left pending review")
+    parser.add_argument("--workers", type=int, default=4, help="parallel writer connections")
+    parser.add_argument("--chunk-draws", type=int, default=2000, help="draws per write transaction")
+    return parser.parse_args(argv)
+
+
+async def main(argv=None):
+    args = parse_args(argv)
+    report = await generate(
+        db_engine=engine,
+        years=args.years,
+        seed=args.seed,
+        end=args.end,
+        game_copies=args.game_copies,
+        results_per_draw=args.results_per_draw,
+        managers=args.managers,
+        pending_days=args.pending_days,
+        workers=args.workers,
+        chunk_draws=args.chunk_draws,
+    )
+    await engine.dispose()
+    print(
+        f"Generated {report['draws']} draws and {report['results']} results for {report['games']} games: "
+        f"{report['rows']} rows in {report['seconds']}s ({report['rows_per_second']} rows/s, {report['method']})"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
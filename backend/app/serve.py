@@ -0,0 +1,77 @@
+"""Production entry point: multi-worker uvicorn with uvloop and httptools.
+
+Run with:
+    python -m app.serve
+
+Workers default to the CPUs available to the container (affinity and cgroup
+quota), overridable with WEB_CONCURRENCY. Each worker has its own DB pool,
+so the database sees up to ``workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW)``
+connections. On SIGTERM uvicorn stops accepting connections, waits up to
+SHUTDOWN_GRACE_SECONDS for in-flight requests, then runs the app lifespan
+shutdown, which drains background jobs and closes engines and HTTP clients.
+"""
+
+import math
+import os
+
+import uvicorn
+
+from .core.config import settings
+
+
+def _cgroup_cpu_limit() -> float | None:
+    # cgroup v2 ("max 100000" when unlimited), then v1
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as handle:
+            quota, period = handle.read().split()
+        if quota != "max":
+            return int(quota) / int(period)
+        return None
+    except (OSError, ValueError):
+        pass
+    try:
+        with open("/sys/fs/cgroup/cpu/cpu.cfs_quota_us") as handle:
+            quota = int(handle.read())
+        with open("/sys/fs/cgroup/cpu/cpu.cfs_period_us") as handle:
+            period = int(handle.read())
+        return quota / period if quota > 0 else None
+    except (OSError, ValueError):
+        return None
+
+
+def available_cpus() -> int:
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    limit = _cgroup_cpu_limit()
+    if limit:
+        cpus = min(cpus, math.ceil(limit))
+    return max(1, cpus)
+
+
+def worker_count() -> int:
+    # async workers are CPU-bound only while serialising, so one per CPU is enough
+    return settings.web_concurrency if settings.web_concurrency > 0 else available_cpus()
+
+
+def main() -> None:
+    workers = worker_count()
+    print(f"Starting {workers} worker(s) on {settings.host}:{settings.port}", flush=True)
+    uvicorn.run(
+        "app.main:app",
+        host=settings.host,
+        port=settings.port,
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        # X-Forwarded-For only from the proxy itself, so request.client is the real caller
+        proxy_headers=True,
+        forwarded_allow_ips=settings.forwarded_allow_ips,
+        timeout_graceful_shutdown=int(math.ceil(settings.shutdown_grace_seconds)),
+        access_log=settings.app_debug,
+    )
+
+
+if __name__ == "__main__":
+    main()
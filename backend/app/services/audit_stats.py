@@ -0,0 +1,125 @@
+"""Vectorised randomness statistics for one game's draw history.
+
+Everything works on an integer array of shape ``(histories, draws, k)``: the
+observed history is a batch of one, and Monte Carlo null histories (k distinct
+numbers drawn uniformly from 1..N per draw) are generated and scored in
+chunks with the same code, so p-values need no distribution tables.
+
+Imported lazily by ``app.services.randomness_audit``; requires NumPy.
+"""
+
+import math
+
+import numpy as np
+
+# keep each simulated chunk's presence matrix around this many cells
+CHUNK_CELLS = 20_000_000
+
+
+def simulate(rng: np.random.Generator, histories: int, draws: int, k: int, n: int) -> np.ndarray:
+    """Uniform draws of k distinct numbers from 1..n, by resampling rows that repeat a number."""
+    sample = rng.integers(1, n + 1, size=(histories, draws, k))
+    while True:
+        ordered = np.sort(sample, axis=2)
+        repeated = (np.diff(ordered, axis=2) == 0).any(axis=2)
+        if not repeated.any():
+            return sample
+        sample[repeated] = rng.integers(1, n + 1, size=(int(repeated.sum()), k))
+
+
+def chi_square_uniformity(sample: np.ndarray, n: int) -> np.ndarray:
+    histories, draws, k = sample.shape
+    offsets = (np.arange(histories) * (n + 1))[:, None, None]
+    counts = np.bincount((sample + offsets).ravel(), minlength=histories * (n + 1)).reshape(histories, n + 1)[:, 1:]
+    expected = draws * k / n
+    return ((counts - expected) ** 2 / expected).sum(axis=1)
+
+
+def runs_test(sample: np.ndarray) -> np.ndarray:
+    """|z| of the Wald-Wolfowitz runs test on draw sums above/below their median."""
+    sums = sample.sum(axis=2).astype(float)
+    above = sums > np.median(sums, axis=1, keepdims=True)
+    n1 = above.sum(axis=1).astype(float)
+    n2 = above.shape[1] - n1
+    runs = 1 + (above[:, 1:] != above[:, :-1]).sum(axis=1)
+    total = n1 + n2
+    mean = 2 * n1 * n2 / total + 1
+    variance = 2 * n1 * n2 * (2 * n1 * n2 - total) / (total**2 * (total - 1))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = np.where(variance > 0, (runs - mean) / np.sqrt(variance), 0.0)
+    return np.abs(z)
+
+
+def serial_correlation(sample: np.ndarray, lag: int = 1) -> np.ndarray:
+    """|lag-k autocorrelation| of draw sums."""
+    sums = sample.sum(axis=2).astype(float)
+    centered = sums - sums.mean(axis=1, keepdims=True)
+    denominator = (centered**2).sum(axis=1)
+    numerator = (centered[:, :-lag] * centered[:, lag:]).sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.abs(np.where(denominator > 0, numerator / denominator, 0.0))
+
+
+def gap_bins(k: int, n: int) -> int:
+    # last bin collects gaps >= bins; sized so it holds ~5% of the mass
+    p = k / n
+    return max(2, 1 + math.ceil(math.log(0.05) / math.log(1 - p)))
+
+
+def gap_test(sample: np.ndarray, n: int, bins: int) -> np.ndarray:
+    """Chi-square of pooled gaps between appearances of each number against the geometric law."""
+    histories, draws, k = sample.shape
+    presence = np.zeros((histories, n, draws), dtype=bool)
+    h_index = np.repeat(np.arange(histories), draws * k)
+    d_index = np.tile(np.repeat(np.arange(draws), k), histories)
+    presence[h_index, sample.ravel() - 1, d_index] = True
+
+    history, number, position = np.nonzero(presence)
+    same_series = (history[1:] == history[:-1]) & (number[1:] == number[:-1])
+    gaps = np.minimum(np.diff(position)[same_series], bins)
+    owners = history[1:][same_series]
+    hist = np.bincount(owners * (bins + 1) + gaps, minlength=histories * (bins + 1)).reshape(histories, bins + 1)[:, 1:]
+
+    p = k / n
+    probabilities = p * (1 - p) ** np.arange(bins - 1)
+    probabilities = np.append(probabilities, (1 - p) ** (bins - 1))
+    expected = hist.sum(axis=1, keepdims=True) * probabilities
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(expected > 0, (hist - expected) ** 2 / expected, 0.0).sum(axis=1)
+
+
+def score(sample: np.ndarray, n: int) -> dict[str, np.ndarray]:
+    k = sample.shape[2]
+    return {
+        "chi_square": chi_square_uniformity(sample, n),
+        "runs": runs_test(sample),
+        "serial_correlation": serial_correlation(sample),
+        "gap": gap_test(sample, n, gap_bins(k, n)),
+    }
+
+
+def audit(observed: np.ndarray, n: int, simulations: int, seed: int) -> dict[str, tuple[float, float]]:
+    """{test: (statistic, Monte Carlo p-value)} for one history of shape (draws, k).
+
+    Every statistic grows with departure from uniformity, so the p-value is the
+    share of null histories scoring at least the observed value.
+    """
+    draws, k = observed.shape
+    observed_scores = {name: float(values[0]) for name, values in score(observed[None], n).items()}
+    exceed = dict.fromkeys(observed_scores, 0)
+    rng = np.random.default_rng(seed)
+    chunk = max(1, CHUNK_CELLS // max(1, draws * n))
+    done = 0
+    while done < simulations:
+        batch = min(chunk, simulations - done)
+        for name, values in score(simulate(rng, batch, draws, k, n), n).items():
+            exceed[name] += int((values >= observed_scores[name] - 1e-12).sum())
+        done += batch
+    return {
+        name: (statistic, (1 + exceed[name]) / (1 + simulations)) for name, statistic in observed_scores.items()
+    }
+
+
+def audit_history(draws: list[tuple[int, ...]], n: int, simulations: int, seed: int) -> dict[str, tuple[float, float]]:
+    """Process-pool entry point: `audit` for a plain list of draws."""
+    return audit(np.array(draws, dtype=np.int64), n, simulations, seed)
@@ -7,6 +7,7 @@ from fastapi import HTTPException, Depends
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..core.tracing import traced
 from ..db.session import get_session
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -17,6 +18,7 @@ from ..models.manager import Manager
 pwd_ctx = CryptContext(schemes=["pbkdf2_sha256", "bcrypt_sha256", "bcrypt"], deprecated="auto")
 
 
+@traced
 class AuthService:
     @staticmethod
     def verify_password(plain: str, hashed: str) -> bool:
@@ -0,0 +1,54 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from ..core.tracing import traced
+from ..repositories.draws import DrawRepository
+from ..repositories.games import GameRepository
+from ..repositories.results import ResultRepository
+
+# pending review is normally a handful of results; the cap only guards the payload size
+MAX_PENDING_RESULTS = 200
+
+
+@traced
+class BootstrapService:
+    @staticmethod
+    async def load(
+        session_factory: async_sessionmaker,
+        *,
+        days_back: int,
+        days_ahead: int,
+        latest: int,
+    ) -> dict:
+        """Everything the dashboard needs for first paint, queried concurrently.
+
+        An AsyncSession runs one statement at a time, so each query gets its
+        own session (and pooled connection). Load shedding counts the request
+        as that many read slots (``ROUTE_WEIGHTS``); keep the two in step.
+        """
+        now = datetime.utcnow()
+        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        draws_from = today - timedelta(days=days_back)
+        draws_to = today + timedelta(days=days_ahead + 1)
+
+        async def run(query):
+            async with session_factory() as session:
+                return await query(session)
+
+        games, draws, pending, approved = await asyncio.gather(
+            run(GameRepository.list),
+            run(lambda session: DrawRepository.list(session, date_from=draws_from, date_to=draws_to)),
+            run(lambda session: ResultRepository.list_by_status(session, "pending_review", MAX_PENDING_RESULTS)),
+            run(lambda session: ResultRepository.list_by_status(session, "approved", latest)),
+        )
+        return {
+            "server_time": now,
+            "draws_from": draws_from,
+            "draws_to": draws_to,
+            "games": games,
+            "draws": draws,
+            "pending_results": pending,
+            "latest_results": approved,
+        }
@@ -1,7 +1,10 @@
 import asyncio
-from datetime import datetime
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from itertools import groupby
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.exc import ProgrammingError
 from ..db.session import engine
 from ..models.draw import Draw
@@ -9,76 +12,130 @@ from ..models.game import Game
 from ..models.manager import Manager
 from ..services.email import EmailService
 from ..core.config import settings
+from ..core.tracing import tracer
+
+
+@dataclass
+class NotifierHeartbeat:
+    # monotonic time the last tick completed, for readiness checks
+    last_tick: float | None = None
+    last_batch: int = 0
+
+
+heartbeat = NotifierHeartbeat()
+
+
+def render_digest(draws) -> tuple[str, str]:
+    """Subject and body of one reminder covering every draw in the batch."""
+    draws = sorted(draws, key=lambda draw: (draw.draw_datetime, draw.game_name))
+    first = draws[0]
+    date_str = first.draw_datetime.strftime("%Y-%m-%d")
+    if len(draws) == 1:
+        subject = f"Draw reminder: {first.game_name} {date_str}"
+        body_lines = [
+            "Hi team,",
+            "",
+            f"The draw for {first.game_name} is scheduled on {date_str} at {first.draw_datetime:%H:%M}.",
+            "Please log in and enter the winning and machine numbers once available.",
+        ]
+    else:
+        subject = f"Draw reminder: {len(draws)} draws from {date_str} {first.draw_datetime:%H:%M}"
+        body_lines = ["Hi team,", "", "The following draws are scheduled:", ""]
+        for slot, slot_draws in groupby(draws, key=lambda draw: draw.draw_datetime):
+            body_lines.append(f"{slot:%Y-%m-%d %H:%M}")
+            body_lines.extend(f"  - {draw.game_name}" for draw in slot_draws)
+        body_lines.extend(["", "Please log in and enter the winning and machine numbers once available."])
+    help_url = settings.help_portal_url.strip() if settings.help_portal_url else ""
+    if help_url:
+        body_lines.extend(
+            [
+                "",
+                "Need help? Use the link below to open the manager portal:",
+                help_url,
+            ]
+        )
+    body_lines.extend(["", "Thank you."])
+    return subject, "\n".join(body_lines)
+
+
+async def _notify_due_draws_once() -> bool:
+    # each tick is its own trace
+    with tracer.span("draw_notifier.tick") as span:
+        enabled = await _send_due_digest()
+        span.set_attribute("draws", heartbeat.last_batch)
+        return enabled
+
+
+async def _send_due_digest() -> bool:
+    """Sends one digest for the due draws; returns False when the notifier should stop.
+
+    Draws due within the digest window are pulled forward into the same email,
+    so games sharing a shutoff time produce one message instead of one each.
+    """
+    async with engine.begin() as conn:
+        async with AsyncSession(bind=conn) as session:
+            now = datetime.utcnow()
+            horizon = now + timedelta(seconds=settings.notifier_digest_window_seconds)
+            try:
+                stmt = await session.execute(
+                    # notified may not exist in older databases
+                    select(Draw.id, Draw.draw_datetime, Game.name.label("game_name"))
+                    .join(Game, Game.id == Draw.game_id)
+                    .where(Draw.draw_datetime <= horizon, Draw.notified.is_not(True))
+                    .order_by(Draw.draw_datetime)
+                )
+            except ProgrammingError as error:
+                message = str(error.orig or error)
+                if "UndefinedColumn" in message or "does not exist" in message:
+                    # Column missing in legacy database; disable notifier gracefully
+                    return False
+                raise
+            draws = stmt.all()
+            heartbeat.last_batch = len(draws)
+            # nothing is due yet: the upcoming ones are picked up with the first due draw
+            if not draws or draws[0].draw_datetime > now:
+                await session.commit()
+                return True
+
+            managers_stmt = await session.execute(
+                select(Manager.email).where(Manager.is_active == True)  # noqa: E712
+            )
+            recipient_emails = [email for email in managers_stmt.scalars().all() if email]
+
+            if recipient_emails:
+                subject, body_text = render_digest(draws)
+                try:
+                    await EmailService.send_email(
+                        subject=subject,
+                        recipients=recipient_emails,
+                        body=body_text,
+                    )
+                except Exception:
+                    # avoid crashing the notifier if email fails
+                    pass
+
+            await session.execute(
+                update(Draw).where(Draw.id.in_([draw.id for draw in draws])).values(notified=True)
+            )
+            await session.commit()
+    return True
 
 
 async def _notify_due_draws_loop():
     # Simple loop to check draws every 60 seconds (dev use)
     while True:
-        async with engine.begin() as conn:
-            async with AsyncSession(bind=conn) as session:
-                now = datetime.utcnow()
-                try:
-                    stmt = await session.execute(
-                        # select draws that are due; notified may not exist in older databases
-                        select(Draw).where(Draw.draw_datetime <= now)
-                    )
-                except ProgrammingError as error:
-                    message = str(error.orig or error)
-                    if "UndefinedColumn" in message or "does not exist" in message:
-                        # Column missing in legacy database; disable notifier gracefully
-                        return
-                    raise
-                draws = stmt.scalars().all()
-                if not draws:
-                    await session.commit()
-                    await asyncio.sleep(60)
-                    continue
-
-                managers_stmt = await session.execute(
-                    select(Manager).where(Manager.is_active == True)  # noqa: E712
-                )
-                managers = managers_stmt.scalars().all()
-                recipient_emails = [mgr.email for mgr in managers if mgr.email]
-
-                for draw in draws:
-                    game = await session.get(Game, draw.game_id)
-                    date_str = draw.draw_datetime.strftime("%Y-%m-%d")
-                    time_str = draw.draw_datetime.strftime("%H:%M")
-                    subject = f"Draw reminder: {game.name} {date_str}"
-                    help_url = settings.help_portal_url.strip() if settings.help_portal_url else ""
-                    body_lines = [
-                        f"Hi team,",
-                        "",
-                        f"The draw for {game.name} is scheduled on {date_str} at {time_str}.",
-                        "Please log in and enter the winning and machine numbers once available.",
-                    ]
-                    if help_url:
-                        body_lines.extend(
-                            [
-                                "",
-                                "Need help? Use the link below to open the manager portal:",
-                                help_url,
-                            ]
-                        )
-                    body_lines.extend(["", "Thank you."])
-                    body_text = "\n".join(body_lines)
-
-                    if recipient_emails:
-                        try:
-                            await EmailService.send_email(
-                                subject=subject,
-                                recipients=recipient_emails,
-                                body=body_text,
-                            )
-                        except Exception:
-                            # avoid crashing the notifier if email fails
-                            pass
-
-                    if hasattr(draw, "notified"):
-                        draw.notified = True
-                await session.commit()
+        # shielded: when the job is stopped, an in-flight batch of reminders finishes first
+        tick = asyncio.ensure_future(_notify_due_draws_once())
+        try:
+            enabled = await asyncio.shield(tick)
+        except asyncio.CancelledError:
+            await asyncio.wait([tick])
+            raise
+        heartbeat.last_tick = time.monotonic()
+        if not enabled:
+            return
         await asyncio.sleep(60)
 
 
 def start_notifier_task(loop):
-    loop.create_task(_notify_due_draws_loop())
+    return loop.create_task(_notify_due_draws_loop())
@@ -0,0 +1,109 @@
+"""In-memory index of upcoming draws for countdowns.
+
+Each worker process keeps its own copy: loaded at startup, updated by
+``DrawService.create_draw`` and reloaded periodically so draws created by
+other workers (or bulk imports) show up within ``draw_schedule_refresh_seconds``.
+Lookups are bisections over sorted lists and never touch the database.
+"""
+
+import asyncio
+import logging
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime
+
+from ..core.config import settings
+from ..db.session import SessionLocal
+from ..repositories.draws import DrawRepository
+
+logger = logging.getLogger(__name__)
+
+# (draw_datetime, draw_id, game_id); sorts by time, then id
+Entry = tuple[datetime, int, int]
+
+
+def _as_dict(entry: Entry) -> dict:
+    draw_datetime, draw_id, game_id = entry
+    return {"id": draw_id, "game_id": game_id, "draw_datetime": draw_datetime}
+
+
+class DrawSchedule:
+    def __init__(self):
+        self._all: list[Entry] = []
+        self._by_game: dict[int, list[Entry]] = {}
+        # draws added while a reload is in flight, re-applied after the swap
+        self._added_during_load: list[Entry] | None = None
+        self.loaded_at: datetime | None = None
+
+    def add(self, draw_id: int, game_id: int, draw_datetime: datetime) -> None:
+        entry = (draw_datetime, draw_id, game_id)
+        if self._added_during_load is not None:
+            self._added_during_load.append(entry)
+        self._insert(entry)
+
+    def _insert(self, entry: Entry) -> None:
+        if entry[0] <= datetime.utcnow():
+            return
+        game_entries = self._by_game.setdefault(entry[2], [])
+        index = bisect_left(game_entries, entry)
+        if index < len(game_entries) and game_entries[index] == entry:
+            return
+        insort(game_entries, entry)
+        insort(self._all, entry)
+
+    def _advance(self, now: datetime) -> None:
+        # passed draws form a sorted prefix; each is dropped once
+        cutoff = bisect_right(self._all, (now, float("inf")))
+        if not cutoff:
+            return
+        for entry in self._all[:cutoff]:
+            game_entries = self._by_game.get(entry[2])
+            if game_entries and game_entries[0] == entry:
+                del game_entries[0]
+        del self._all[:cutoff]
+
+    def upcoming(self, limit: int, now: datetime | None = None) -> list[dict]:
+        self._advance(now or datetime.utcnow())
+        return [_as_dict(entry) for entry in self._all[:limit]]
+
+    def next_for_game(self, game_id: int, now: datetime | None = None) -> dict | None:
+        now = now or datetime.utcnow()
+        entries = self._by_game.get(game_id)
+        if not entries:
+            return None
+        index = bisect_right(entries, (now, float("inf")))
+        return _as_dict(entries[index]) if index < len(entries) else None
+
+    async def load(self) -> int:
+        self._added_during_load = []
+        try:
+            now = datetime.utcnow()
+            async with SessionLocal() as session:
+                rows = await DrawRepository.list(session, date_from=now)
+            entries = sorted((row.draw_datetime, row.id, row.game_id) for row in rows if row.draw_datetime > now)
+            by_game: dict[int, list[Entry]] = {}
+            for entry in entries:
+                by_game.setdefault(entry[2], []).append(entry)
+            added = self._added_during_load
+            self._all, self._by_game = entries, by_game
+        finally:
+            self._added_during_load = None
+        for entry in added:
+            self._insert(entry)
+        self.loaded_at = datetime.utcnow()
+        return len(self._all)
+
+
+draw_schedule = DrawSchedule()
+
+
+async def _refresh_schedule_loop():
+    while True:
+        try:
+            await draw_schedule.load()
+        except Exception:
+            logger.exception("Loading the draw schedule failed")
+        await asyncio.sleep(settings.draw_schedule_refresh_seconds)
+
+
+def start_schedule_refresh_task(loop):
+    return loop.create_task(_refresh_schedule_loop())
@@ -1,21 +1,103 @@
+import base64
+import binascii
+from datetime import datetime
+
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException
+from ..core.tracing import traced
+from ..db.partitioning import ensure_partitions
 from ..repositories.draws import DrawRepository
 from ..models.game import Game
 from ..schemas.draw import DrawCreate
 from ..models.draw import Draw
+from .draw_schedule import draw_schedule
+
+DRAW_FIELDS = ("id", "game_id", "draw_datetime", "notified")
+DRAW_INCLUDES = ("game",)
 
 
+@traced
 class DrawService:
     @staticmethod
-    async def list_draws(session: AsyncSession) -> list[Draw]:
-        return await DrawRepository.list(session)
+    async def list_draws(
+        session: AsyncSession,
+        *,
+        game_id: int | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        notified: bool | None = None,
+        cursor: str | None = None,
+        limit: int | None = None,
+        with_game: bool = False,
+    ) -> tuple[list[Row], str | None]:
+        """Returns one page of draws and the cursor for the next page (None when done)."""
+        rows = await DrawRepository.list(
+            session,
+            game_id=game_id,
+            date_from=DrawService._naive(date_from),
+            date_to=DrawService._naive(date_to),
+            notified=notified,
+            after=DrawService._decode_cursor(cursor) if cursor else None,
+            limit=limit + 1 if limit else None,
+            with_game=with_game,
+        )
+        if limit and len(rows) > limit:
+            rows = rows[:limit]
+            return rows, DrawService._encode_cursor(rows[-1])
+        return rows, None
+
+    @staticmethod
+    def sparse(rows: list[Row], fields: list[str] | None, include: list[str] | None) -> list[dict]:
+        """Rows trimmed to the requested fields; `id` is always kept."""
+        names = ["id", *[name for name in fields or DRAW_FIELDS if name != "id"]]
+        items = []
+        for row in rows:
+            item = {name: getattr(row, name) for name in names}
+            if include and "game" in include:
+                item["game"] = {"id": row.game_id, "name": row.game_name}
+            items.append(item)
+        return items
 
     @staticmethod
     async def create_draw(session: AsyncSession, payload: DrawCreate) -> Draw:
+        # a draw beyond the months kept ready by maintenance brings its own partitions; done
+        # before any other statement so this transaction holds no table locks while it waits
+        await ensure_partitions(await session.connection(), payload.draw_datetime.date())
         game = await session.get(Game, payload.game_id)
         if not game:
             raise HTTPException(status_code=404, detail="Game not found")
         draw = await DrawRepository.create(session, payload.game_id, payload.draw_datetime)
         await session.commit()
+        draw_schedule.add(draw.id, draw.game_id, draw.draw_datetime)
         return draw
+
+    @staticmethod
+    def upcoming_draws(limit: int) -> list[dict]:
+        return draw_schedule.upcoming(limit)
+
+    @staticmethod
+    def next_draw_for_game(game_id: int) -> dict:
+        draw = draw_schedule.next_for_game(game_id)
+        if draw is None:
+            raise HTTPException(status_code=404, detail="No upcoming draw for this game")
+        return draw
+
+    @staticmethod
+    def _naive(value: datetime | None) -> datetime | None:
+        # draw_datetime is stored without a timezone, same as DrawCreate
+        return value.replace(tzinfo=None) if value and value.tzinfo else value
+
+    @staticmethod
+    def _encode_cursor(row: Row) -> str:
+        raw = f"{row.draw_datetime.isoformat()}|{row.id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+            moment, draw_id = raw.rsplit("|", 1)
+            return datetime.fromisoformat(moment), int(draw_id)
+        except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+            raise HTTPException(status_code=400, detail="Invalid cursor") from exc
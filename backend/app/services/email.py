@@ -5,8 +5,10 @@ from email.message import EmailMessage
 from typing import Iterable
 
 from ..core.config import settings
+from ..core.tracing import traced, tracer
 
 
+@traced
 class EmailService:
     """Simple async-compatible SMTP email sender."""
 
@@ -24,7 +26,7 @@ class EmailService:
         message["To"] = ", ".join(recipients_list)
         message.set_content(body)
 
-        async def _send() -> None:
+        def _send() -> None:
             context = ssl.create_default_context()
             if settings.smtp_use_ssl:
                 with smtplib.SMTP_SSL(settings.smtp_host, settings.smtp_port, context=context) as server:
@@ -41,4 +43,9 @@ class EmailService:
                     server.login(settings.smtp_username, settings.smtp_password)
                 server.send_message(message)
 
-        await asyncio.to_thread(_send)
+        with tracer.span(
+            "SMTP send",
+            kind="client",
+            attributes={"smtp.host": settings.smtp_host, "smtp.recipients": len(recipients_list)},
+        ):
+            await asyncio.to_thread(_send)
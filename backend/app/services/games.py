@@ -1,10 +1,12 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException
+from ..core.tracing import traced
 from ..repositories.games import GameRepository
 from ..schemas.game import GameCreate
 from ..models.game import Game
 
 
+@traced
 class GameService:
     @staticmethod
     async def list_games(session: AsyncSession) -> list[Game]:
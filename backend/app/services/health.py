@@ -0,0 +1,160 @@
+"""Readiness signals for load balancers.
+
+``GET /health`` only shows that the process answers. ``GET /ready`` checks
+the signals below against ``READY_*`` thresholds and returns ``503`` when
+any of them fails, so traffic drains away from a sick worker.
+``GET /health/details`` returns the same report with status 200.
+
+- database round-trip latency (a failed or timed-out ping fails the check)
+- connection pool utilisation
+- event-loop lag, sampled continuously by a background task
+
+The draw notifier (whether its task is alive, the age of its last tick and
+the backlog of overdue draws not yet notified) runs only in the leader, and
+draining the leader would just move leadership around. It is reported under
+``background`` in the details and never fails ``/ready``. So are queue
+depths (snapshot rebuilds, in-flight cache loads, load-shedding waiters).
+"""
+
+import asyncio
+import time
+from collections import deque
+from datetime import datetime, timedelta
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from ..core.config import settings
+from ..db.pool import pool_status
+from ..db.session import SessionLocal, engine, read_engine
+from ..middleware.load_shedding import route_limiters
+from ..repositories.draws import DrawRepository
+from .draw_notifier import heartbeat
+from .leader_election import leader_elector
+from .response_cache import results_cache
+from .snapshots import snapshot_publisher
+
+LAG_SAMPLE_SECONDS = 0.5
+# readiness judges the worst lag of roughly the last 10 seconds
+LAG_WINDOW = 20
+
+
+class LoopLagMonitor:
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self.samples: deque[float] = deque(maxlen=LAG_WINDOW)
+
+    @property
+    def current(self) -> float:
+        return self.samples[-1] if self.samples else 0.0
+
+    @property
+    def peak(self) -> float:
+        return max(self.samples, default=0.0)
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, loop.time() - started - self.interval))
+
+
+loop_lag = LoopLagMonitor(LAG_SAMPLE_SECONDS)
+
+
+def start_loop_lag_monitor(loop) -> asyncio.Task:
+    return loop.create_task(loop_lag.run())
+
+
+async def _ping(db_engine: AsyncEngine) -> None:
+    async with db_engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+
+async def _database(db_engine: AsyncEngine) -> dict:
+    started = time.perf_counter()
+    try:
+        await asyncio.wait_for(_ping(db_engine), timeout=settings.ready_db_timeout_seconds)
+    except Exception as exc:
+        return {"ok": False, "error": str(exc) or type(exc).__name__}
+    latency_ms = round((time.perf_counter() - started) * 1000, 1)
+    return {"ok": latency_ms <= settings.ready_max_db_latency_ms, "latency_ms": latency_ms}
+
+
+def _pool(db_engine: AsyncEngine) -> dict:
+    status = pool_status(db_engine)
+    if "in_use" not in status:
+        return {"ok": True, **status}
+    capacity = status["size"] + status["max_overflow"]
+    utilization = status["in_use"] / capacity if capacity else 0.0
+    return {
+        "ok": utilization < settings.ready_max_pool_utilization,
+        "utilization": round(utilization, 3),
+        **status,
+    }
+
+
+async def _notifier() -> dict:
+    state = leader_elector.job_states().get("draw_notifier")
+    if not leader_elector.is_leader or state is None:
+        return {"ok": True, "leader": False}
+    if state != "running":
+        # stopped on purpose (legacy schema) or failed; the backlog query may not even work
+        return {"ok": state != "failed", "leader": True, "state": state}
+    age = time.monotonic() - heartbeat.last_tick if heartbeat.last_tick is not None else None
+    overdue_before = datetime.utcnow() - timedelta(seconds=settings.ready_max_notifier_tick_age_seconds)
+    async with SessionLocal() as session:
+        backlog = await DrawRepository.count_unnotified_before(session, overdue_before)
+    ok = backlog <= settings.ready_max_notifier_backlog
+    if age is not None:
+        ok = ok and age <= settings.ready_max_notifier_tick_age_seconds
+    return {
+        "ok": ok,
+        "leader": True,
+        "state": state,
+        "last_tick_age_seconds": round(age, 1) if age is not None else None,
+        "last_batch": heartbeat.last_batch,
+        "backlog": backlog,
+    }
+
+
+def _queues() -> dict:
+    return {
+        "snapshots_pending": snapshot_publisher.pending,
+        "snapshots_publishing": snapshot_publisher.busy,
+        "results_cache_inflight": results_cache.inflight,
+        "load_shedding": {
+            name: {"active": limiter.active, "waiting": limiter.waiting, "limit": limiter.slots}
+            for name, limiter in route_limiters.items()
+        },
+    }
+
+
+async def readiness_report() -> dict:
+    engines = {"primary": engine}
+    if read_engine is not engine:
+        engines["replica"] = read_engine
+    databases = await asyncio.gather(*(_database(db_engine) for db_engine in engines.values()))
+    checks = {f"database_{name}": result for name, result in zip(engines, databases)}
+    for name, db_engine in engines.items():
+        checks[f"pool_{name}"] = _pool(db_engine)
+    lag_ms = loop_lag.peak * 1000
+    checks["event_loop"] = {
+        "ok": lag_ms <= settings.ready_max_loop_lag_ms,
+        "lag_ms": round(loop_lag.current * 1000, 1),
+        "peak_lag_ms": round(lag_ms, 1),
+    }
+    try:
+        notifier = await _notifier()
+    except Exception as exc:
+        notifier = {"ok": False, "error": str(exc) or type(exc).__name__}
+    failing = [name for name, check in checks.items() if not check["ok"]]
+    return {
+        "status": "ready" if not failing else "not_ready",
+        "failing": failing,
+        "checks": checks,
+        "background": {"notifier": notifier},
+        "queues": _queues(),
+        "jobs": leader_elector.job_states(),
+    }
@@ -0,0 +1,163 @@
+import asyncio
+import logging
+from typing import Callable
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from ..core.config import settings
+from ..db.session import _normalize_async_dsn, database_url
+
+logger = logging.getLogger(__name__)
+
+# A singleton job receives the running loop and returns the task it started.
+SingletonJob = Callable[[asyncio.AbstractEventLoop], asyncio.Task]
+
+
+class LeaderElector:
+    """Runs singleton background jobs in exactly one process.
+
+    Leadership is a session-level Postgres advisory lock held on a dedicated
+    connection. The lease is renewed by pinging that connection; if the ping
+    fails the connection (and with it the lock) is gone, so the jobs are
+    cancelled and another process can take over on its next attempt.
+
+    The engine must not pool (``NullPool``): a connection handed back to a
+    pool would keep its Postgres session, and with it a lock nobody owns.
+    ``None`` means no usable direct connection, so this process never leads.
+    """
+
+    def __init__(
+        self,
+        db_engine: AsyncEngine | None,
+        *,
+        lock_key: int,
+        renew_interval: float,
+        retry_interval: float,
+    ) -> None:
+        self._engine = db_engine
+        self._lock_key = lock_key
+        self._renew_interval = renew_interval
+        self._retry_interval = retry_interval
+        self._jobs: dict[str, SingletonJob] = {}
+        self._tasks: dict[str, asyncio.Task] = {}
+        self.task: asyncio.Task | None = None
+        self.is_leader = False
+
+    def register(self, name: str, job: SingletonJob) -> None:
+        self._jobs[name] = job
+
+    async def run(self) -> None:
+        if self._engine is None:
+            logger.error(
+                "Session advisory locks do not work through PgBouncer transaction pooling; "
+                "set LEADER_DATABASE_URL to a direct connection. Singleton jobs will not run here."
+            )
+            return
+        if self._engine.dialect.name != "postgresql":
+            # No advisory locks (e.g. SQLite in dev): this process is the only one.
+            self._become_leader()
+            return
+        try:
+            while True:
+                try:
+                    await self._campaign()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as exc:
+                    logger.warning("Leader election connection failed: %s", exc)
+                self._step_down()
+                await asyncio.sleep(self._retry_interval)
+        finally:
+            self._step_down()
+
+    async def _campaign(self) -> None:
+        async with self._engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            acquired = await conn.scalar(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": self._lock_key}
+            )
+            if not acquired:
+                return
+            self._become_leader()
+            try:
+                while True:
+                    await asyncio.sleep(self._renew_interval)
+                    await asyncio.wait_for(
+                        conn.execute(text("SELECT 1")), timeout=self._renew_interval
+                    )
+            finally:
+                self._step_down()
+                try:
+                    await conn.execute(
+                        text("SELECT pg_advisory_unlock(:key)"), {"key": self._lock_key}
+                    )
+                except Exception:
+                    # e.g. after a timed-out ping: end the session so the lock goes with it
+                    await conn.invalidate()
+
+    async def stop(self, timeout: float) -> None:
+        """Stops the jobs, giving them `timeout` seconds to finish in-flight work, then releases the lock."""
+        tasks = list(self._tasks.values())
+        self._step_down()
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=timeout)
+            for task in pending:
+                logger.warning("Singleton job did not stop within %.0fs; cancelling", timeout)
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        if self.task is not None:
+            self.task.cancel()
+            await asyncio.gather(self.task, return_exceptions=True)
+
+    def job_states(self) -> dict[str, str]:
+        """running / stopped / failed per job started in this process (empty unless leader)."""
+        states = {}
+        for name, task in self._tasks.items():
+            if not task.done():
+                states[name] = "running"
+            elif not task.cancelled() and task.exception() is not None:
+                states[name] = "failed"
+            else:
+                states[name] = "stopped"
+        return states
+
+    def _become_leader(self) -> None:
+        if self.is_leader:
+            return
+        self.is_leader = True
+        logger.info("Acquired leadership; starting %s", ", ".join(self._jobs) or "no jobs")
+        loop = asyncio.get_running_loop()
+        for name, job in self._jobs.items():
+            self._tasks[name] = job(loop)
+
+    def _step_down(self) -> None:
+        if not self.is_leader:
+            return
+        self.is_leader = False
+        logger.info("Lost leadership; stopping singleton jobs")
+        for task in self._tasks.values():
+            task.cancel()
+        self._tasks.clear()
+
+
+def _election_engine() -> AsyncEngine | None:
+    if settings.leader_database_url:
+        return create_async_engine(_normalize_async_dsn(settings.leader_database_url), poolclass=NullPool)
+    if settings.db_pgbouncer_mode:
+        return None
+    return create_async_engine(database_url, poolclass=NullPool)
+
+
+leader_elector = LeaderElector(
+    _election_engine(),
+    lock_key=settings.leader_lock_key,
+    renew_interval=settings.leader_renew_interval_seconds,
+    retry_interval=settings.leader_retry_interval_seconds,
+)
+
+
+def start_leader_election(loop) -> asyncio.Task:
+    leader_elector.task = loop.create_task(leader_elector.run())
+    return leader_elector.task
@@ -0,0 +1,195 @@
+"""Randomness audit of approved draw numbers.
+
+For every game, the approved winning and machine numbers (in draw order) are
+tested for uniformity (chi-square), independence between draws (runs test
+and lag-1 serial correlation of draw sums) and the spacing of each number's
+appearances (gap test). P-values come from Monte Carlo null histories, see
+``app.services.audit_stats``. Games are scored in parallel, one per process.
+
+Each run is stored in ``randomness_audits`` under one ``run_id``; tests with
+p below AUDIT_ALPHA are flagged.
+
+Run with:
+    python -m app.services.randomness_audit --simulations 1000
+The elected leader also runs it every AUDIT_INTERVAL_HOURS, counted from the
+latest stored run, so a leader that starts overdue runs it right away
+(requires NumPy: ``pip install -e ".[audit]"``).
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import logging
+import multiprocessing
+import os
+import time
+import uuid
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+
+from ..core.config import settings
+from ..db.session import SessionLocal, engine
+from ..repositories.randomness_audits import RandomnessAuditRepository
+from ..repositories.results import ResultRepository
+
+logger = logging.getLogger(__name__)
+
+# fewer draws than this make the asymptotics of every test meaningless
+MIN_DRAWS = 20
+
+
+def numpy_available() -> bool:
+    return importlib.util.find_spec("numpy") is not None
+
+
+def _parse(numbers: str | None) -> tuple[int, ...]:
+    try:
+        return tuple(int(item) for item in (numbers or "").split(",") if item.strip())
+    except ValueError:
+        return ()
+
+
+def _histories(rows, number_max: int) -> dict[tuple[int, str], list[tuple[int, ...]]]:
+    """(game_id, "winning"|"machine") -> draws in draw order, each of the game's usual size."""
+    series: dict[tuple[int, str], list[tuple[int, ...]]] = defaultdict(list)
+    # list_approved returns newest first
+    for row in reversed(rows):
+        for kind, numbers in (("winning", row.winning_numbers), ("machine", row.machine_numbers)):
+            parsed = _parse(numbers)
+            if parsed and len(set(parsed)) == len(parsed) and all(1 <= value <= number_max for value in parsed):
+                series[(row.game_id, kind)].append(parsed)
+    histories = {}
+    for key, draws in series.items():
+        size = Counter(len(draw) for draw in draws).most_common(1)[0][0]
+        histories[key] = [draw for draw in draws if len(draw) == size]
+    return histories
+
+
+async def run_audit(*, simulations: int, workers: int | None = None, seed: int | None = None) -> tuple[str, list[dict]]:
+    started = time.perf_counter()
+    async with SessionLocal() as session:
+        rows = await ResultRepository.list_approved(session)
+    histories = {
+        key: draws for key, draws in _histories(rows, settings.audit_number_max).items() if len(draws) >= MIN_DRAWS
+    }
+    run_id = uuid.uuid4().hex
+    base_seed = seed if seed is not None else uuid.UUID(run_id).int % 2**32
+
+    from .audit_stats import audit_history
+
+    loop = asyncio.get_running_loop()
+    processes = workers or min(len(histories), os.cpu_count() or 1) or 1
+    # spawn: forking a process that holds DB connections and an event loop is unsafe;
+    # workers only import audit_stats (NumPy), not the app
+    pool = ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context("spawn"))
+    try:
+        futures = {
+            (game_id, kind): loop.run_in_executor(
+                pool,
+                audit_history,
+                draws,
+                settings.audit_number_max,
+                simulations,
+                base_seed + game_id * 2 + (kind == "machine"),
+            )
+            for (game_id, kind), draws in histories.items()
+        }
+        outcomes = dict(zip(futures, await asyncio.gather(*futures.values())))
+    except BaseException:
+        # cancelled (e.g. leadership lost) or failed: drop queued games, don't block the loop on running ones
+        pool.shutdown(wait=False, cancel_futures=True)
+        raise
+    # joining the worker processes blocks, so it happens off the event loop
+    await asyncio.to_thread(pool.shutdown)
+
+    report = []
+    for (game_id, kind), tests in sorted(outcomes.items()):
+        for test, (statistic, p_value) in tests.items():
+            report.append(
+                {
+                    "run_id": run_id,
+                    "game_id": game_id,
+                    "numbers": kind,
+                    "test": test,
+                    "draws": len(histories[(game_id, kind)]),
+                    "statistic": statistic,
+                    "p_value": p_value,
+                    "simulations": simulations,
+                    "flagged": p_value < settings.audit_alpha,
+                }
+            )
+    async with SessionLocal() as session:
+        await RandomnessAuditRepository.bulk_create(session, report)
+        await session.commit()
+    logger.info(
+        "Randomness audit %s: %d series, %d flagged, %.1fs",
+        run_id,
+        len(histories),
+        sum(row["flagged"] for row in report),
+        time.perf_counter() - started,
+    )
+    return run_id, report
+
+
+async def _last_run_at() -> datetime | None:
+    async with SessionLocal() as session:
+        latest = await RandomnessAuditRepository.latest_created_at(session)
+    if latest is not None and latest.tzinfo is None:
+        # SQLite drops the zone; CURRENT_TIMESTAMP is UTC
+        latest = latest.replace(tzinfo=timezone.utc)
+    return latest
+
+
+async def _audit_loop():
+    interval = settings.audit_interval_hours * 3600
+    # a run with too few draws stores nothing, so this process remembers its own runs as well
+    ran_at = None
+    while True:
+        try:
+            last = await _last_run_at()
+        except Exception:
+            logger.exception("Reading the last randomness audit failed")
+            last = None
+        last = max(filter(None, (last, ran_at)), default=None)
+        if last is not None:
+            await asyncio.sleep(max(0.0, interval - (datetime.now(timezone.utc) - last).total_seconds()))
+        ran_at = datetime.now(timezone.utc)
+        try:
+            await run_audit(simulations=settings.audit_simulations)
+        except Exception:
+            logger.exception("Randomness audit failed")
+
+
+def start_audit_task(loop):
+    return loop.create_task(_audit_loop())
+
+
+def print_report(report: list[dict]) -> None:
+    print(f"{'game':>6} {'numbers':<8} {'test':<20}{'draws':>7}{'statistic':>12}{'p-value':>10}  flag")
+    for row in report:
+        print(
+            f"{row['game_id']:>6} {row['numbers']:<8} {row['test']:<20}{row['draws']:>7}"
+            f"{row['statistic']:>12.4f}{row['p_value']:>10.4f}  {'*' if row['flagged'] else ''}"
+        )
+
+
+async def main(argv=None):
+    parser = argparse.ArgumentParser(description="Statistical randomness audit of approved draw numbers")
+    parser.add_argument("--simulations", type=int, default=settings.audit_simulations)
+    parser.add_argument("--workers", type=int, default=0, help="processes (default: one per CPU)")
+    parser.add_argument("--seed", type=int, default=None, help="fix the Monte Carlo seed for a reproducible run")
+    args = parser.parse_args(argv)
+    if not numpy_available():
+        raise SystemExit('The audit needs NumPy: pip install -e ".[audit]"')
+
+    started = time.perf_counter()
+    run_id, report = await run_audit(simulations=args.simulations, workers=args.workers or None, seed=args.seed)
+    print_report(report)
+    print(f"run {run_id}: {len(report)} tests, {sum(row['flagged'] for row in report)} flagged "
+          f"(p < {settings.audit_alpha}) in {time.perf_counter() - started:.1f}s")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,154 @@
+"""Token-bucket rate limiting for the auth endpoints.
+
+Login, signup and Google sign-in spend tens of milliseconds of CPU per call
+(password hashing, token verification). Buckets keyed by client IP and by
+email are checked before that work starts, so a credential-stuffing burst is
+turned away cheaply instead of starving the worker that serves results.
+
+The in-memory store is per worker process. With several workers or replicas
+set ``AUTH_RATE_LIMIT_STORE=postgres`` to share buckets through an unlogged
+table. Rows of buckets idle long enough to have refilled are deleted about
+once per refill period, so rotating source addresses cannot grow it forever.
+
+The per-IP bucket is only as good as ``request.client``. uvicorn replaces it
+with the rightmost ``X-Forwarded-For`` hop that is not a trusted proxy, and
+trusts only ``FORWARDED_ALLOW_IPS``. If that were ``*``, every forged header
+would get a fresh bucket.
+"""
+
+import logging
+import math
+import time
+
+from fastapi import HTTPException, Request
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from ..core.config import settings
+from ..db.session import engine
+
+logger = logging.getLogger(__name__)
+
+# a rejected request leaves the bucket at -1 at most, so blocked clients recover on schedule
+MIN_TOKENS = -1.0
+
+
+class MemoryStore:
+    MAX_KEYS = 100_000
+
+    def __init__(self) -> None:
+        self._buckets: dict[str, tuple[float, float]] = {}
+
+    async def take(self, key: str, capacity: int, rate: float) -> float:
+        now = time.monotonic()
+        tokens, updated = self._buckets.get(key, (capacity, now))
+        tokens = max(min(capacity, tokens + (now - updated) * rate) - 1, MIN_TOKENS)
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self.MAX_KEYS:
+            self._prune(now, (capacity - MIN_TOKENS) / rate)
+        return tokens
+
+    def _prune(self, now: float, refill_seconds: float) -> None:
+        # buckets idle long enough to have refilled completely carry no state
+        for key, (_, updated) in list(self._buckets.items()):
+            if now - updated >= refill_seconds:
+                del self._buckets[key]
+        # still flooded with live keys (e.g. spoofed sources): forget the oldest half
+        if len(self._buckets) > self.MAX_KEYS:
+            for key in list(self._buckets)[: len(self._buckets) // 2]:
+                del self._buckets[key]
+
+
+class PostgresStore:
+    def __init__(self, db_engine: AsyncEngine) -> None:
+        self._engine = db_engine
+        self._ready = False
+        # longest time any bucket seen here takes to refill from empty
+        self._refill_seconds = 0.0
+        self._pruned_at = time.monotonic()
+
+    async def take(self, key: str, capacity: int, rate: float) -> float:
+        self._refill_seconds = max(self._refill_seconds, (capacity - MIN_TOKENS) / rate)
+        async with self._engine.begin() as conn:
+            if not self._ready:
+                # unlogged: buckets are disposable and should not cost WAL
+                await conn.execute(
+                    text(
+                        "CREATE UNLOGGED TABLE IF NOT EXISTS auth_rate_limits "
+                        "(key TEXT PRIMARY KEY, tokens DOUBLE PRECISION NOT NULL, "
+                        "updated_at TIMESTAMPTZ NOT NULL)"
+                    )
+                )
+                await conn.execute(
+                    text("CREATE INDEX IF NOT EXISTS auth_rate_limits_updated_at ON auth_rate_limits (updated_at)")
+                )
+                self._ready = True
+            now = time.monotonic()
+            if now - self._pruned_at >= self._refill_seconds:
+                self._pruned_at = now
+                # a bucket idle this long is full again, so its row carries no state
+                await conn.execute(
+                    text(
+                        "DELETE FROM auth_rate_limits "
+                        "WHERE updated_at < clock_timestamp() - make_interval(secs => :idle)"
+                    ),
+                    {"idle": self._refill_seconds},
+                )
+            return await conn.scalar(
+                text(
+                    "INSERT INTO auth_rate_limits AS b (key, tokens, updated_at) "
+                    "VALUES (:key, :capacity - 1, clock_timestamp()) "
+                    "ON CONFLICT (key) DO UPDATE SET "
+                    "tokens = GREATEST(LEAST(:capacity, b.tokens + "
+                    "EXTRACT(EPOCH FROM clock_timestamp() - b.updated_at) * :rate) - 1, :floor), "
+                    "updated_at = clock_timestamp() "
+                    "RETURNING tokens"
+                ),
+                {"key": key, "capacity": capacity, "rate": rate, "floor": MIN_TOKENS},
+            )
+
+
+class RateLimiter:
+    def __init__(self, store) -> None:
+        self._store = store
+
+    async def hit(self, key: str, limit: int, window_seconds: float) -> None:
+        """Takes one token from `key`; raises 429 with Retry-After when the bucket is empty."""
+        if limit <= 0:
+            return
+        rate = limit / window_seconds
+        try:
+            tokens = await self._store.take(key, limit, rate)
+        except Exception as exc:
+            # fail open: the limiter must not take logins down with it
+            logger.warning("Rate limit store unavailable: %s", exc)
+            return
+        if tokens < 0:
+            retry_after = math.ceil(-tokens / rate) if rate else int(window_seconds)
+            raise HTTPException(
+                status_code=429,
+                detail="Too many attempts, try again later",
+                headers={"Retry-After": str(max(1, retry_after))},
+            )
+
+
+def _client_ip(request: Request) -> str:
+    # already resolved from X-Forwarded-For by uvicorn, for trusted proxies only (see module docstring)
+    return request.client.host if request.client else "unknown"
+
+
+auth_rate_limiter = RateLimiter(
+    PostgresStore(engine)
+    if settings.auth_rate_limit_store == "postgres" and engine.dialect.name == "postgresql"
+    else MemoryStore()
+)
+
+
+async def check_auth_rate_limit(request: Request, action: str, email: str | None = None) -> None:
+    """Call first thing in an auth handler, before any hashing or token verification."""
+    window = settings.auth_rate_limit_window_seconds
+    await auth_rate_limiter.hit(f"{action}:ip:{_client_ip(request)}", settings.auth_rate_limit_per_ip, window)
+    if email:
+        await auth_rate_limiter.hit(
+            f"{action}:email:{email.strip().lower()}", settings.auth_rate_limit_per_email, window
+        )
@@ -0,0 +1,84 @@
+"""Per-worker micro-cache with single-flight loading.
+
+Right after a result is approved, many readers ask for the same listing
+within seconds. Concurrent requests for one key share a single in-flight
+load. The serialised body is kept for ``ttl`` seconds, and after that it is
+served stale for up to ``stale`` more seconds while one background load
+refreshes it. Writers call ``invalidate()`` after committing, so their
+changes do not wait for the TTL in this worker. Other workers are not told.
+After an idle period they can serve a body up to ``ttl + stale`` seconds old
+once, while the refresh runs.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Hashable
+
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class MicroCache:
+    MAX_ENTRIES = 256
+
+    def __init__(self, ttl: float, stale: float) -> None:
+        self.ttl = ttl
+        self.stale = stale
+        # key -> (monotonic time loaded, value)
+        self._entries: dict[Hashable, tuple[float, object]] = {}
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+        # bumped by invalidate(); loads started under an older generation are not stored
+        self._generation = 0
+
+    @property
+    def inflight(self) -> int:
+        return len(self._inflight)
+
+    async def get(self, key: Hashable, loader: Callable[[], Awaitable[object]]):
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = time.monotonic() - entry[0]
+            if age < self.ttl:
+                return entry[1]
+            if age < self.ttl + self.stale:
+                self._flight(key, loader)
+                return entry[1]
+        # shielded: a reader that disconnects must not cancel the load others are waiting on
+        return await asyncio.shield(self._flight(key, loader))
+
+    def invalidate(self) -> None:
+        self._generation += 1
+        self._entries.clear()
+        # readers arriving from now on start a fresh load instead of joining a pre-write one
+        self._inflight.clear()
+
+    def _flight(self, key: Hashable, loader) -> asyncio.Task:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(self._load(key, loader, self._generation))
+            # background refreshes have no awaiting reader; _load already logged any failure
+            task.add_done_callback(lambda done: done.cancelled() or done.exception())
+            self._inflight[key] = task
+        return task
+
+    async def _load(self, key: Hashable, loader, generation: int):
+        try:
+            value = await loader()
+        except Exception as exc:
+            logger.warning("Loading cache entry %r failed: %s", key, exc)
+            raise
+        finally:
+            if self._inflight.get(key) is asyncio.current_task():
+                del self._inflight[key]
+        if generation == self._generation:
+            self._entries.pop(key, None)
+            self._entries[key] = (time.monotonic(), value)
+            if len(self._entries) > self.MAX_ENTRIES:
+                del self._entries[next(iter(self._entries))]
+        return value
+
+
+# GET /api/results bodies, invalidated by ResultService after result writes
+results_cache = MicroCache(settings.results_cache_ttl_seconds, settings.results_cache_stale_seconds)
@@ -1,23 +1,121 @@
 from datetime import datetime
-from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any
+
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm.attributes import set_committed_value
 from fastapi import HTTPException
+from ..core.tracing import traced, tracer
+from ..repositories.draws import DrawRepository
 from ..repositories.results import ResultRepository
 from ..repositories.result_approvals import ResultApprovalRepository
-from ..models.draw import Draw
 from ..models.game import Game
 from ..models.result import Result
 from ..models.manager import Manager
-from ..schemas.result import ResultCreate, ResultVerify
+from ..schemas.result import (
+    ResultApprovalRead,
+    ResultBulkVerifyItem,
+    ResultBulkVerifyOutcome,
+    ResultCreate,
+    ResultRead,
+    ResultVerify,
+    _split_comma_string,
+)
+from .response_cache import results_cache
+from .snapshots import snapshot_publisher
+
+MAX_BULK_VERIFY_ITEMS = 200
+RESULT_FIELDS = (
+    "id",
+    "draw_id",
+    "winning_numbers",
+    "machine_numbers",
+    "share_copy",
+    "share_hashtags",
+    "share_targets",
+    "status",
+    "verified",
+    "verified_at",
+    "submitted_by_id",
+    "created_at",
+)
+RESULT_INCLUDES = ("approvals", "draw")
+# stored comma-separated, returned as lists like ResultRead does
+_LIST_FIELDS = ("share_hashtags", "share_targets")
+_FULL_LIST = TypeAdapter(list[ResultRead])
+_SPARSE_LIST = TypeAdapter(list[dict[str, Any]])
 
 
+@traced
 class ResultService:
     @staticmethod
-    async def list_results(session: AsyncSession) -> list[Result]:
-        return await ResultRepository.list(session)
+    async def list_results_json(
+        factory: async_sessionmaker,
+        *,
+        fields: list[str] | None = None,
+        include: list[str] | None = None,
+        since: datetime | None = None,
+        cached: bool = True,
+    ) -> bytes:
+        """Serialised listing; identical concurrent calls share one query and one encoding."""
+
+        async def load() -> bytes:
+            async with factory() as session:
+                if fields is None and include is None:
+                    results = await ResultRepository.list(session, since=since)
+                    with tracer.span("serialize", attributes={"rows": len(results)}):
+                        return _FULL_LIST.dump_json(_FULL_LIST.validate_python(results, from_attributes=True))
+                items = await ResultService.list_results_sparse(session, fields, include, since=since)
+                with tracer.span("serialize", attributes={"rows": len(items)}):
+                    return _SPARSE_LIST.dump_json(items)
+
+        if not cached:
+            return await load()
+        key = (tuple(fields) if fields is not None else None, tuple(include) if include is not None else None, since)
+        return await results_cache.get(key, load)
+
+    @staticmethod
+    async def list_results_sparse(
+        session: AsyncSession,
+        fields: list[str] | None,
+        include: list[str] | None,
+        since: datetime | None = None,
+    ) -> list[dict]:
+        """Results with only the requested columns and relations loaded.
+
+        `draw` comes from the same query through a join; `approvals` costs one
+        extra query for the whole page. `id` is always returned.
+        """
+        include = include or []
+        columns = ["id", *[name for name in fields or RESULT_FIELDS if name != "id"]]
+        rows = await ResultRepository.list_columns(session, columns, with_draw="draw" in include, since=since)
+        items = []
+        for row in rows:
+            item = {name: getattr(row, name) for name in columns}
+            for name in _LIST_FIELDS:
+                if name in item:
+                    item[name] = _split_comma_string(item[name])
+            if "draw" in include:
+                item["draw"] = {
+                    "id": row.draw__id,
+                    "draw_datetime": row.draw__draw_datetime,
+                    "game_id": row.draw__game_id,
+                    "game": {"id": row.draw__game_id, "name": row.draw__game_name},
+                }
+            items.append(item)
+        if "approvals" in include:
+            by_result: dict[int, list[dict]] = {item["id"]: [] for item in items}
+            for approval in await ResultApprovalRepository.list_for_results(session, list(by_result), since=since):
+                by_result[approval.result_id].append(
+                    ResultApprovalRead.model_validate(approval).model_dump()
+                )
+            for item in items:
+                item["approvals"] = by_result[item["id"]]
+        return items
 
     @staticmethod
     async def create_result(session: AsyncSession, payload: ResultCreate, manager: Manager) -> Result:
-        draw = await session.get(Draw, payload.draw_id)
+        draw = await DrawRepository.get_with_game(session, payload.draw_id)
         if not draw:
             raise HTTPException(status_code=404, detail="Draw not found")
         winning_list = ResultService._as_list(payload.winning_numbers)
@@ -32,9 +130,8 @@ class ResultService:
         if len(set(all_numbers)) != len(all_numbers):
             raise HTTPException(status_code=400, detail="Each winning and machine number must be unique across both lists.")
 
-        game = await session.get(Game, draw.game_id)
         share_copy = payload.share_copy or ResultService._build_share_copy(
-            game=game,
+            game=draw.game,
             draw_datetime=draw.draw_datetime,
             winning_numbers=winning_list,
             machine_numbers=machine_list,
@@ -46,6 +143,7 @@ class ResultService:
         result = await ResultRepository.create(
             session=session,
             draw_id=payload.draw_id,
+            draw_datetime=draw.draw_datetime,
             winning_numbers=ResultService._numbers_to_string(winning_list),
             machine_numbers=ResultService._numbers_to_string(machine_list) or None,
             share_copy=share_copy,
@@ -54,35 +152,118 @@ class ResultService:
             submitted_by_id=manager.id if manager else None,
         )
         await session.commit()
-        return await ResultRepository.get(session, result.id)
+        results_cache.invalidate()
+        # build the response from the RETURNING row and the draw loaded above
+        set_committed_value(result, "draw", draw)
+        return result
 
     @staticmethod
     async def verify_result(session: AsyncSession, result_id: int, payload: ResultVerify, manager: Manager) -> Result:
-        result = await ResultRepository.get(session, result_id)
-        if not result:
-            raise HTTPException(status_code=404, detail="Result not found")
         decision = payload.decision.lower()
         if decision not in {"approved", "rejected"}:
+            # an unknown result is reported first, as it always was; only this error path pays the lookup
+            if not await ResultRepository.partition_keys(session, [result_id]):
+                raise HTTPException(status_code=404, detail="Result not found")
             raise HTTPException(status_code=400, detail="Decision must be 'approved' or 'rejected'")
 
+        approved = decision == "approved"
+        result = await ResultRepository.update_status(
+            session=session,
+            result_id=result_id,
+            status="approved" if approved else "changes_requested",
+            verified=approved,
+            verified_at=datetime.utcnow() if approved else None,
+        )
+        if not result:
+            raise HTTPException(status_code=404, detail="Result not found")
+
         await ResultApprovalRepository.create(
             session=session,
             result_id=result_id,
+            draw_datetime=result.draw_datetime,
             manager_id=manager.id,
             decision=decision,
             note=payload.note,
         )
+        approvals = await ResultApprovalRepository.list_for_result(session, result_id, result.draw_datetime)
+        draw = await DrawRepository.get_with_game(session, result.draw_id, result.draw_datetime)
+        await session.commit()
+        results_cache.invalidate()
+        snapshot_publisher.schedule([result_id])
+        set_committed_value(result, "approvals", approvals)
+        set_committed_value(result, "draw", draw)
+        return result
+
+    @staticmethod
+    async def verify_results_bulk(
+        session: AsyncSession, items: list[ResultBulkVerifyItem], manager: Manager
+    ) -> list[ResultBulkVerifyOutcome]:
+        if len(items) > MAX_BULK_VERIFY_ITEMS:
+            raise HTTPException(status_code=400, detail=f"At most {MAX_BULK_VERIFY_ITEMS} results per request")
+
+        outcomes: dict[int, ResultBulkVerifyOutcome] = {}
+        accepted: list[ResultBulkVerifyItem] = []
+        seen: set[int] = set()
+        for index, item in enumerate(items):
+            decision = item.decision.lower()
+            if item.result_id in seen:
+                outcomes[index] = ResultBulkVerifyOutcome(
+                    result_id=item.result_id, success=False, message="Duplicate result in request"
+                )
+            elif decision not in {"approved", "rejected"}:
+                outcomes[index] = ResultBulkVerifyOutcome(
+                    result_id=item.result_id, success=False, message="Decision must be 'approved' or 'rejected'"
+                )
+            else:
+                seen.add(item.result_id)
+                accepted.append(item)
+
+        existing = await ResultRepository.partition_keys(session, [item.result_id for item in accepted]) if accepted else {}
+        valid = [item for item in accepted if item.result_id in existing]
+        approved_ids = [item.result_id for item in valid if item.decision.lower() == "approved"]
+        rejected_ids = [item.result_id for item in valid if item.decision.lower() == "rejected"]
 
-        if decision == "approved":
-            result.verified = True
-            result.status = "approved"
-            result.verified_at = datetime.utcnow()
-        else:
-            result.verified = False
-            result.status = "changes_requested"
-            result.verified_at = None
+        await ResultApprovalRepository.bulk_create(
+            session,
+            [
+                {
+                    "result_id": item.result_id,
+                    "draw_datetime": existing[item.result_id],
+                    "manager_id": manager.id,
+                    "decision": item.decision.lower(),
+                    "note": item.note,
+                }
+                for item in valid
+            ],
+        )
+        await ResultRepository.bulk_update_status(
+            session,
+            approved_ids=approved_ids,
+            rejected_ids=rejected_ids,
+            draw_datetimes=[existing[item.result_id] for item in valid],
+            verified_at=datetime.utcnow(),
+        )
         await session.commit()
-        return await ResultRepository.get(session, result.id)
+        results_cache.invalidate()
+        snapshot_publisher.schedule(approved_ids + rejected_ids)
+
+        results = []
+        for index, item in enumerate(items):
+            if index in outcomes:
+                results.append(outcomes[index])
+            elif item.result_id not in existing:
+                results.append(ResultBulkVerifyOutcome(result_id=item.result_id, success=False, message="Result not found"))
+            else:
+                approved = item.decision.lower() == "approved"
+                results.append(
+                    ResultBulkVerifyOutcome(
+                        result_id=item.result_id,
+                        success=True,
+                        message="Approved" if approved else "Changes requested",
+                        status="approved" if approved else "changes_requested",
+                    )
+                )
+        return results
 
     @staticmethod
     def _numbers_to_string(values: list[str | int]) -> str:
@@ -0,0 +1,203 @@
+"""Static JSON snapshots of approved results.
+
+Approved results do not change, so public pages can read precomputed files
+instead of hitting the API and the database. After each verification the
+affected files are rebuilt in the background and written atomically, next to
+precompressed ``.gz`` and (when the ``brotli`` package is installed) ``.br``
+variants:
+
+    latest.json            newest approved results across all games
+    games/<game_id>.json   full history of one game
+    months/<YYYY-MM>.json  all approved results of draws in that month
+
+Serve ``SNAPSHOT_DIR`` from a static server (nginx ``gzip_static``/
+``brotli_static``) or through ``GET /api/snapshots/{path}``.
+
+Files are written by the process that handled the verification. Every
+instance therefore needs the same shared directory. On Postgres, rebuilds
+are serialised by an advisory lock, so a slower rebuild of older data never
+replaces newer files. Otherwise, set
+``SNAPSHOT_DIR`` on a single instance only (see the README).
+
+Rebuild everything with:
+    python -m app.services.snapshots
+"""
+
+import asyncio
+import gzip
+import json
+import logging
+import os
+import uuid
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+from sqlalchemy import text
+
+from ..core.config import settings
+from ..core.tracing import current_span, tracer
+from ..db.session import SessionLocal, engine
+from ..repositories.results import ResultRepository
+
+try:
+    import brotli
+except ImportError:  # optional: gzip only
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+LATEST_LIMIT = 50
+# transaction-level advisory lock serialising rebuilds across instances sharing SNAPSHOT_DIR
+SNAPSHOT_LOCK = 72_616_403
+# trace ids of scheduling requests recorded on a rebuild span
+MAX_LINKED_TRACES = 20
+
+
+def _month_start(value: datetime) -> date:
+    return date(value.year, value.month, 1)
+
+
+def _next_month(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def _serialize(rows) -> bytes:
+    document = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "results": [
+            {
+                "id": row.id,
+                "draw_id": row.draw_id,
+                "game_id": row.game_id,
+                "game_name": row.game_name,
+                "draw_datetime": row.draw_datetime.isoformat(),
+                "winning_numbers": [item for item in row.winning_numbers.split(",") if item],
+                "machine_numbers": [item for item in (row.machine_numbers or "").split(",") if item],
+                "verified_at": row.verified_at.isoformat() if row.verified_at else None,
+            }
+            for row in rows
+        ],
+    }
+    return json.dumps(document, separators=(",", ":")).encode()
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    # pids repeat across containers sharing the volume
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def write_snapshot(directory: Path, name: str, body: bytes) -> None:
+    """Writes name plus its .gz/.br variants; readers never see a partial file."""
+    path = directory / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # plain file last, so once it changes its compressed variants are already current
+    _write_atomic(path.with_name(path.name + ".gz"), gzip.compress(body, compresslevel=9, mtime=0))
+    if brotli is not None:
+        _write_atomic(path.with_name(path.name + ".br"), brotli.compress(body, quality=11))
+    _write_atomic(path, body)
+
+
+async def _lock_rebuilds(session) -> None:
+    """Held until the session ends: a rebuild reads and writes only after the previous one has
+    written, so an older read can never overwrite newer files (last writer wins)."""
+    if session.bind.dialect.name == "postgresql":
+        await session.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": SNAPSHOT_LOCK})
+
+
+class SnapshotPublisher:
+    def __init__(self, directory: str) -> None:
+        self.directory = Path(directory) if directory else None
+        self._pending: set[int] = set()
+        self._scheduled_by: set[str] = set()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.directory is not None
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    @property
+    def busy(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def schedule(self, result_ids) -> None:
+        """Queues a rebuild of the files these results appear in; bursts are coalesced."""
+        if not self.enabled:
+            return
+        self._pending.update(result_ids)
+        span = current_span.get()
+        if span is not None and len(self._scheduled_by) < MAX_LINKED_TRACES:
+            self._scheduled_by.add(span.trace_id)
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._drain())
+
+    async def _drain(self) -> None:
+        # the task copied the context of the first scheduling request, but a batch
+        # coalesces many requests; each batch is its own trace naming them instead
+        current_span.set(None)
+        while self._pending:
+            result_ids, self._pending = self._pending, set()
+            scheduled_by, self._scheduled_by = sorted(self._scheduled_by), set()
+            attributes = {"results": len(result_ids), "scheduled_by": scheduled_by}
+            try:
+                with tracer.span("snapshots.publish", attributes=attributes):
+                    await self.publish(result_ids)
+            except Exception:
+                logger.exception("Publishing result snapshots failed")
+
+    async def wait(self, timeout: float) -> None:
+        if self._task is not None and not self._task.done():
+            _, pending = await asyncio.wait([self._task], timeout=timeout)
+            for task in pending:
+                task.cancel()
+
+    async def publish(self, result_ids) -> list[str]:
+        async with SessionLocal() as session:
+            await _lock_rebuilds(session)
+            partition_keys = await ResultRepository.partition_keys(session, list(result_ids))
+            keys = await ResultRepository.draw_keys(session, partition_keys)
+            return await self._write(session, keys)
+
+    async def rebuild_all(self) -> list[str]:
+        async with SessionLocal() as session:
+            await _lock_rebuilds(session)
+            keys = await ResultRepository.approved_draw_keys(session)
+            return await self._write(session, keys)
+
+    async def _write(self, session, keys) -> list[str]:
+        game_ids = sorted({key.game_id for key in keys})
+        months = sorted({_month_start(key.draw_datetime) for key in keys})
+        files = {"latest.json": await ResultRepository.list_approved(session, limit=LATEST_LIMIT)}
+        for game_id in game_ids:
+            files[f"games/{game_id}.json"] = await ResultRepository.list_approved(session, game_id=game_id)
+        for month in months:
+            files[f"months/{month:%Y-%m}.json"] = await ResultRepository.list_approved(
+                session,
+                draw_from=datetime.combine(month, datetime.min.time()),
+                draw_to=datetime.combine(_next_month(month), datetime.min.time()),
+            )
+        # serialisation and compression are CPU-bound; keep them off the event loop
+        await asyncio.to_thread(
+            lambda: [write_snapshot(self.directory, name, _serialize(rows)) for name, rows in files.items()]
+        )
+        return list(files)
+
+
+snapshot_publisher = SnapshotPublisher(settings.snapshot_dir)
+
+
+async def main() -> None:
+    if not snapshot_publisher.enabled:
+        raise SystemExit("Set SNAPSHOT_DIR to publish snapshots")
+    written = await snapshot_publisher.rebuild_all()
+    print(f"Wrote {len(written)} snapshots to {snapshot_publisher.directory}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
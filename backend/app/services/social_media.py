@@ -2,10 +2,12 @@ import base64
 import mimetypes
 from typing import Optional
 
-import httpx
+from ..core.tracing import traced
+from ..core.http import get_http_client
 from ..core.social_config import social_settings
 
 
+@traced
 class SocialMediaService:
     """Service for posting lottery results to social media platforms"""
 
@@ -15,7 +17,7 @@ class SocialMediaService:
         if not social_settings.facebook_access_token:
             raise ValueError("Facebook access token not configured")
 
-        url = f"https://graph.facebook.com/v18.0/{social_settings.facebook_page_id}/feed"
+        url = f"{social_settings.graph_api_base_url}/{social_settings.facebook_page_id}/feed"
         data = {
             "message": message,
             "access_token": social_settings.facebook_access_token,
@@ -23,10 +25,10 @@ class SocialMediaService:
         if image_url:
             data["link"] = image_url
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, data=data)
-            response.raise_for_status()
-            return response.json()
+        client = get_http_client()
+        response = await client.post(url, data=data)
+        response.raise_for_status()
+        return response.json()
 
     @staticmethod
     async def post_to_twitter(message: str) -> dict:
@@ -40,27 +42,27 @@ class SocialMediaService:
             raise ValueError("Instagram access token not configured")
 
         # Step 1: Create container
-        container_url = f"https://graph.facebook.com/v18.0/{social_settings.instagram_account_id}/media"
+        container_url = f"{social_settings.graph_api_base_url}/{social_settings.instagram_account_id}/media"
         container_data = {
             "image_url": image_url,
             "caption": caption,
             "access_token": social_settings.instagram_access_token,
         }
 
-        async with httpx.AsyncClient() as client:
-            container_response = await client.post(container_url, data=container_data)
-            container_response.raise_for_status()
-            container_id = container_response.json()["id"]
+        client = get_http_client()
+        container_response = await client.post(container_url, data=container_data)
+        container_response.raise_for_status()
+        container_id = container_response.json()["id"]
 
-            # Step 2: Publish container
-            publish_url = f"https://graph.facebook.com/v18.0/{social_settings.instagram_account_id}/media_publish"
-            publish_data = {
-                "creation_id": container_id,
-                "access_token": social_settings.instagram_access_token,
-            }
-            publish_response = await client.post(publish_url, data=publish_data)
-            publish_response.raise_for_status()
-            return publish_response.json()
+        # Step 2: Publish container
+        publish_url = f"{social_settings.graph_api_base_url}/{social_settings.instagram_account_id}/media_publish"
+        publish_data = {
+            "creation_id": container_id,
+            "access_token": social_settings.instagram_access_token,
+        }
+        publish_response = await client.post(publish_url, data=publish_data)
+        publish_response.raise_for_status()
+        return publish_response.json()
 
     @staticmethod
     async def post_to_whatsapp(
@@ -74,70 +76,70 @@ class SocialMediaService:
         if not social_settings.whatsapp_access_token:
             raise ValueError("WhatsApp access token not configured")
 
-        url = f"https://graph.facebook.com/v18.0/{social_settings.whatsapp_phone_number_id}/messages"
+        url = f"{social_settings.graph_api_base_url}/{social_settings.whatsapp_phone_number_id}/messages"
         headers = {
             "Authorization": f"Bearer {social_settings.whatsapp_access_token}",
             "Content-Type": "application/json",
         }
         media_id: Optional[str] = None
 
-        async with httpx.AsyncClient() as client:
-            if image_base64:
-                # Support full data URLs or raw base64 payloads
-                mime_type = "image/png"
-                payload = image_base64
-                if image_base64.startswith("data:"):
-                    header, payload = image_base64.split(",", 1)
-                    mime_type = header.split(";")[0].split(":", 1)[1]
-                try:
-                    media_bytes = base64.b64decode(payload)
-                except Exception as exc:
-                    raise ValueError("Invalid base64 image data") from exc
-
-                media_url = f"https://graph.facebook.com/v18.0/{social_settings.whatsapp_phone_number_id}/media"
-                media_headers = {
-                    "Authorization": f"Bearer {social_settings.whatsapp_access_token}",
-                }
-                file_extension = mimetypes.guess_extension(mime_type) or ".png"
-                files = {
-                    "file": (f"result{file_extension}", media_bytes, mime_type),
-                }
-                data_form = {"messaging_product": "whatsapp"}
-
-                upload_response = await client.post(
-                    media_url,
-                    headers=media_headers,
-                    data=data_form,
-                    files=files,
-                )
-                upload_response.raise_for_status()
-                media_id = upload_response.json().get("id")
-
-            # Prepare payload
-            to_value = (
-                recipient
-                or social_settings.whatsapp_default_recipient
-                or "status@broadcast"
+        client = get_http_client()
+        if image_base64:
+            # Support full data URLs or raw base64 payloads
+            mime_type = "image/png"
+            payload = image_base64
+            if image_base64.startswith("data:"):
+                header, payload = image_base64.split(",", 1)
+                mime_type = header.split(";")[0].split(":", 1)[1]
+            try:
+                media_bytes = base64.b64decode(payload)
+            except Exception as exc:
+                raise ValueError("Invalid base64 image data") from exc
+
+            media_url = f"{social_settings.graph_api_base_url}/{social_settings.whatsapp_phone_number_id}/media"
+            media_headers = {
+                "Authorization": f"Bearer {social_settings.whatsapp_access_token}",
+            }
+            file_extension = mimetypes.guess_extension(mime_type) or ".png"
+            files = {
+                "file": (f"result{file_extension}", media_bytes, mime_type),
+            }
+            data_form = {"messaging_product": "whatsapp"}
+
+            upload_response = await client.post(
+                media_url,
+                headers=media_headers,
+                data=data_form,
+                files=files,
             )
+            upload_response.raise_for_status()
+            media_id = upload_response.json().get("id")
+
+        # Prepare payload
+        to_value = (
+            recipient
+            or social_settings.whatsapp_default_recipient
+            or "status@broadcast"
+        )
 
-            data = {
-                "messaging_product": "whatsapp",
-                "to": to_value,
-            }
+        data = {
+            "messaging_product": "whatsapp",
+            "to": to_value,
+        }
 
-            if media_id:
-                data["type"] = "image"
-                data["image"] = {"id": media_id, "caption": message}
-            elif image_url:
-                data["type"] = "image"
-                data["image"] = {"link": image_url, "caption": message}
-            else:
-                data["type"] = "text"
-                data["text"] = {"body": message}
+        if media_id:
+            data["type"] = "image"
+            data["image"] = {"id": media_id, "caption": message}
+        elif image_url:
+            data["type"] = "image"
+            data["image"] = {"link": image_url, "caption": message}
+        else:
+            data["type"] = "text"
+            data["text"] = {"body": message}
 
-            response = await client.post(url, headers=headers, json=data)
-            response.raise_for_status()
-            return response.json()
+        response = await client.post(url, headers=headers, json=data)
+        response.raise_for_status()
+        return response.json()
 
     @staticmethod
     def format_result_message(
@@ -164,12 +166,12 @@ class SocialMediaService:
             raise ValueError("Telegram bot token not configured")
         bot_token = social_settings.telegram_bot_token
         target = chat_id or social_settings.telegram_default_chat
-        url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
+        url = f"{social_settings.telegram_api_base_url}/bot{bot_token}/sendMessage"
         data = {"chat_id": target, "text": message}
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(url, json=data)
-            resp.raise_for_status()
-            return resp.json()
+        client = get_http_client()
+        resp = await client.post(url, json=data)
+        resp.raise_for_status()
+        return resp.json()
 
     @staticmethod
     async def post_to_snapchat(message: str) -> dict:
@@ -0,0 +1,189 @@
+import hashlib
+import time
+from datetime import datetime, timedelta, timezone
+
+from fastapi import HTTPException
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.config import settings
+from ..core.tracing import traced
+from ..models.social_post import SocialPost
+from ..repositories.results import ResultRepository
+from ..repositories.social_posts import SocialPostRepository
+from ..schemas.social import SocialPostRequest, SocialPostResponse
+
+# a pending post older than this is assumed abandoned (e.g. the worker died) and may be retried
+PENDING_TIMEOUT = timedelta(minutes=10)
+SUPPORTED_PLATFORMS = ("facebook", "twitter", "instagram", "whatsapp")
+
+
+@traced
+class SocialPostService:
+    @staticmethod
+    def request_digest(payload: SocialPostRequest) -> str:
+        """Fingerprint of what gets posted (platforms excluded: each has its own row)."""
+        content = "|".join(
+            [
+                str(payload.result_id),
+                payload.image_url or "",
+                hashlib.sha256((payload.image_base64 or "").encode()).hexdigest(),
+                payload.whatsapp_recipient or "",
+            ]
+        )
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    @staticmethod
+    async def _auto_key(session: AsyncSession, digest: str, platform: str) -> str:
+        """Key for a request without Idempotency-Key.
+
+        Reuses the key of the same content's post created within the last
+        SOCIAL_AUTO_IDEMPOTENCY_WINDOW_SECONDS, so a double click or a blind retry
+        collapses onto one stored outcome. Later, the next generation number
+        starts a new post; concurrent requests derive the same number and meet
+        on the unique key.
+        """
+        latest = await SocialPostRepository.latest_auto(session, digest, platform)
+        if latest is None:
+            return f"auto:{digest}:0"
+        created_at = latest.created_at
+        if created_at.tzinfo is None:
+            # SQLite drops the zone; CURRENT_TIMESTAMP is UTC
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        window = timedelta(seconds=settings.social_auto_idempotency_window_seconds)
+        if created_at >= datetime.now(timezone.utc) - window:
+            return latest.idempotency_key
+        return f"auto:{digest}:{int(latest.idempotency_key.rsplit(':', 1)[1]) + 1}"
+
+    @staticmethod
+    async def post_result(
+        session: AsyncSession, payload: SocialPostRequest, idempotency_key: str | None
+    ) -> list[SocialPostResponse]:
+        result = await ResultRepository.get(session, payload.result_id)
+        if not result:
+            raise HTTPException(status_code=404, detail="Result not found")
+        # loaded with the result through its (draw_id, draw_datetime) join
+        draw = result.draw
+
+        # imported on first use so httpx and the platform clients stay off the cold-start path
+        from .social_media import SocialMediaService
+
+        message = SocialMediaService.format_result_message(
+            game_name=draw.game.name,
+            draw_date=draw.draw_datetime.strftime("%d %b %Y"),
+            draw_time=draw.draw_datetime.strftime("%I:%M %p"),
+            winning_numbers=result.winning_numbers,
+            machine_numbers=result.machine_numbers,
+        )
+        digest = SocialPostService.request_digest(payload)
+        key = idempotency_key.strip()[:255] if idempotency_key else None
+        if key and await SocialPostRepository.digests_for_key(session, key) - {digest}:
+            raise HTTPException(status_code=422, detail="Idempotency-Key was already used for a different request")
+
+        responses = []
+        for platform in payload.platforms:
+            if platform not in SUPPORTED_PLATFORMS:
+                responses.append(
+                    SocialPostResponse(
+                        platform=platform,
+                        success=False,
+                        message=f"Platform '{platform}' not supported",
+                    )
+                )
+                continue
+            post_key = key or await SocialPostService._auto_key(session, digest, platform)
+            post, claimed = await SocialPostService._claim(session, post_key, digest, payload.result_id, platform)
+            if not claimed:
+                responses.append(SocialPostService._stored_response(post))
+                continue
+            responses.append(await SocialPostService._publish(session, post, message, payload))
+        return responses
+
+    @staticmethod
+    async def _claim(
+        session: AsyncSession, key: str, digest: str, result_id: int, platform: str
+    ) -> tuple[SocialPost, bool]:
+        """Returns the post row for this key and whether this request should publish it."""
+        post = await SocialPostRepository.get(session, key, platform)
+        if post is None:
+            try:
+                post = await SocialPostRepository.create_pending(
+                    session, idempotency_key=key, request_digest=digest, result_id=result_id, platform=platform
+                )
+                # committed before calling the platform so concurrent duplicates see it
+                await session.commit()
+                return post, True
+            except IntegrityError:
+                await session.rollback()
+                post = await SocialPostRepository.get(session, key, platform)
+        if post.request_digest != digest:
+            # a concurrent request claimed the same key with other content
+            raise HTTPException(status_code=422, detail="Idempotency-Key was already used for a different request")
+        stale_before = datetime.now(timezone.utc) - PENDING_TIMEOUT
+        if post.status != "succeeded" and await SocialPostRepository.claim_retry(session, post.id, stale_before):
+            await session.commit()
+            await session.refresh(post)
+            return post, True
+        return post, False
+
+    @staticmethod
+    async def _publish(
+        session: AsyncSession, post: SocialPost, message: str, payload: SocialPostRequest
+    ) -> SocialPostResponse:
+        from .social_media import SocialMediaService
+
+        started = time.perf_counter()
+        try:
+            if post.platform == "facebook":
+                response = await SocialMediaService.post_to_facebook(message, payload.image_url)
+                external_id = response.get("id")
+            elif post.platform == "twitter":
+                response = await SocialMediaService.post_to_twitter(message)
+                external_id = response.get("data", {}).get("id")
+            elif post.platform == "instagram":
+                if not payload.image_url:
+                    raise ValueError("Instagram requires an image URL")
+                response = await SocialMediaService.post_to_instagram(message, payload.image_url)
+                external_id = response.get("id")
+            else:
+                response = await SocialMediaService.post_to_whatsapp(
+                    message,
+                    recipient=payload.whatsapp_recipient,
+                    image_url=payload.image_url,
+                    image_base64=payload.image_base64,
+                )
+                external_id = response.get("messages", [{}])[0].get("id")
+            outcome = SocialPostResponse(
+                platform=post.platform, success=True, message="Posted successfully", post_id=external_id
+            )
+        except Exception as e:
+            outcome = SocialPostResponse(platform=post.platform, success=False, message=str(e))
+
+        await SocialPostRepository.record_outcome(
+            session,
+            post.id,
+            status="succeeded" if outcome.success else "failed",
+            external_id=outcome.post_id,
+            message=outcome.message,
+            latency_ms=round((time.perf_counter() - started) * 1000),
+        )
+        await session.commit()
+        return outcome
+
+    @staticmethod
+    def _stored_response(post: SocialPost) -> SocialPostResponse:
+        if post.status == "pending":
+            return SocialPostResponse(
+                platform=post.platform, success=False, message="Post already in progress", replayed=True
+            )
+        return SocialPostResponse(
+            platform=post.platform,
+            success=post.status == "succeeded",
+            message=post.message or "",
+            post_id=post.post_id,
+            replayed=True,
+        )
+
+    @staticmethod
+    async def list_posts(session: AsyncSession, result_id: int) -> list[SocialPost]:
+        return await SocialPostRepository.list_for_result(session, result_id)
@@ -0,0 +1,206 @@
+"""Local stand-ins for the Graph API, the Telegram Bot API and an SMTP relay.
+
+They accept what ``SocialMediaService`` and ``EmailService`` send and answer
+like the real services. Latency, server errors and rate limiting (HTTP 429,
+SMTP 451) can be injected, so posting and notification throughput can be
+measured offline. Run from ``backend/``::
+
+    python -m benchmarks.fake_services --latency-ms 120 --error-rate 0.02 --throttle-rate 0.05
+
+and point the API at them::
+
+    GRAPH_API_BASE_URL=http://127.0.0.1:9001/v18.0
+    TELEGRAM_API_BASE_URL=http://127.0.0.1:9001
+    SMTP_HOST=127.0.0.1 SMTP_PORT=9025 SMTP_USE_TLS=false
+"""
+
+import argparse
+import asyncio
+import itertools
+import random
+from collections import Counter
+from dataclasses import dataclass, field
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+
+@dataclass
+class Faults:
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    retry_after: int = 1
+    seed: int | None = None
+    rng: random.Random = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.rng = random.Random(self.seed)
+
+    async def delay(self) -> None:
+        seconds = (self.latency_ms + self.rng.uniform(0, self.jitter_ms)) / 1000
+        if seconds > 0:
+            await asyncio.sleep(seconds)
+
+    def outcome(self) -> str:
+        """"throttle", "error" or "ok" for the next request."""
+        roll = self.rng.random()
+        if roll < self.throttle_rate:
+            return "throttle"
+        if roll < self.throttle_rate + self.error_rate:
+            return "error"
+        return "ok"
+
+
+def graph_app(faults: Faults) -> Starlette:
+    """Graph API (Facebook feed, Instagram media, WhatsApp messages) and Telegram sendMessage."""
+    ids = itertools.count(1)
+    counts: Counter = Counter()
+
+    async def handle(request: Request) -> JSONResponse:
+        endpoint = request.path_params["endpoint"]
+        await request.body()
+        await faults.delay()
+        outcome = faults.outcome()
+        counts[(endpoint, outcome)] += 1
+        if outcome == "throttle":
+            return JSONResponse(
+                {"error": {"message": "Application request limit reached", "code": 4}},
+                status_code=429,
+                headers={"Retry-After": str(faults.retry_after)},
+            )
+        if outcome == "error":
+            return JSONResponse({"error": {"message": "An unexpected error has occurred", "code": 2}}, status_code=500)
+        post_id = f"fake_{next(ids)}"
+        if endpoint == "messages":
+            return JSONResponse({"messaging_product": "whatsapp", "messages": [{"id": post_id}]})
+        if endpoint == "sendMessage":
+            return JSONResponse({"ok": True, "result": {"message_id": int(post_id[5:])}})
+        return JSONResponse({"id": post_id})
+
+    app = Starlette(
+        routes=[
+            Route("/{version}/{node}/{endpoint}", handle, methods=["POST"]),
+            Route("/{bot}/{endpoint}", handle, methods=["POST"]),
+        ]
+    )
+    app.state.counts = counts
+    return app
+
+
+class FakeSMTPServer:
+    """Just enough SMTP for smtplib: EHLO/HELO, MAIL, RCPT, DATA, RSET, NOOP, QUIT (no TLS, no AUTH)."""
+
+    def __init__(self, faults: Faults) -> None:
+        self.faults = faults
+        self.counts: Counter = Counter()
+        self.server: asyncio.AbstractServer | None = None
+
+    async def start(self, host: str, port: int) -> int:
+        self.server = await asyncio.start_server(self._session, host, port)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+
+    async def _session(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        async def reply(line: str) -> None:
+            writer.write(f"{line}\r\n".encode())
+            await writer.drain()
+
+        try:
+            await reply("220 fake-smtp ready")
+            while line := await reader.readline():
+                command = line.decode(errors="replace").strip().split(" ", 1)[0].upper()
+                if command == "EHLO":
+                    await reply("250-fake-smtp\r\n250 8BITMIME")
+                elif command == "QUIT":
+                    await reply("221 bye")
+                    break
+                elif command == "DATA":
+                    await reply("354 end data with <CR><LF>.<CR><LF>")
+                    while (await reader.readline()) not in (b".\r\n", b".\n", b""):
+                        pass
+                    await self.faults.delay()
+                    outcome = self.faults.outcome()
+                    self.counts[outcome] += 1
+                    if outcome == "throttle":
+                        await reply("451 4.7.1 rate limited, try again later")
+                    elif outcome == "error":
+                        await reply("554 5.3.0 transaction failed")
+                    else:
+                        await reply("250 2.0.0 queued")
+                elif command in ("HELO", "MAIL", "RCPT", "RSET", "NOOP"):
+                    await reply("250 ok")
+                else:
+                    await reply("502 command not implemented")
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+async def start_http(app: Starlette, host: str, port: int):
+    """Serves `app` with uvicorn inside the running loop; returns (server, task, port)."""
+    import uvicorn
+
+    server = uvicorn.Server(uvicorn.Config(app, host=host, port=port, log_level="warning", lifespan="off"))
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        if task.done():
+            task.result()
+        await asyncio.sleep(0.01)
+    bound_port = server.servers[0].sockets[0].getsockname()[1]
+    return server, task, bound_port
+
+
+def add_fault_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="added to every call")
+    parser.add_argument("--jitter-ms", type=float, default=50.0, help="uniform random extra latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of calls failing with 500 / 554")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="share of calls answered 429 / 451")
+    parser.add_argument("--seed", type=int, default=None)
+
+
+def faults_from_args(args) -> Faults:
+    return Faults(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        seed=args.seed,
+    )
+
+
+async def serve(args) -> None:
+    faults = faults_from_args(args)
+    app = graph_app(faults)
+    smtp = FakeSMTPServer(faults)
+    server, task, http_port = await start_http(app, args.host, args.http_port)
+    smtp_port = await smtp.start(args.host, args.smtp_port)
+    print(f"Graph/Telegram fake on http://{args.host}:{http_port} (Graph base URL: /v18.0)")
+    print(f"SMTP fake on {args.host}:{smtp_port}")
+    try:
+        await task
+    finally:
+        await smtp.close()
+        print("HTTP calls:", dict(app.state.counts))
+        print("SMTP messages:", dict(smtp.counts))
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Run local Graph API, Telegram and SMTP fakes")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--http-port", type=int, default=9001)
+    parser.add_argument("--smtp-port", type=int, default=9025)
+    add_fault_arguments(parser)
+    asyncio.run(serve(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+"""End-to-end fan-out benchmark for social posting and draw reminders.
+
+Starts the local fakes from ``benchmarks.fake_services``, points the API at
+them and measures:
+
+- ``social_post``: ``POST /api/social/post`` to several platforms per request,
+  each with a fresh ``Idempotency-Key``.
+- ``notifier``: draw reminder ticks; each round makes every game's draw due
+  and runs one notifier tick (query, digest email to all managers, update).
+
+Both report throughput and p50/p95/p99 latency. Per-platform outcomes and
+what the fakes received are printed too. Run from ``backend/``::
+
+    python -m benchmarks.fanout --latency-ms 120 --error-rate 0.02 --throttle-rate 0.05
+
+Like ``benchmarks.http_load`` it drops and recreates all tables of the target
+database.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import sys
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta
+from urllib.parse import urlparse
+
+from .fake_services import FakeSMTPServer, add_fault_arguments, faults_from_args, graph_app, start_http
+from .http_load import SAFE_HOSTS, drive, percentile, print_table
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default="sqlite+aiosqlite:///./bench.db")
+    parser.add_argument("--posts", type=int, default=200, help="social post requests")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--platforms", default="facebook,instagram,whatsapp")
+    parser.add_argument("--digests", type=int, default=50, help="notifier rounds")
+    parser.add_argument("--managers", type=int, default=25, help="reminder recipients")
+    parser.add_argument("--games", type=int, default=26)
+    parser.add_argument("--scenarios", default="social_post,notifier")
+    parser.add_argument("--output", default="", help="write the run as JSON")
+    parser.add_argument("--force", action="store_true", help="allow resetting a non-local database")
+    add_fault_arguments(parser)
+    return parser.parse_args(argv)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def configure_environment(args, http_port: int, smtp_port: int) -> None:
+    # must be set before the app (and its settings) are imported
+    os.environ.update(
+        {
+            "DATABASE_URL": args.database_url,
+            "GRAPH_API_BASE_URL": f"http://127.0.0.1:{http_port}/v18.0",
+            "TELEGRAM_API_BASE_URL": f"http://127.0.0.1:{http_port}",
+            "FACEBOOK_PAGE_ID": "bench-page",
+            "FACEBOOK_ACCESS_TOKEN": "bench",
+            "INSTAGRAM_ACCOUNT_ID": "bench-ig",
+            "INSTAGRAM_ACCESS_TOKEN": "bench",
+            "WHATSAPP_PHONE_NUMBER_ID": "bench-wa",
+            "WHATSAPP_ACCESS_TOKEN": "bench",
+            "SMTP_HOST": "127.0.0.1",
+            "SMTP_PORT": str(smtp_port),
+            "SMTP_USE_TLS": "false",
+            "SMTP_USE_SSL": "false",
+            "SMTP_USERNAME": "",
+            "SMTP_FROM_ADDRESS": "reminders@rand.test",
+        }
+    )
+    os.environ.setdefault("QUERY_BUDGET_PER_REQUEST", "0")
+
+
+async def social_post(client, result_ids: list[int], platforms: list[str], args) -> tuple[dict, Counter]:
+    outcomes: Counter = Counter()
+    sequence = iter(range(sys.maxsize))
+
+    async def send():
+        result_id = result_ids[next(sequence) % len(result_ids)]
+        response = await client.post(
+            "/api/social/post",
+            json={"result_id": result_id, "platforms": platforms, "image_url": "https://rand.test/card.png"},
+            headers={"Idempotency-Key": uuid.uuid4().hex},
+        )
+        if response.status_code == 200:
+            for item in response.json():
+                outcomes[(item["platform"], "ok" if item["success"] else "failed")] += 1
+        else:
+            outcomes[("request", str(response.status_code))] += 1
+        return response
+
+    return await drive(send, args.posts, args.concurrency), outcomes
+
+
+async def notifier(engine, game_ids: list[int], args) -> dict:
+    from sqlalchemy import insert
+
+    from app.models import Draw, Manager
+    from app.services.draw_notifier import _notify_due_draws_once
+
+    async with engine.begin() as conn:
+        await conn.execute(
+            insert(Manager),
+            [
+                {"email": f"manager{index}@rand.test", "hashed_password": "x", "is_active": True}
+                for index in range(args.managers)
+            ],
+        )
+
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(args.digests):
+        async with engine.begin() as conn:
+            due = datetime.utcnow() - timedelta(seconds=1)
+            await conn.execute(
+                insert(Draw), [{"game_id": game_id, "draw_datetime": due, "notified": False} for game_id in game_ids]
+            )
+        tick_started = time.perf_counter()
+        await _notify_due_draws_once()
+        latencies.append(time.perf_counter() - tick_started)
+    wall = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": 0,
+        "throughput_rps": round(len(latencies) / wall, 2) if wall else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "max_ms": round(latencies[-1] * 1000, 3) if latencies else 0.0,
+    }
+
+
+async def run(args, http_port: int, smtp_port: int) -> int:
+    import httpx
+
+    from app.core.http import close_http_client
+    from app.db.session import engine
+    from app.main import app
+    from .seed import Volumes, reset_and_seed
+
+    seeded = await reset_and_seed(engine, Volumes(games=args.games, draws_per_game=4), seed=1)
+    game_ids = list(range(1, args.games + 1))
+
+    faults = faults_from_args(args)
+    fake_http = graph_app(faults)
+    server, server_task, _ = await start_http(fake_http, "127.0.0.1", http_port)
+    smtp = FakeSMTPServer(faults)
+    await smtp.start("127.0.0.1", smtp_port)
+
+    selected = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    results, outcomes = {}, Counter()
+    try:
+        if "social_post" in selected:
+            platforms = [name.strip() for name in args.platforms.split(",") if name.strip()]
+            async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=60
+            ) as client:
+                results["social_post"], outcomes = await social_post(client, seeded["result_ids"], platforms, args)
+        if "notifier" in selected:
+            results["notifier"] = await notifier(engine, game_ids, args)
+    finally:
+        await close_http_client()
+        server.should_exit = True
+        await server_task
+        await smtp.close()
+        await engine.dispose()
+
+    run_info = {
+        "config": {
+            "dialect": engine.dialect.name,
+            "posts": args.posts,
+            "concurrency": args.concurrency,
+            "platforms": args.platforms,
+            "digests": args.digests,
+            "managers": args.managers,
+            "games": args.games,
+            "faults": {
+                "latency_ms": faults.latency_ms,
+                "jitter_ms": faults.jitter_ms,
+                "error_rate": faults.error_rate,
+                "throttle_rate": faults.throttle_rate,
+            },
+        },
+        "scenarios": results,
+        "platform_outcomes": {f"{platform}:{outcome}": count for (platform, outcome), count in sorted(outcomes.items())},
+        "fake_http_calls": {f"{endpoint}:{outcome}": count for (endpoint, outcome), count in sorted(fake_http.state.counts.items())},
+        "fake_smtp_messages": dict(smtp.counts),
+    }
+    print_table(run_info, None)
+    for key in ("platform_outcomes", "fake_http_calls", "fake_smtp_messages"):
+        print(f"{key}: {run_info[key]}")
+    if args.output:
+        with open(args.output, "w") as handle:
+            json.dump(run_info, handle, indent=2)
+            handle.write("\n")
+    return 0
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    if not args.database_url.startswith("sqlite") and not args.force:
+        host = urlparse(args.database_url).hostname or ""
+        if host not in SAFE_HOSTS:
+            print(f"refusing to reset tables on non-local host {host!r}; pass --force", file=sys.stderr)
+            return 2
+    http_port, smtp_port = _free_port(), _free_port()
+    configure_environment(args, http_port, smtp_port)
+    return asyncio.run(run(args, http_port, smtp_port))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
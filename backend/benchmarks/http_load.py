@@ -0,0 +1,240 @@
+"""HTTP load benchmark for the Rand Lottery API.
+
+Seeds a scratch database, drives each endpoint with concurrent requests and
+reports throughput and p50/p95/p99 latency. Run from ``backend/``::
+
+    python -m benchmarks.http_load
+    python -m benchmarks.http_load --save-baseline benchmarks/baseline.json
+    python -m benchmarks.http_load --compare benchmarks/baseline.json
+
+By default the app runs in-process (httpx ASGI transport, no network) against
+SQLite, so numbers are comparable between runs on the same machine. Point
+``--database-url`` at a local Postgres for production-like numbers, and
+``--base-url`` at a running server to include the HTTP server in the path.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import sys
+import time
+from urllib.parse import urlparse
+
+SAFE_HOSTS = {"localhost", "127.0.0.1", "::1", "postgres", ""}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default="sqlite+aiosqlite:///./bench.db")
+    parser.add_argument("--base-url", default="", help="benchmark a running server instead of in-process")
+    parser.add_argument("--requests", type=int, default=200, help="requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--warmup", type=int, default=20, help="unmeasured requests per scenario")
+    parser.add_argument("--scenarios", default="", help="comma-separated subset of scenario names")
+    parser.add_argument("--games", type=int, default=26)
+    parser.add_argument("--draws-per-game", type=int, default=40)
+    parser.add_argument("--results-per-draw", type=int, default=1)
+    parser.add_argument("--approvals-per-result", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", default="", help="write the run as JSON")
+    parser.add_argument("--save-baseline", default="", help="write the run as the new baseline")
+    parser.add_argument("--compare", default="", help="baseline JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative regression")
+    parser.add_argument("--force", action="store_true", help="allow resetting a non-local database")
+    return parser.parse_args(argv)
+
+
+def percentile(ordered: list[float], pct: float) -> float:
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+async def drive(send, total: int, concurrency: int) -> dict:
+    latencies: list[float] = []
+    errors = 0
+    remaining = total
+
+    async def worker():
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            try:
+                response = await send()
+                failed = response.status_code >= 400
+            except Exception:
+                failed = True
+            latencies.append(time.perf_counter() - started)
+            errors += failed
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / wall, 2) if wall else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "max_ms": round(latencies[-1] * 1000, 3) if latencies else 0.0,
+    }
+
+
+def build_scenarios(client, seeded: dict, token: str, rng: random.Random) -> dict:
+    auth = {"Authorization": f"Bearer {token}"}
+    draw_ids = seeded["draw_ids"]
+    result_ids = seeded["result_ids"]
+
+    def submit_result():
+        numbers = rng.sample(range(1, 91), 10)
+        return client.post(
+            "/api/results/",
+            json={"draw_id": rng.choice(draw_ids), "winning_numbers": numbers[:5], "machine_numbers": numbers[5:]},
+            headers=auth,
+        )
+
+    def verify_result():
+        return client.patch(
+            f"/api/results/{rng.choice(result_ids)}/verify",
+            json={"decision": "approved", "note": "bench"},
+            headers=auth,
+        )
+
+    return {
+        "health": lambda: client.get("/health"),
+        "list_games": lambda: client.get("/api/games/"),
+        "list_draws": lambda: client.get("/api/draws/"),
+        "list_results": lambda: client.get("/api/results/"),
+        "create_result": submit_result,
+        "verify_result": verify_result,
+    }
+
+
+def compare(run: dict, baseline: dict, tolerance: float) -> list[str]:
+    regressions = []
+    if run["config"] != baseline.get("config"):
+        print("warning: benchmark configuration differs from the baseline", file=sys.stderr)
+    for name, current in run["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(name)
+        if not previous:
+            continue
+        if current["throughput_rps"] < previous["throughput_rps"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: throughput {current['throughput_rps']} rps < baseline {previous['throughput_rps']} rps"
+            )
+        if current["p95_ms"] > previous["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {current['p95_ms']} ms > baseline {previous['p95_ms']} ms")
+        if current["errors"] > previous["errors"]:
+            regressions.append(f"{name}: {current['errors']} errors (baseline {previous['errors']})")
+    return regressions
+
+
+def print_table(run: dict, baseline: dict | None) -> None:
+    header = f"{'scenario':<16}{'rps':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}"
+    if baseline:
+        header += f"{'Δ rps':>9}{'Δ p95':>9}"
+    print(header)
+    for name, stats in run["scenarios"].items():
+        line = (
+            f"{name:<16}{stats['throughput_rps']:>10}{stats['p50_ms']:>10}"
+            f"{stats['p95_ms']:>10}{stats['p99_ms']:>10}{stats['errors']:>8}"
+        )
+        previous = (baseline or {}).get("scenarios", {}).get(name)
+        if previous:
+            rps_delta = stats["throughput_rps"] / previous["throughput_rps"] - 1 if previous["throughput_rps"] else 0
+            p95_delta = stats["p95_ms"] / previous["p95_ms"] - 1 if previous["p95_ms"] else 0
+            line += f"{rps_delta:>+9.0%}{p95_delta:>+9.0%}"
+        print(line)
+
+
+async def run(args) -> int:
+    import httpx
+
+    from app.db.session import engine
+    from app.services.auth import AuthService
+    from .seed import Volumes, reset_and_seed
+
+    volumes = Volumes(
+        games=args.games,
+        draws_per_game=args.draws_per_game,
+        results_per_draw=args.results_per_draw,
+        approvals_per_result=args.approvals_per_result,
+    )
+    seed_started = time.perf_counter()
+    seeded = await reset_and_seed(engine, volumes, seed=args.seed)
+    print(f"seeded {seeded['rows']} in {time.perf_counter() - seed_started:.2f}s", file=sys.stderr)
+    token = AuthService.create_access_token({"sub": str(seeded["manager_id"]), "email": "bench@rand.test"})
+
+    if args.base_url:
+        client = httpx.AsyncClient(base_url=args.base_url, timeout=30)
+    else:
+        from app.main import app
+
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=30)
+
+    rng = random.Random(args.seed)
+    scenarios = build_scenarios(client, seeded, token, rng)
+    selected = [name.strip() for name in args.scenarios.split(",") if name.strip()] or list(scenarios)
+
+    results = {}
+    async with client:
+        for name in selected:
+            send = scenarios[name]
+            if args.warmup:
+                await drive(send, args.warmup, min(args.concurrency, args.warmup))
+            results[name] = await drive(send, args.requests, args.concurrency)
+    await engine.dispose()
+
+    run_info = {
+        "config": {
+            "dialect": engine.dialect.name,
+            "target": "server" if args.base_url else "in-process",
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "volumes": seeded["rows"],
+        },
+        "environment": {"python": platform.python_version(), "machine": platform.machine()},
+        "scenarios": results,
+    }
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as handle:
+            baseline = json.load(handle)
+    print_table(run_info, baseline)
+
+    for path in filter(None, (args.output, args.save_baseline)):
+        with open(path, "w") as handle:
+            json.dump(run_info, handle, indent=2)
+            handle.write("\n")
+
+    if baseline:
+        regressions = compare(run_info, baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    if not args.database_url.startswith("sqlite") and not args.force:
+        host = urlparse(args.database_url).hostname or ""
+        if host not in SAFE_HOSTS:
+            print(f"refusing to reset tables on non-local host {host!r}; pass --force", file=sys.stderr)
+            return 2
+    # must be set before the app (and its settings) are imported
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault("QUERY_BUDGET_PER_REQUEST", "0")
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""Deterministic benchmark dataset: games, draws, results and approvals."""
+
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.models import Base, Game, Draw, Result, Manager, ResultApproval
+from app.seed_games import GAMES
+from app.services.auth import AuthService
+
+
+@dataclass
+class Volumes:
+    games: int = 26
+    draws_per_game: int = 40
+    results_per_draw: int = 1
+    approvals_per_result: int = 1
+
+
+def random_numbers(rng: random.Random) -> tuple[str, str]:
+    picked = rng.sample(range(1, 91), 10)
+    return ",".join(map(str, picked[:5])), ",".join(map(str, picked[5:]))
+
+
+async def reset_and_seed(engine: AsyncEngine, volumes: Volumes, seed: int = 1) -> dict:
+    """Drop and recreate all tables, then insert the requested volumes.
+
+    Returns ids the load scenarios need (manager id, draw ids, result ids).
+    """
+    rng = random.Random(seed)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+        await conn.execute(
+            insert(Manager),
+            [{"id": 1, "email": "bench@rand.test", "hashed_password": AuthService.get_password_hash("benchmark")}],
+        )
+        names = [name for name, _ in GAMES]
+        game_rows = []
+        for index in range(volumes.games):
+            name = names[index] if index < len(names) else f"BENCH GAME {index + 1}"
+            game_rows.append({"id": index + 1, "name": name, "description": "benchmark"})
+        await conn.execute(insert(Game), game_rows)
+
+        start = datetime(2024, 1, 1, 10, 0)
+        draw_rows, result_rows, approval_rows = [], [], []
+        for game in game_rows:
+            for week in range(volumes.draws_per_game):
+                draw_id = len(draw_rows) + 1
+                draw_at = start + timedelta(days=7 * week, minutes=game["id"])
+                draw_rows.append(
+                    {
+                        "id": draw_id,
+                        "game_id": game["id"],
+                        "draw_datetime": draw_at,
+                        "notified": True,
+                    }
+                )
+                for _ in range(volumes.results_per_draw):
+                    result_id = len(result_rows) + 1
+                    winning, machine = random_numbers(rng)
+                    approved = volumes.approvals_per_result > 0
+                    result_rows.append(
+                        {
+                            "id": result_id,
+                            "draw_id": draw_id,
+                            "draw_datetime": draw_at,
+                            "winning_numbers": winning,
+                            "machine_numbers": machine,
+                            "share_copy": f"{game['name']} results: {winning}",
+                            "share_hashtags": "RandLottery",
+                            "share_targets": "facebook,whatsapp",
+                            "status": "approved" if approved else "pending_review",
+                            "verified": approved,
+                            "submitted_by_id": 1,
+                        }
+                    )
+                    for _ in range(volumes.approvals_per_result):
+                        approval_rows.append(
+                            {
+                                "result_id": result_id,
+                                "draw_datetime": draw_at,
+                                "manager_id": 1,
+                                "decision": "approved",
+                                "note": None,
+                            }
+                        )
+        for table, rows in ((Draw, draw_rows), (Result, result_rows), (ResultApproval, approval_rows)):
+            for offset in range(0, len(rows), 1000):
+                await conn.execute(insert(table), rows[offset : offset + 1000])
+
+    if engine.dialect.name == "postgresql":
+        # explicit ids above leave the sequences behind
+        async with engine.begin() as conn:
+            for table in ("managers", "games", "draws", "results", "result_approvals"):
+                await conn.exec_driver_sql(
+                    f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), COALESCE(MAX(id), 1)) FROM {table}"
+                )
+
+    return {
+        "manager_id": 1,
+        "draw_ids": [row["id"] for row in draw_rows],
+        "result_ids": [row["id"] for row in result_rows],
+        "rows": {
+            "games": len(game_rows),
+            "draws": len(draw_rows),
+            "results": len(result_rows),
+            "approvals": len(approval_rows),
+        },
+    }
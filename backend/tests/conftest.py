@@ -0,0 +1,4 @@
+import os
+
+# app.core.config requires a database URL; these tests never connect
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite://")
@@ -0,0 +1,176 @@
+import asyncio
+
+from app.core.config import settings
+from app.middleware import load_shedding
+from app.middleware.load_shedding import ConcurrencyLimiter, pool_limits, route_class
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_admits_up_to_limit_then_sheds_after_max_wait():
+    async def scenario():
+        limiter = ConcurrencyLimiter("test", 2, max_wait=0.05)
+        assert await limiter.acquire()
+        assert await limiter.acquire()
+        assert not await limiter.acquire()
+        assert limiter.active == 2
+        assert limiter.waiting == 0
+
+    run(scenario())
+
+
+def test_zero_wait_sheds_without_queueing():
+    async def scenario():
+        limiter = ConcurrencyLimiter("test", 1, max_wait=0)
+        assert await limiter.acquire()
+        assert not await limiter.acquire()
+        assert limiter.waiting == 0
+
+    run(scenario())
+
+
+def test_full_queue_sheds_immediately():
+    async def scenario():
+        limiter = ConcurrencyLimiter("test", 1, max_wait=5)
+        assert await limiter.acquire()
+        queued = [asyncio.create_task(limiter.acquire()) for _ in range(load_shedding.MAX_WAITERS_PER_SLOT)]
+        await asyncio.sleep(0)
+        assert limiter.waiting == load_shedding.MAX_WAITERS_PER_SLOT
+        assert not await asyncio.wait_for(limiter.acquire(), timeout=0.1)
+        for task in queued:
+            task.cancel()
+        await asyncio.gather(*queued, return_exceptions=True)
+        assert limiter.waiting == 0
+        assert limiter.active == 1
+
+    run(scenario())
+
+
+def test_release_wakes_waiters_in_order():
+    async def scenario():
+        limiter = ConcurrencyLimiter("test", 1, max_wait=1)
+        assert await limiter.acquire()
+        first = asyncio.create_task(limiter.acquire())
+        second = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        limiter.release()
+        assert await first
+        assert not second.done()
+        assert limiter.active == 1
+        limiter.release()
+        assert await second
+        limiter.release()
+        assert limiter.active == 0
+
+    run(scenario())
+
+
+def test_cancelled_waiter_leaves_queue_without_taking_a_slot():
+    async def scenario():
+        limiter = ConcurrencyLimiter("test", 1, max_wait=1)
+        assert await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        assert limiter.waiting == 0
+        limiter.release()
+        assert limiter.active == 0
+
+    run(scenario())
+
+
+def test_waiter_cancelled_after_wake_gives_its_slot_back():
+    async def scenario():
+        limiter = ConcurrencyLimiter("test", 1, max_wait=1)
+        assert await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        # woken, but cancelled before it resumes
+        limiter.release()
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        assert limiter.active == 0
+        assert await limiter.acquire()
+
+    run(scenario())
+
+
+def test_weighted_request_holds_several_slots():
+    async def scenario():
+        limiter = ConcurrencyLimiter("test", 4, max_wait=1)
+        assert await limiter.acquire()
+        heavy = asyncio.create_task(limiter.acquire(4))
+        await asyncio.sleep(0)
+        light = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        # the heavy request queued first, so the light one does not overtake it
+        assert not heavy.done() and not light.done()
+        limiter.release()
+        assert await heavy
+        assert limiter.active == 4
+        assert not light.done()
+        limiter.release(weight=4)
+        assert await light
+        assert limiter.active == 1
+
+    run(scenario())
+
+
+def test_request_heavier_than_limit_runs_alone():
+    async def scenario():
+        limiter = ConcurrencyLimiter("test", 2, max_wait=1)
+        assert await limiter.acquire(4)
+        assert limiter.active == 4
+        limiter.release(weight=4)
+        assert limiter.active == 0
+
+    run(scenario())
+
+
+def test_abandoned_heavy_waiter_unblocks_lighter_ones():
+    async def scenario():
+        limiter = ConcurrencyLimiter("test", 2, max_wait=1)
+        assert await limiter.acquire()
+        heavy = asyncio.create_task(limiter.acquire(2))
+        await asyncio.sleep(0)
+        light = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        heavy.cancel()
+        await asyncio.gather(heavy, return_exceptions=True)
+        assert await light
+        assert limiter.active == 2
+
+    run(scenario())
+
+
+def test_snapshots_and_health_are_not_limited():
+    assert route_class("GET", "/api/snapshots/latest.json") is None
+    assert route_class("GET", "/ready") is None
+    assert route_class("GET", "/api/bootstrap") == "read"
+
+
+def test_read_limit_shrinks_while_slow_and_recovers():
+    limiter = ConcurrencyLimiter("test", 10, max_wait=0, target_latency=0.5)
+    limiter._adjusted_at -= load_shedding.ADJUST_INTERVAL_SECONDS
+    limiter._record(2.0)
+    assert limiter.slots == 8
+    for _ in range(20):
+        limiter._adjusted_at -= load_shedding.ADJUST_INTERVAL_SECONDS
+        limiter._record(5.0)
+    assert limiter.slots == limiter.min_limit == 1
+    for _ in range(40):
+        limiter._adjusted_at -= load_shedding.ADJUST_INTERVAL_SECONDS
+        limiter._record(0.01)
+    assert limiter.slots == 10
+
+
+def test_default_limits_fit_the_pool(monkeypatch):
+    monkeypatch.setattr(settings, "db_pool_size", 5)
+    monkeypatch.setattr(settings, "db_max_overflow", 10)
+    monkeypatch.setattr(settings, "database_read_url", "")
+    assert pool_limits() == (10, 5)
+    monkeypatch.setattr(settings, "database_read_url", "postgresql+asyncpg://replica/db")
+    assert pool_limits() == (15, 5)
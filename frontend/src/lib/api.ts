@@ -2,6 +2,10 @@ import { getStoredToken } from "@/contexts/AuthContext";
 
 const API_BASE = import.meta.env.VITE_API_URL || "/api";
 
+// Set by write responses when the API reads from a replica; echoed so our own writes are visible
+const PRIMARY_PIN_HEADER = "X-Primary-Until";
+let primaryUntil: string | null = null;
+
 type HttpMethod = "GET" | "POST" | "PATCH";
 
 async function request<T>(path: string, options?: { method?: HttpMethod; body?: unknown }): Promise<T> {
@@ -17,11 +21,16 @@ async function request<T>(path: string, options?: { method?: HttpMethod; body?:
     }
   }
 
+  if (primaryUntil && Number(primaryUntil) * 1000 > Date.now()) {
+    headers[PRIMARY_PIN_HEADER] = primaryUntil;
+  }
+
   const res = await fetch(`${API_BASE}${path}`, {
     method: options?.method || "GET",
     headers,
     body: options?.body ? JSON.stringify(options.body) : undefined,
   });
+  primaryUntil = res.headers.get(PRIMARY_PIN_HEADER) ?? primaryUntil;
 
   if (!res.ok) {
     const text = await res.text();